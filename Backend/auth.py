@@ -7,33 +7,12 @@ from utils.config import settings  # Assumes settings loads SECRET_KEY
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")  # Adjust to your login endpoint
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> Dict[str, str]:
+def decode_token(token: str) -> Dict[str, str]:
     """
-    Extract user metadata from JWT token.
+    Decode a JWT, raising 401 if it is expired or invalid.
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-        user_role: str = payload.get("user_role")
-        company_id: str = payload.get("company_id")
-        plant_id: str = payload.get("plant_id")
-        financial_year: str = payload.get("financial_year")
-        user_id: str = payload.get("user_id")
-        
-        if not all([financial_year, user_role, company_id, plant_id]):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token: missing required fields",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        print(f"user_role={user_role}, company_id={company_id}, plant_id={plant_id}, financial_year={financial_year}")
-        return {
-            "user_role": user_role,
-            "company_id": company_id,
-            "plant_id": plant_id,
-            "financial_year": financial_year,
-            "user_id": user_id
-        }
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -47,6 +26,77 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> Dict[str, str
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> Dict[str, str]:
+    """
+    Extract user metadata from JWT token.
+    """
+    payload = decode_token(token)
+    user_role: str = payload.get("user_role")
+    company_id: str = payload.get("company_id")
+    plant_id: str = payload.get("plant_id")
+    financial_year: str = payload.get("financial_year")
+    user_id: str = payload.get("user_id")
+    
+    if not all([financial_year, user_role, company_id, plant_id]):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token: missing required fields",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    print(f"user_role={user_role}, company_id={company_id}, plant_id={plant_id}, financial_year={financial_year}")
+    return {
+        "user_role": user_role,
+        "company_id": company_id,
+        "plant_id": plant_id,
+        "financial_year": financial_year,
+        "user_id": user_id
+    }
+
+async def get_current_company_user(token: str = Depends(oauth2_scheme)) -> Dict[str, str]:
+    """
+    Extract user metadata from JWT token for company-level endpoints; plant_id may be None,
+    as it is for company admins.
+    """
+    payload = decode_token(token)
+    if not all([payload.get("user_role"), payload.get("company_id"), payload.get("user_id")]):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token: missing required fields",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return {
+        "user_role": payload["user_role"],
+        "company_id": payload["company_id"],
+        "plant_id": payload.get("plant_id"),
+        "financial_year": payload.get("financial_year"),
+        "user_id": payload["user_id"]
+    }
+
+async def require_company_level_admin(current_user: Dict[str, str] = Depends(get_current_company_user)) -> Dict[str, str]:
+    """
+    Ensure the user is a company admin: admin role and no plant scope.
+    """
+    if "admin" not in current_user.get("user_role", []) or current_user.get("plant_id") is not None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only company admins can access this resource"
+        )
+    return current_user
+
+async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> str:
+    """
+    Extract only the user ID from JWT token; company admins and plant users alike have one.
+    """
+    user_id = decode_token(token).get("user_id")
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token: missing user_id",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user_id
+
 async def require_company_admin(current_user: Dict[str, str] = Depends(get_current_user)) -> Dict[str, str]:
     """
     Ensure the user has the admin role.
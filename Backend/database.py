@@ -1,7 +1,12 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+import asyncio
+from typing import Dict, List, Optional
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import IndexModel
 from utils.config import settings
 import logging
 
+logger = logging.getLogger(__name__)
+
 # MongoDB connection
 client = AsyncIOMotorClient(settings.MONGO_URI)
 db = client["esg_database"]
@@ -23,41 +28,222 @@ roles_collection = db["roles"]
 reports_collection = db["reports"]
 plants_employees_collection = db["plants_employees"]
 modules_collection = db["modules"]
+# Normalized module storage (MODULE_STORAGE_MODE=normalized): one document per node, keyed by parent ID
+module_submodules_collection = db["module_submodules"]
+module_categories_collection = db["module_categories"]
+module_questions_collection = db["module_questions"]
 
 new_reports_collection = db["new_report"]
 
 new_reports_collection = db["new_report"]
 audit_collection = db["audit_collection"]
+# One document per audited action; audit_collection only holds legacy embedded logs
+audit_events_collection = db["audit_events"]
 landing_flow_questions_collection = db["landing_flow_questions"]
 landing_flow_responses_collection = db["landing_flow_responses"]
 
 notfications_collection = db["notifications"]
+# One document per (recipient, notification); notfications_collection only holds legacy embedded arrays
+notification_inbox_collection = db["notification_inbox"]
 
-async def init_db():
+# Normalized email -> plant account lookup used by login
+credentials_collection = db["credentials"]
+
+# Shared version counters used to invalidate per-process caches across workers
+cache_versions_collection = db["cache_versions"]
+
+# Gemini SSE sessions shared across workers, expired by a TTL index
+stream_sessions_collection = db["stream_sessions"]
+
+# Shared tier of the Gemini response cache, keyed by a hash of model and prompt
+gemini_responses_collection = db["gemini_responses"]
+
+# /api/messages chat history, one document per exchange
+chat_messages_collection = db["chat_messages"]
+
+# Data migrations already applied by scripts/migrate.py
+schema_migrations_collection = db["schema_migrations"]
+
+# Plant/year key shared by most per-plant documents
+PLANT_YEAR_KEY = [("company_id", 1), ("plant_id", 1), ("financial_year", 1)]
+
+# Declarative index plan: every hot query shape in services/ must be served by one of these.
+# init_db creates missing indexes and reports extras; it never drops anything.
+INDEX_PLAN: Dict[str, List[IndexModel]] = {
+    # Unique plant/year keys (required for safe upserts)
+    reports_collection.name: [IndexModel(PLANT_YEAR_KEY, unique=True)],
+    new_reports_collection.name: [IndexModel(PLANT_YEAR_KEY, unique=True)],
+    landing_flow_responses_collection.name: [IndexModel(PLANT_YEAR_KEY, unique=True)],
+    plants_employees_collection.name: [
+        IndexModel(PLANT_YEAR_KEY),
+        # Login fallback while the credentials collection is still being backfilled
+        IndexModel([("plant_manager.contact_email", 1)]),
+        IndexModel([("employees.email", 1)])
+    ],
+    role_access_collection.name: [IndexModel(PLANT_YEAR_KEY)],
+    
+    company_collection.name: [IndexModel([("company_id", 1)])],
+    # plant_id first so the plant_id-only existence check in create_plant is covered too
+    plants_collection.name: [IndexModel([("plant_id", 1), ("company_id", 1)])],
+    auth_users_collection.name: [IndexModel([("email", 1)])],
+    modules_collection.name: [
+        IndexModel([("id", 1)]),
+        IndexModel(PLANT_YEAR_KEY + [("module_name", 1)])
+    ],
+    module_submodules_collection.name: [
+        IndexModel([("id", 1)], unique=True),
+        IndexModel([("module_id", 1), ("position", 1)])
+    ],
+    module_categories_collection.name: [
+        IndexModel([("id", 1)], unique=True),
+        IndexModel([("module_id", 1), ("submodule_id", 1), ("position", 1)])
+    ],
+    module_questions_collection.name: [
+        IndexModel([("category_id", 1), ("question_id", 1)], unique=True),
+        IndexModel([("module_id", 1), ("submodule_id", 1), ("category_id", 1), ("position", 1)])
+    ],
+    # Catalogue questions are looked up by id and paged per module/category in catalogue order
+    landing_flow_questions_collection.name: [
+        # Catalogue sync upserts by question_id; migration 0006 dedupes before this is built
+        IndexModel([("question_id", 1)], unique=True),
+        IndexModel([("module_id", 1), ("position", 1)]),
+        IndexModel([("category_id", 1), ("position", 1)])
+    ],
+    
+    # Indexes for the login credential lookup
+    credentials_collection.name: [
+        IndexModel([("email", 1), ("financial_year", -1)]),
+        IndexModel(PLANT_YEAR_KEY + [("account_type", 1), ("user_id", 1)], unique=True)
+    ],
+    
+    # Audit events are read newest-first per plant and financial year
+    audit_events_collection.name: [
+        IndexModel(PLANT_YEAR_KEY + [("performed_at", -1), ("_id", -1)]),
+        IndexModel([("legacy_ref", 1)], sparse=True)
+    ],
+    
+    # Notification inboxes are read newest-first per recipient; unread counts only touch unread entries
+    notification_inbox_collection.name: [
+        IndexModel([("recipient_id", 1), ("company_id", 1), ("plant_id", 1), ("timestamp", -1), ("_id", -1)]),
+        IndexModel(
+            [("recipient_id", 1), ("company_id", 1), ("plant_id", 1)],
+            partialFilterExpression={"read": False},
+            name="unread_by_recipient"
+        ),
+        IndexModel([("legacy_ref", 1)], sparse=True)
+    ],
+    
+    # Legacy embedded documents, still looked up by plant until migrated
+    audit_collection.name: [IndexModel(PLANT_YEAR_KEY)],
+    notfications_collection.name: [IndexModel([("company_id", 1), ("plant_id", 1)])],
+    
+    # Stream sessions and cached responses are removed by MongoDB once expires_at passes
+    stream_sessions_collection.name: [IndexModel([("expires_at", 1)], expireAfterSeconds=0)],
+    gemini_responses_collection.name: [IndexModel([("expires_at", 1)], expireAfterSeconds=0)],
+    
+    # Chat history is paged newest-first per user conversation
+    chat_messages_collection.name: [
+        IndexModel([("user_id", 1), ("conversation_id", 1), ("timestamp", -1), ("_id", -1)])
+    ]
+}
+
+# Index options that change what an index enforces or keeps; compared along with the key
+INDEX_OPTIONS = ("unique", "sparse", "partialFilterExpression", "expireAfterSeconds")
+
+def index_signature(spec: Dict) -> tuple:
+    """Key and enforcement options of an IndexModel document or an index_information() entry."""
+    key = spec["key"].items() if isinstance(spec["key"], dict) else spec["key"]
+    return (
+        # index_information() may report directions as floats
+        tuple((field, int(value) if isinstance(value, (int, float)) else value) for field, value in key),
+        bool(spec.get("unique", False)),
+        bool(spec.get("sparse", False)),
+        spec.get("partialFilterExpression"),
+        spec.get("expireAfterSeconds"),
+    )
+
+async def reconcile_collection_indexes(
+    collection: AsyncIOMotorCollection,
+    indexes: List[IndexModel],
+    create: bool = True,
+    rebuild: bool = False
+) -> Dict[str, List[str]]:
+    existing = await collection.index_information()
+    planned = {index.document["name"]: index for index in indexes}
+    missing = [name for name in planned if name not in existing]
+    changed = [
+        name for name in planned
+        if name in existing and index_signature(existing[name]) != index_signature(planned[name].document)
+    ]
+    extra = sorted(set(existing) - set(planned) - {"_id_"})
+    to_create = list(missing)
+    if changed and rebuild and create:
+        for name in changed:
+            await collection.drop_index(name)
+        to_create += changed
+    if to_create and create:
+        await collection.create_indexes([planned[name] for name in to_create])
+    return {"missing": missing, "changed": changed, "extra": extra}
+
+async def reconcile_indexes(create: bool = True, rebuild: bool = False) -> Dict[str, Dict[str, List[str]]]:
     """
-    Initialize the database with necessary indexes and migrate existing data.
+    Bring every collection in INDEX_PLAN up to the plan, one collection per concurrent task.
+
+    Args:
+        create: Create missing indexes; when False, only report the differences.
+        rebuild: Drop and recreate indexes whose key or options (unique, sparse,
+            partialFilterExpression, expireAfterSeconds) differ from the plan. Off by
+            default, since a rebuild can fail on existing data and leaves the collection
+            without the index meanwhile.
+
+    Returns:
+        Per collection, the planned indexes that were missing (now created), the planned
+        indexes whose definition differs from MongoDB's (rebuilt only with `rebuild`), and
+        the indexes present in MongoDB but not in the plan (left in place).
     """
-    # Create unique index for reports_collection
-    await reports_collection.create_index(
-        [("company_id", 1), ("plant_id", 1), ("financial_year", 1)],
-        unique=True
+    names = list(INDEX_PLAN)
+    results = await asyncio.gather(
+        *[reconcile_collection_indexes(db[name], INDEX_PLAN[name], create, rebuild) for name in names],
+        return_exceptions=True
     )
-    
-    # Create unique index for landing_flow_responses_collection
-    await landing_flow_responses_collection.create_index(
-        [("company_id", 1), ("plant_id", 1), ("financial_year", 1)],
-        unique=True
-    )
-    
-    # Migrate existing reports to normalize financial_year (e.g., '2024-2025' to '2024_2025')
-    async for report in reports_collection.find({"financial_year": {"$regex": "\\d{4}-\\d{4}"}}):
-        old_financial_year = report["financial_year"]
-        new_financial_year = old_financial_year.replace("-", "_")
-        await reports_collection.update_one(
-            {"_id": report["_id"]},
-            {"$set": {"financial_year": new_financial_year}}
-        )
-        print(f"Updated report {report['_id']} from {old_financial_year} to {new_financial_year}")
+    report = {}
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to reconcile indexes for {name}: {str(result)}")
+            report[name] = {"error": [str(result)]}
+            continue
+        if result["missing"] and create:
+            logger.info(f"Created indexes on {name}: {result['missing']}")
+        if result["changed"]:
+            if rebuild:
+                logger.info(f"Rebuilt indexes on {name}: {result['changed']}")
+            else:
+                logger.warning(f"Indexes on {name} differ from INDEX_PLAN: {result['changed']}")
+        if result["extra"]:
+            logger.warning(f"Indexes on {name} not in INDEX_PLAN: {result['extra']}")
+        report[name] = result
+    return report
+
+_transactions_supported: Optional[bool] = None
+
+async def supports_transactions() -> bool:
+    """
+    Whether the deployment accepts multi-document transactions (replica set or sharded
+    cluster). Checked once per process; a standalone mongod returns False.
+    """
+    global _transactions_supported
+    if _transactions_supported is None:
+        hello = await client.admin.command("hello")
+        _transactions_supported = bool(hello.get("setName")) or hello.get("msg") == "isdbgrid"
+    return _transactions_supported
+
+async def init_db():
+    """
+    Ensure every index in INDEX_PLAN exists. Index builds run concurrently and are no-ops
+    when the index is already present. Data migrations live in utils/migrations.py and run
+    offline via scripts/migrate.py, so startup never waits on a data rewrite.
+    """
+    return await reconcile_indexes()
 
 def get_collection():
     return esg_collection
@@ -85,9 +271,21 @@ def get_new_reports_collection():
 def get_audit_collection():
     return audit_collection
 
+def get_audit_events_collection():
+    return audit_events_collection
+
 def get_module_collection():
     return modules_collection
 
+def get_module_submodules_collection():
+    return module_submodules_collection
+
+def get_module_categories_collection():
+    return module_categories_collection
+
+def get_module_questions_collection():
+    return module_questions_collection
+
 def get_landing_flow_questions_collection():
     return landing_flow_questions_collection
 
@@ -95,4 +293,25 @@ def get_landing_flow_responses_collection():
     return landing_flow_responses_collection
 
 def get_notifications_collection():
-    return notfications_collection
\ No newline at end of file
+    return notfications_collection
+
+def get_notification_inbox_collection():
+    return notification_inbox_collection
+
+def get_credentials_collection():
+    return credentials_collection
+
+def get_cache_versions_collection():
+    return cache_versions_collection
+
+def get_stream_sessions_collection():
+    return stream_sessions_collection
+
+def get_gemini_responses_collection():
+    return gemini_responses_collection
+
+def get_chat_messages_collection():
+    return chat_messages_collection
+
+def get_schema_migrations_collection():
+    return schema_migrations_collection
\ No newline at end of file
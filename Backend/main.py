@@ -1,7 +1,8 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from typing import Optional
 from routes.loginRoute import router as users_router
 from routes.companyRoutes import company_router as company_router
 from routes.roleAccessRoutes import router as role_access_router
@@ -11,6 +12,7 @@ from routes.moduleRoutes import router as module_router
 from routes.auditRoutes import router as audit_router
 from routes.geminiRoute import router as gemini_router
 from routes.notificationsRoute import router as notifications_router
+from routes.metricsRoute import router as metrics_router
 
 from routes import (
     companyRoutes,
@@ -22,13 +24,22 @@ from routes import (
     questionRoutes
 )
 import logging
+from auth import get_current_user_id
 from database import init_db
+from models.chatModel import ChatHistoryPage
+from services.chatHistoryService import (
+    DEFAULT_CONVERSATION,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    get_chat_history_service,
+    save_chat_message_service
+)
+from services.auditQueue import audit_queue
+from services.gemini_services import GeminiService
+from services.progressJob import progress_job
+from utils.passwordHasher import shutdown_password_hasher
 import os
 from dotenv import load_dotenv
-from google import genai
-from google.genai import types
-from datetime import datetime
-import pytz
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -38,28 +49,31 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 EXPECTED_API_KEY = os.getenv("GEMINI_API_KEY")
 
-# Initialize the Gemini client
+# The Gemini client itself is built on the first AI request
 if not EXPECTED_API_KEY:
     logger.error("GEMINI_API_KEY not found in environment variables")
     raise RuntimeError("GEMINI_API_KEY not found in environment variables")
 
-client = genai.Client(api_key=EXPECTED_API_KEY)
-model = "gemini-1.5-flash"
-
 app = FastAPI()
 
-# Mock message storage (replace with a database in production)
-messages = []
+# Chat replies depend on the conversation, so they bypass the prompt response cache
+chat_gemini_service = GeminiService(cache=None)
 
 class MessageRequest(BaseModel):
     message: str
+    conversation_id: Optional[str] = None
 
-@app.get("/api/messages")
-async def get_messages():
-    return messages
+@app.get("/api/messages", response_model=ChatHistoryPage)
+async def get_messages(
+    conversation_id: str = Query(DEFAULT_CONVERSATION),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    user_id: str = Depends(get_current_user_id)
+):
+    return await get_chat_history_service(user_id, conversation_id, limit, cursor)
 
 @app.post("/api/messages")
-async def post_message(request: MessageRequest):
+async def post_message(request: MessageRequest, user_id: str = Depends(get_current_user_id)):
     prompt = request.message
     
     if not EXPECTED_API_KEY:
@@ -67,29 +81,19 @@ async def post_message(request: MessageRequest):
         raise HTTPException(status_code=500, detail="AI service unavailable")
 
     try:
-        # Use generate_content (synchronous) for non-streaming response
-        generate_content_config = types.GenerateContentConfig(
-            response_mime_type="text/plain",
-        )
-        response = client.models.generate_content(
-            model=model,
-            contents=prompt,
-            config=generate_content_config,
-        )
-        reply = response.text
-        message_id = len(messages) + 1
-        ist = pytz.timezone('Asia/Kolkata')
-        messages.append({
-            "message_id": message_id,
-            "user_message": prompt,
-            "bot_reply": reply,
-            "timestamp": datetime.now(ist).isoformat()  # Store timestamp in IST
-        })
-        return {"reply": reply}
+        reply = await chat_gemini_service.generate_content(prompt)
     except Exception as e:
         logger.error(f"Error generating text: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+    message = await save_chat_message_service(
+        user_id,
+        prompt,
+        reply,
+        request.conversation_id or DEFAULT_CONVERSATION
+    )
+    return {"reply": reply, "message_id": message.message_id}
+
 @app.get("/api/messages/stream")
 async def stream_message(request: Request, message: str):
     if not EXPECTED_API_KEY:
@@ -98,19 +102,9 @@ async def stream_message(request: Request, message: str):
 
     async def stream_response():
         try:
-            generate_content_config = types.GenerateContentConfig(
-                response_mime_type="text/plain",
-            )
-            # Use generate_content_stream for streaming response
-            stream = client.models.generate_content_stream(
-                model=model,
-                contents=message,
-                config=generate_content_config,
-            )
-            for chunk in stream:
-                if chunk.text:
-                    logger.info(f"Streaming chunk: {chunk.text}")
-                    yield f"data: {chunk.text}\n\n"
+            # Shared async client: chunks are relayed without blocking the event loop
+            async for text in chat_gemini_service.stream_text(message):
+                yield f"data: {text}\n\n"
             logger.info("Streaming complete")
             yield "event: complete\ndata: \n\n"
         except Exception as e:
@@ -122,6 +116,14 @@ async def stream_message(request: Request, message: str):
 @app.on_event("startup")
 async def startup_event():
     await init_db()
+    audit_queue.start()
+    progress_job.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await audit_queue.stop()
+    await progress_job.stop()
+    shutdown_password_hasher()
 
 # Include the routes
 app.include_router(users_router)
@@ -141,6 +143,7 @@ app.include_router(moduleRoutes.router)
 app.include_router(questionRoutes.router)
 # Add the notifications router
 app.include_router(notifications_router)
+app.include_router(metrics_router)
 
 # CORS Configuration
 app.add_middleware(
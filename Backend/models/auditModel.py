@@ -23,4 +23,11 @@ class AuditLog(BaseModel):
         json_encoders = {
             ObjectId: str,  # Convert ObjectId to string
             datetime: lambda v: v.isoformat()  # Convert datetime to ISO string
-        }
\ No newline at end of file
+        }
+
+class AuditLogPage(BaseModel):
+    company_id: str
+    plant_id: Optional[str] = None
+    financial_year: str
+    actions: List[ActionLog] = Field(default_factory=list)  # Newest first
+    next_cursor: Optional[str] = None  # Pass back as `cursor` to fetch the next page
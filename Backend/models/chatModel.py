@@ -0,0 +1,14 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class ChatMessage(BaseModel):
+    message_id: str = Field(..., description="Unique ID of the exchange")
+    conversation_id: str
+    user_message: str
+    bot_reply: str
+    timestamp: str = Field(..., description="When the exchange happened, ISO 8601 in IST")
+
+class ChatHistoryPage(BaseModel):
+    messages: List[ChatMessage] = Field(default_factory=list, description="Exchanges, newest first")
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch older messages")
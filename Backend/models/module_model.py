@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from pydantic import BaseModel, Field, constr
 from datetime import datetime
 import uuid
@@ -142,4 +142,8 @@ class ModuleCollection(BaseModel):
     financial_year: str = Field(...) # Format: YYYY_YYYY (e.g. 2024_2025)
     modules: List[Module] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = None
\ No newline at end of file
+    updated_at: Optional[datetime] = None
+
+class QuestionPage(BaseModel):
+    questions: List[Dict[str, Any]] = Field(default_factory=list, description="Catalogue questions in catalogue order")
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next page")
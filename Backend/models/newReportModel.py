@@ -68,4 +68,18 @@ class Report(BaseModel):
             datetime: lambda v: v.isoformat(),
             ObjectId: str
         }
-        allow_population_by_field_name = True
\ No newline at end of file
+        allow_population_by_field_name = True
+
+class ImportRowError(BaseModel):
+    """A spreadsheet row rejected by the bulk import"""
+    row: int
+    question_id: Optional[str] = None
+    error: str
+
+class ImportResult(BaseModel):
+    """Summary of a bulk import of report responses"""
+    rows_processed: int = 0
+    rows_imported: int = 0
+    rows_failed: int = 0
+    errors: List[ImportRowError] = Field(default_factory=list)
+    errors_truncated: bool = False
@@ -43,4 +43,21 @@ class NotificationCollection(BaseModel):
         allow_population_by_field_name = True
         json_encoders = {
             uuid.UUID: lambda v: str(v)
-        }
\ No newline at end of file
+        }
+
+class InboxNotification(BaseModel):
+    notification_id: str = Field(..., description="Shared ID of the notification across all recipients")
+    company_id: str
+    plant_id: str
+    recipient_id: str = Field(..., description="User ID of the recipient owning this inbox entry")
+    sender: str
+    title: str
+    description: str
+    timestamp: datetime
+    read: bool = Field(default=False, description="Whether the recipient has read the notification")
+    read_at: Optional[datetime] = None
+
+class NotificationPage(BaseModel):
+    notifications: List[InboxNotification] = Field(default_factory=list)
+    unread_count: int = Field(..., description="Unread notifications for the recipient across all pages")
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next page")
@@ -1,1522 +1,5 @@
-QUESTION_MAPPINGS = {
-  "Q18a": {
-    "module": "Workforce",
-    "sub_module": "Workforce",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Employees and Workers by Type and Gender",
-    "schema_path_composite": "section_a.workers.Q18a",
-    "subcomponents": [
-      "Q18a_permanent_employees_male",
-      "Q18a_permanent_employees_female",
-      "Q18a_permanent_employees_other",
-      "Q18a_non_permanent_employees_male",
-      "Q18a_non_permanent_employees_female",
-      "Q18a_non_permanent_employees_other",
-      "Q18a_permanent_workers_male",
-      "Q18a_permanent_workers_female",
-      "Q18a_permanent_workers_other",
-      "Q18a_contractual_workers_male",
-      "Q18a_contractual_workers_female",
-      "Q18a_contractual_workers_other"
-    ]
-  },
-  "Q18a_permanent_employees_male": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Permanent Employees (Male)",
-    "schema_path": "section_a.employees.Q18a.permanent_employees.male"
-  },
-  "Q18a_permanent_employees_female": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Permanent Employees (Female)",
-    "schema_path": "section_a.employees.Q18a.permanent_employees.female"
-  },
-  "Q18a_permanent_employees_other": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Permanent Employees (Other)",
-    "schema_path": "section_a.employees.Q18a.permanent_employees.other"
-  },
-  "Q18a_non_permanent_employees_male": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Non-Permanent Employees (Male)",
-    "schema_path": "section_a.employees.Q18a.non_permanent_employees.male"
-  },
-  "Q18a_non_permanent_employees_female": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Non-Permanent Employees (Female)",
-    "schema_path": "section_a.employees.Q18a.non_permanent_employees.female"
-  },
-  "Q18a_non_permanent_employees_other": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Non-Permanent Employees (Other)",
-    "schema_path": "section_a.employees.Q18a.non_permanent_employees.other"
-  },
-  "Q18a_permanent_workers_male": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Permanent Workers (Male)",
-    "schema_path": "section_a.employees.Q18a.permanent_workers.male"
-  },
-  "Q18a_permanent_workers_female": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Permanent Workers (Female)",
-    "schema_path": "section_a.employees.Q18a.permanent_workers.female"
-  },
-  "Q18a_permanent_workers_other": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Permanent Workers (Other)",
-    "schema_path": "section_a.employees.Q18a.permanent_workers.other"
-  },
-  "Q18a_contractual_workers_male": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Contractual Workers (Male)",
-    "schema_path": "section_a.employees.Q18a.contractual_workers.male"
-  },
-  "Q18a_contractual_workers_female": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Contractual Workers (Female)",
-    "schema_path": "section_a.employees.Q18a.contractual_workers.female"
-  },
-  "Q18a_contractual_workers_other": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Contractual Workers (Other)",
-    "schema_path": "section_a.employees.Q18a.contractual_workers.other"
-  },
-  "Q18b": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Differently Abled Employees and Workers by Type and Gender",
-    "schema_path_composite": "section_a.employees.Q18b",
-    "subcomponents": [
-      "Q18b_differently_abled_permanent_employees_male",
-      "Q18b_differently_abled_permanent_employees_female",
-      "Q18b_differently_abled_permanent_employees_other",
-      "Q18b_differently_abled_non_permanent_employees_male",
-      "Q18b_differently_abled_non_permanent_employees_female",
-      "Q18b_differently_abled_non_permanent_employees_other",
-      "Q18b_differently_abled_permanent_workers_male",
-      "Q18b_differently_abled_permanent_workers_female",
-      "Q18b_differently_abled_permanent_workers_other",
-      "Q18b_differently_abled_contractual_workers_male",
-      "Q18b_differently_abled_contractual_workers_female",
-      "Q18b_differently_abled_contractual_workers_other"
-    ]
-  },
-  "Q18b_differently_abled_permanent_employees_male": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Differently Abled Permanent Employees (Male)",
-    "schema_path": "section_a.employees.Q18b.differently_abled_permanent_employees.male"
-  },
-  "Q18b_differently_abled_permanent_employees_female": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Differently Abled Permanent Employees (Female)",
-    "schema_path": "section_a.employees.Q18b.differently_abled_permanent_employees.female"
-  },
-  "Q18b_differently_abled_permanent_employees_other": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Differently Abled Permanent Employees (Other)",
-    "schema_path": "section_a.employees.Q18b.differently_abled_permanent_employees.other"
-  },
-  "Q18b_differently_abled_non_permanent_employees_male": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Differently Abled Non-Permanent Employees (Male)",
-    "schema_path": "section_a.employees.Q18b.differently_abled_non_permanent_employees.male"
-  },
-  "Q18b_differently_abled_non_permanent_employees_female": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Differently Abled Non-Permanent Employees (Female)",
-    "schema_path": "section_a.employees.Q18b.differently_abled_non_permanent_employees.female"
-  },
-  "Q18b_differently_abled_non_permanent_employees_other": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Differently Abled Non-Permanent Employees (Other)",
-    "schema_path": "section_a.employees.Q18b.differently_abled_non_permanent_employees.other"
-  },
-  "Q18b_differently_abled_permanent_workers_male": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Differently Abled Permanent Workers (Male)",
-    "schema_path": "section_a.employees.Q18b.differently_abled_permanent_workers.male"
-  },
-  "Q18b_differently_abled_permanent_workers_female": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Differently Abled Permanent Workers (Female)",
-    "schema_path": "section_a.employees.Q18b.differently_abled_permanent_workers.female"
-  },
-  "Q18b_differently_abled_permanent_workers_other": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Differently Abled Permanent Workers (Other)",
-    "schema_path": "section_a.employees.Q18b.differently_abled_permanent_workers.other"
-  },
-  "Q18b_differently_abled_contractual_workers_male": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Differently Abled Contractual Workers (Male)",
-    "schema_path": "section_a.employees.Q18b.differently_abled_contractual_workers.male"
-  },
-  "Q18b_differently_abled_contractual_workers_female": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Differently Abled Contractual Workers (Female)",
-    "schema_path": "section_a.employees.Q18b.differently_abled_contractual_workers.female"
-  },
-  "Q18b_differently_abled_contractual_workers_other": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Differently Abled Contractual Workers (Other)",
-    "schema_path": "section_a.employees.Q18b.differently_abled_contractual_workers.other"
-  },
-  "Q19": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Participation/Inclusion of Women",
-    "schema_path_composite": "section_a.employees.Q19",
-    "subcomponents": [
-      "Q19_board_women",
-      "Q19_management_women",
-      "Q19_workforce_women"
-    ]
-  },
-  "Q19_board_women": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Women on Board of Directors",
-    "schema_path": "section_a.employees.Q19.board_women"
-  },
-  "Q19_management_women": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Women in Senior Management",
-    "schema_path": "section_a.employees.Q19.management_women"
-  },
-  "Q19_workforce_women": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Women in Total Workforce",
-    "schema_path": "section_a.employees.Q19.workforce_women"
-  },
-  "Q20": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Turnover Rate by Type and Gender",
-    "schema_path_composite": "section_a.employees.Q20",
-    "subcomponents": [
-      "Q20_permanent_employees_male",
-      "Q20_permanent_employees_female",
-      "Q20_permanent_employees_other",
-      "Q20_non_permanent_employees_male",
-      "Q20_non_permanent_employees_female",
-      "Q20_non_permanent_employees_other",
-      "Q20_permanent_workers_male",
-      "Q20_permanent_workers_female",
-      "Q20_permanent_workers_other",
-      "Q20_contractual_workers_male",
-      "Q20_contractual_workers_female",
-      "Q20_contractual_workers_other"
-    ]
-  },
-  "Q20_permanent_employees_male": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Turnover Rate for Permanent Employees (Male)",
-    "schema_path": "section_a.employees.Q20.permanent_employees.male"
-  },
-  "Q20_permanent_employees_female": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Turnover Rate for Permanent Employees (Female)",
-    "schema_path": "section_a.employees.Q20.permanent_employees.female"
-  },
-  "Q20_permanent_employees_other": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Turnover Rate for Permanent Employees (Other)",
-    "schema_path": "section_a.employees.Q20.permanent_employees.other"
-  },
-  "Q20_non_permanent_employees_male": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Turnover Rate for Non-Permanent Employees (Male)",
-    "schema_path": "section_a.employees.Q20.non_permanent_employees.male"
-  },
-  "Q20_non_permanent_employees_female": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Turnover Rate for Non-Permanent Employees (Female)",
-    "schema_path": "section_a.employees.Q20.non_permanent_employees.female"
-  },
-  "Q20_non_permanent_employees_other": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Turnover Rate for Non-Permanent Employees (Other)",
-    "schema_path": "section_a.employees.Q20.non_permanent_employees.other"
-  },
-  "Q20_permanent_workers_male": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Turnover Rate for Permanent Workers (Male)",
-    "schema_path": "section_a.employees.Q20.permanent_workers.male"
-  },
-  "Q20_permanent_workers_female": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Turnover Rate for Permanent Workers (Female)",
-    "schema_path": "section_a.employees.Q20.permanent_workers.female"
-  },
-  "Q20_permanent_workers_other": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Turnover Rate for Permanent Workers (Other)",
-    "schema_path": "section_a.employees.Q20.permanent_workers.other"
-  },
-  "Q20_contractual_workers_male": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Turnover Rate for Contractual Workers (Male)",
-    "schema_path": "section_a.employees.Q20.contractual_workers.male"
-  },
-  "Q20_contractual_workers_female": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Turnover Rate for Contractual Workers (Female)",
-    "schema_path": "section_a.employees.Q20.contractual_workers.female"
-  },
-  "Q20_contractual_workers_other": {
-    "module": "Workforce",
-    "sub_module": "Workforce Details",
-    "section": "A",
-    "sub_section": "Employees",
-    "principle": None,
-    "description": "Turnover Rate for Contractual Workers (Other)",
-    "schema_path": "section_a.employees.Q20.contractual_workers.other"
-  },
-  "Q1a_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Employee Well-Being Measures",
-    "schema_path_composite": "section_c.principle_3.Q1a_P3",
-    "subcomponents": [
-      "Q1a_P3_health_insurance",
-      "Q1a_P3_leave_policy",
-      "Q1a_P3_wellness_programs"
-    ]
-  },
-  "Q1a_P3_health_insurance": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Employee Health Insurance Coverage",
-    "schema_path": "section_c.principle_3.Q1a_P3.health_insurance"
-  },
-  "Q1a_P3_leave_policy": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Employee Leave Policy",
-    "schema_path": "section_c.principle_3.Q1a_P3.leave_policy"
-  },
-  "Q1a_P3_wellness_programs": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Employee Wellness Programs",
-    "schema_path": "section_c.principle_3.Q1a_P3.wellness_programs"
-  },
-  "Q1b_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Worker Well-Being Measures",
-    "schema_path_composite": "section_c.principle_3.Q1b_P3",
-    "subcomponents": [
-      "Q1b_P3_health_insurance",
-      "Q1b_P3_leave_policy",
-      "Q1b_P3_wellness_programs"
-    ]
-  },
-  "Q1b_P3_health_insurance": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Worker Health Insurance Coverage",
-    "schema_path": "section_c.principle_3.Q1b_P3.health_insurance"
-  },
-  "Q1b_P3_leave_policy": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Worker Leave Policy",
-    "schema_path": "section_c.principle_3.Q1b_P3.leave_policy"
-  },
-  "Q1b_P3_wellness_programs": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Worker Wellness Programs",
-    "schema_path": "section_c.principle_3.Q1b_P3.wellness_programs"
-  },
-  "Q8_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Training Hours by Category",
-    "schema_path_composite": "section_c.principle_3.Q8_P3",
-    "subcomponents": [
-      "Q8_P3_permanent_employees",
-      "Q8_P3_non_permanent_employees",
-      "Q8_P3_permanent_workers",
-      "Q8_P3_contractual_workers"
-    ]
-  },
-  "Q8_P3_permanent_employees": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Training Hours for Permanent Employees",
-    "schema_path": "section_c.principle_3.Q8_P3.permanent_employees"
-  },
-  "Q8_P3_non_permanent_employees": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Training Hours for Non-Permanent Employees",
-    "schema_path": "section_c.principle_3.Q8_P3.non_permanent_employees"
-  },
-  "Q8_P3_permanent_workers": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Training Hours for Permanent Workers",
-    "schema_path": "section_c.principle_3.Q8_P3.permanent_workers"
-  },
-  "Q8_P3_contractual_workers": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Training Hours for Contractual Workers",
-    "schema_path": "section_c.principle_3.Q8_P3.contractual_workers"
-  },
-  "Q11_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Safety Incidents by Category",
-    "schema_path_composite": "section_c.principle_3.Q11_P3",
-    "subcomponents": [
-      "Q11_P3_employees_fatalities",
-      "Q11_P3_employees_injuries",
-      "Q11_P3_employees_near_misses",
-      "Q11_P3_workers_fatalities",
-      "Q11_P3_workers_injuries",
-      "Q11_P3_workers_near_misses"
-    ]
-  },
-  "Q11_P3_employees_fatalities": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Fatalities for Employees",
-    "schema_path": "section_c.principle_3.Q11_P3.employees.fatalities"
-  },
-  "Q11_P3_employees_injuries": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Injuries for Employees",
-    "schema_path": "section_c.principle_3.Q11_P3.employees.injuries"
-  },
-  "Q11_P3_employees_near_misses": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Near-Misses for Employees",
-    "schema_path": "section_c.principle_3.Q11_P3.employees.near_misses"
-  },
-  "Q11_P3_workers_fatalities": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Fatalities for Workers",
-    "schema_path": "section_c.principle_3.Q11_P3.workers.fatalities"
-  },
-  "Q11_P3_workers_injuries": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Injuries for Workers",
-    "schema_path": "section_c.principle_3.Q11_P3.workers.injuries"
-  },
-  "Q11_P3_workers_near_misses": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Near-Misses for Workers",
-    "schema_path": "section_c.principle_3.Q11_P3.workers.near_misses"
-  },
-  "Q2_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Retirement Benefits",
-    "schema_path": "section_c.principle_3.Q2_P3"
-  },
-  "Q3_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Accessibility",
-    "schema_path": "section_c.principle_3.Q3_P3"
-  },
-  "Q4_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Equal Opportunity Policy",
-    "schema_path": "section_c.principle_3.Q4_P3"
-  },
-  "Q5_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Return to Work and Retention",
-    "schema_path": "section_c.principle_3.Q5_P3"
-  },
-  "Q6_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Grievance Mechanisms",
-    "schema_path": "section_c.principle_3.Q6_P3"
-  },
-  "Q7_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Union Membership",
-    "schema_path": "section_c.principle_3.Q7_P3"
-  },
-  "Q9_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Performance Reviews",
-    "schema_path": "section_c.principle_3.Q9_P3"
-  },
-  "Q10_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Health and Safety System",
-    "schema_path": "section_c.principle_3.Q10_P3"
-  },
-  "Q12_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Safe/Healthy Workplace Measures",
-    "schema_path": "section_c.principle_3.Q12_P3"
-  },
-  "Q13_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Complaints on Conditions/Safety",
-    "schema_path": "section_c.principle_3.Q13_P3"
-  },
-  "Q14_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Assessments",
-    "schema_path": "section_c.principle_3.Q14_P3"
-  },
-  "Q15_P3": {
-    "module": "Workforce",
-    "sub_module": "Employee Well-Being",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 3",
-    "description": "Corrective Actions for Safety",
-    "schema_path": "section_c.principle_3.Q15_P3"
-  },
-  "Q1_P5": {
-    "module": "Workforce",
-    "sub_module": "Human Rights",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 5",
-    "description": "Human Rights Training",
-    "schema_path": "section_c.principle_5.Q1_P5"
-  },
-  "Q2_P5": {
-    "module": "Workforce",
-    "sub_module": "Human Rights",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 5",
-    "description": "Minimum Wages",
-    "schema_path": "section_c.principle_5.Q2_P5"
-  },
-  "Q3_P5": {
-    "module": "Workforce",
-    "sub_module": "Human Rights",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 5",
-    "description": "Remuneration Details",
-    "schema_path": "section_c.principle_5.Q3_P5"
-  },
-  "Q4_P5": {
-    "module": "Workforce",
-    "sub_module": "Human Rights",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 5",
-    "description": "Focal Point for Human Rights",
-    "schema_path": "section_c.principle_5.Q4_P5"
-  },
-  "Q5_P5": {
-    "module": "Workforce",
-    "sub_module": "Human Rights",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 5",
-    "description": "Grievance Mechanisms",
-    "schema_path": "section_c.principle_5.Q5_P5"
-  },
-  "Q6_P5": {
-    "module": "Workforce",
-    "sub_module": "Human Rights",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 5",
-    "description": "Complaints on Human Rights",
-    "schema_path": "section_c.principle_5.Q6_P5"
-  },
-  "Q7_P5": {
-    "module": "Workforce",
-    "sub_module": "Human Rights",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 5",
-    "description": "Protection for Complaints",
-    "schema_path": "section_c.principle_5.Q7_P5"
-  },
-  "Q8_P5": {
-    "module": "Workforce",
-    "sub_module": "Human Rights",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 5",
-    "description": "Human Rights in Contracts",
-    "schema_path": "section_c.principle_5.Q8_P5"
-  },
-  "Q9_P5": {
-    "module": "Workforce",
-    "sub_module": "Human Rights",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 5",
-    "description": "Assessments",
-    "schema_path": "section_c.principle_5.Q9_P5"
-  },
-  "Q10_P5": {
-    "module": "Workforce",
-    "sub_module": "Human Rights",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 5",
-    "description": "Corrective Actions",
-    "schema_path": "section_c.principle_5.Q10_P5"
-  },
-  "Q1a_B": {
-    "module": "Legal",
-    "sub_module": "Policy and Governance",
-    "section": "B",
-    "sub_section": "Policy and Governance",
-    "principle": None,
-    "description": "Policy Coverage",
-    "schema_path": "section_b.policy_and_governance.Q1a_B"
-  },
-  "Q1b_B": {
-    "module": "Legal",
-    "sub_module": "Policy and Governance",
-    "section": "B",
-    "sub_section": "Policy and Governance",
-    "principle": None,
-    "description": "Policy Approval",
-    "schema_path": "section_b.policy_and_governance.Q1b_B"
-  },
-  "Q1c_B": {
-    "module": "Legal",
-    "sub_module": "Policy and Governance",
-    "section": "B",
-    "sub_section": "Policy and Governance",
-    "principle": None,
-    "description": "Web Link",
-    "schema_path": "section_b.policy_and_governance.Q1c_B"
-  },
-  "Q2_B": {
-    "module": "Legal",
-    "sub_module": "Policy and Governance",
-    "section": "B",
-    "sub_section": "Policy and Governance",
-    "principle": None,
-    "description": "Policy Translation",
-    "schema_path": "section_b.policy_and_governance.Q2_B"
-  },
-  "Q3_B": {
-    "module": "Legal",
-    "sub_module": "Policy and Governance",
-    "section": "B",
-    "sub_section": "Policy and Governance",
-    "principle": None,
-    "description": "Policy Extension",
-    "schema_path": "section_b.policy_and_governance.Q3_B"
-  },
-  "Q4_B": {
-    "module": "Legal",
-    "sub_module": "Policy and Governance",
-    "section": "B",
-    "sub_section": "Policy and Governance",
-    "principle": None,
-    "description": "Codes/Certifications",
-    "schema_path": "section_b.policy_and_governance.Q4_B"
-  },
-  "Q5_B": {
-    "module": "Legal",
-    "sub_module": "Policy and Governance",
-    "section": "B",
-    "sub_section": "Policy and Governance",
-    "principle": None,
-    "description": "Commitments/Goals",
-    "schema_path": "section_b.policy_and_governance.Q5_B"
-  },
-  "Q6_B": {
-    "module": "Legal",
-    "sub_module": "Policy and Governance",
-    "section": "B",
-    "sub_section": "Policy and Governance",
-    "principle": None,
-    "description": "Performance Against Goals",
-    "schema_path": "section_b.policy_and_governance.Q6_B"
-  },
-  "Q7_B": {
-    "module": "Legal",
-    "sub_module": "Policy and Governance",
-    "section": "B",
-    "sub_section": "Policy and Governance",
-    "principle": None,
-    "description": "Director’s Statement",
-    "schema_path": "section_b.policy_and_governance.Q7_B"
-  },
-  "Q8_B": {
-    "module": "Legal",
-    "sub_module": "Policy and Governance",
-    "section": "B",
-    "sub_section": "Policy and Governance",
-    "principle": None,
-    "description": "Highest Authority",
-    "schema_path": "section_b.policy_and_governance.Q8_B"
-  },
-  "Q9_B": {
-    "module": "Legal",
-    "sub_module": "Policy and Governance",
-    "section": "B",
-    "sub_section": "Policy and Governance",
-    "principle": None,
-    "description": "Sustainability Committee",
-    "schema_path": "section_b.policy_and_governance.Q9_B"
-  },
-  "Q12_B": {
-    "module": "Legal",
-    "sub_module": "Policy and Governance",
-    "section": "B",
-    "sub_section": "Policy and Governance",
-    "principle": None,
-    "description": "Reasons for No Policy",
-    "schema_path": "section_b.policy_and_governance.Q12_B"
-  },
-  "Q1_P1": {
-    "module": "Legal",
-    "sub_module": "Ethical Conduct",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 1",
-    "description": "Training on Principles",
-    "schema_path": "section_c.principle_1.Q1_P1"
-  },
-  "Q2_P1": {
-    "module": "Legal",
-    "sub_module": "Ethical Conduct",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 1",
-    "description": "Fines/Penalties",
-    "schema_path": "section_c.principle_1.Q2_P1"
-  },
-  "Q3_P1": {
-    "module": "Legal",
-    "sub_module": "Ethical Conduct",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 1",
-    "description": "Appeals/Revisions",
-    "schema_path": "section_c.principle_1.Q3_P1"
-  },
-  "Q4_P1": {
-    "module": "Legal",
-    "sub_module": "Ethical Conduct",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 1",
-    "description": "Anti-Corruption Policy",
-    "schema_path": "section_c.principle_1.Q4_P1"
-  },
-  "Q5_P1": {
-    "module": "Legal",
-    "sub_module": "Ethical Conduct",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 1",
-    "description": "Disciplinary Actions",
-    "schema_path": "section_c.principle_1.Q5_P1"
-  },
-  "Q6_P1": {
-    "module": "Legal",
-    "sub_module": "Ethical Conduct",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 1",
-    "description": "Conflict of Interest Complaints",
-    "schema_path": "section_c.principle_1.Q6_P1"
-  },
-  "Q7_P1": {
-    "module": "Legal",
-    "sub_module": "Ethical Conduct",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 1",
-    "description": "Corrective Actions",
-    "schema_path": "section_c.principle_1.Q7_P1"
-  },
-  "Q1a_P7": {
-    "module": "Legal",
-    "sub_module": "Policy Advocacy",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 7",
-    "description": "Trade Affiliations",
-    "schema_path": "section_c.principle_7.Q1a_P7"
-  },
-  "Q1b_P7": {
-    "module": "Legal",
-    "sub_module": "Policy Advocacy",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 7",
-    "description": "Top 10 Trade Chambers",
-    "schema_path": "section_c.principle_7.Q1b_P7"
-  },
-  "Q2_P7": {
-    "module": "Legal",
-    "sub_module": "Policy Advocacy",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 7",
-    "description": "Anti-Competitive Conduct",
-    "schema_path": "section_c.principle_7.Q2_P7"
-  },
-  "Q1_A": {
-    "module": "Admin",
-    "sub_module": "Entity Details",
-    "section": "A",
-    "sub_section": "Entity Details",
-    "principle": None,
-    "description": "CIN",
-    "schema_path": "section_a.entity_details.Q1_A"
-  },
-  "Q2_A": {
-    "module": "Admin",
-    "sub_module": "Entity Details",
-    "section": "A",
-    "sub_section": "Entity Details",
-    "principle": None,
-    "description": "Name",
-    "schema_path": "section_a.entity_details.Q2_A"
-  },
-  "Q3_A": {
-    "module": "Admin",
-    "sub_module": "Entity Details",
-    "section": "A",
-    "sub_section": "Entity Details",
-    "principle": None,
-    "description": "Year of Incorporation",
-    "schema_path": "section_a.entity_details.Q3_A"
-  },
-  "Q4_A": {
-    "module": "Admin",
-    "sub_module": "Entity Details",
-    "section": "A",
-    "sub_section": "Entity Details",
-    "principle": None,
-    "description": "Registered Office",
-    "schema_path": "section_a.entity_details.Q4_A"
-  },
-  "Q5_A": {
-    "module": "Admin",
-    "sub_module": "Entity Details",
-    "section": "A",
-    "sub_section": "Entity Details",
-    "principle": None,
-    "description": "Corporate Address",
-    "schema_path": "section_a.entity_details.Q5_A"
-  },
-  "Q6_A": {
-    "module": "Admin",
-    "sub_module": "Entity Details",
-    "section": "A",
-    "sub_section": "Entity Details",
-    "principle": None,
-    "description": "E-mail",
-    "schema_path": "section_a.entity_details.Q6_A"
-  },
-  "Q7_A": {
-    "module": "Admin",
-    "sub_module": "Entity Details",
-    "section": "A",
-    "sub_section": "Entity Details",
-    "principle": None,
-    "description": "Telephone",
-    "schema_path": "section_a.entity_details.Q7_A"
-  },
-  "Q8_A": {
-    "module": "Admin",
-    "sub_module": "Entity Details",
-    "section": "A",
-    "sub_section": "Entity Details",
-    "principle": None,
-    "description": "Website",
-    "schema_path": "section_a.entity_details.Q8_A"
-  },
-  "Q9_A": {
-    "module": "Admin",
-    "sub_module": "Entity Details",
-    "section": "A",
-    "sub_section": "Entity Details",
-    "principle": None,
-    "description": "Financial Year",
-    "schema_path": "section_a.entity_details.Q9_A"
-  },
-  "Q10_A": {
-    "module": "Admin",
-    "sub_module": "Entity Details",
-    "section": "A",
-    "sub_section": "Entity Details",
-    "principle": None,
-    "description": "Stock Exchange(s)",
-    "schema_path": "section_a.entity_details.Q10_A"
-  },
-  "Q11_A": {
-    "module": "Admin",
-    "sub_module": "Entity Details",
-    "section": "A",
-    "sub_section": "Entity Details",
-    "principle": None,
-    "description": "Paid-up Capital",
-    "schema_path": "section_a.entity_details.Q11_A"
-  },
-  "Q12_A": {
-    "module": "Admin",
-    "sub_module": "Entity Details",
-    "section": "A",
-    "sub_section": "Entity Details",
-    "principle": None,
-    "description": "Contact Person",
-    "schema_path": "section_a.entity_details.Q12_A"
-  },
-  "Q13_A": {
-    "module": "Admin",
-    "sub_module": "Entity Details",
-    "section": "A",
-    "sub_section": "Entity Details",
-    "principle": None,
-    "description": "Reporting Boundary",
-    "schema_path": "section_a.entity_details.Q13_A"
-  },
-  "Q16_A": {
-    "module": "Admin",
-    "sub_module": "Operations",
-    "section": "A",
-    "sub_section": "Operations",
-    "principle": None,
-    "description": "Locations",
-    "schema_path": "section_a.products_and_operations.Q16_A"
-  },
-  "Q17a_A": {
-    "module": "Admin",
-    "sub_module": "Operations",
-    "section": "A",
-    "sub_section": "Operations",
-    "principle": None,
-    "description": "Markets Served",
-    "schema_path": "section_a.products_and_operations.Q17a_A"
-  },
-  "Q17b_A": {
-    "module": "Admin",
-    "sub_module": "Operations",
-    "section": "A",
-    "sub_section": "Operations",
-    "principle": None,
-    "description": "Export Contribution",
-    "schema_path": "section_a.products_and_operations.Q17b_A"
-  },
-  "Q17c_A": {
-    "module": "Admin",
-    "sub_module": "Operations",
-    "section": "A",
-    "sub_section": "Operations",
-    "principle": None,
-    "description": "Customer Types",
-    "schema_path": "section_a.products_and_operations.Q17c_A"
-  },
-  "Q21a_A": {
-    "module": "Admin",
-    "sub_module": "Corporate Structure",
-    "section": "A",
-    "sub_section": "Corporate Structure",
-    "principle": None,
-    "description": "Company Details",
-    "schema_path": "section_a.stock_and_management.Q21a_A"
-  },
-  "Q1_P4": {
-    "module": "Admin",
-    "sub_module": "Stakeholder Engagement",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 4",
-    "description": "Stakeholder Identification",
-    "schema_path": "section_c.principle_4.Q1_P4"
-  },
-  "Q2_P4": {
-    "module": "Admin",
-    "sub_module": "Stakeholder Engagement",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 4",
-    "description": "Stakeholder Groups",
-    "schema_path": "section_c.principle_4.Q2_P4"
-  },
-  "Q1_P2": {
-    "module": "Environment",
-    "sub_module": "Sustainable Products",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 2",
-    "description": "R&D and Capex",
-    "schema_path": "section_c.principle_2.Q1_P2"
-  },
-  "Q2a_P2": {
-    "module": "Environment",
-    "sub_module": "Sustainable Products",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 2",
-    "description": "Sustainable Sourcing",
-    "schema_path": "section_c.principle_2.Q2a_P2"
-  },
-  "Q2b_P2": {
-    "module": "Environment",
-    "sub_module": "Sustainable Products",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 2",
-    "description": "Sustainable Inputs",
-    "schema_path": "section_c.principle_2.Q2b_P2"
-  },
-  "Q3_P2": {
-    "module": "Environment",
-    "sub_module": "Sustainable Products",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 2",
-    "description": "Product Reclamation",
-    "schema_path": "section_c.principle_2.Q3_P2"
-  },
-  "Q4_P2": {
-    "module": "Environment",
-    "sub_module": "Sustainable Products",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 2",
-    "description": "EPR",
-    "schema_path": "section_c.principle_2.Q4_P2"
-  },
-  "Q1_P6": {
-    "module": "Environment",
-    "sub_module": "Energy and Emissions",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 6",
-    "description": "Energy Consumption",
-    "schema_path": "section_c.principle_6.Q1_P6"
-  },
-  "Q4_P6": {
-    "module": "Environment",
-    "sub_module": "Energy and Emissions",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 6",
-    "description": "Air Emissions",
-    "schema_path": "section_c.principle_6.Q4_P6"
-  },
-  "Q5_P6": {
-    "module": "Environment",
-    "sub_module": "Energy and Emissions",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 6",
-    "description": "GHG Emissions",
-    "schema_path": "section_c.principle_6.Q5_P6"
-  },
-  "Q6_P6": {
-    "module": "Environment",
-    "sub_module": "Energy and Emissions",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 6",
-    "description": "GHG Reduction Projects",
-    "schema_path": "section_c.principle_6.Q6_P6"
-  },
-  "Q7_P6": {
-    "module": "Environment",
-    "sub_module": "Energy and Emissions",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 6",
-    "description": "Scope 3 Emissions",
-    "schema_path": "section_c.principle_6.Q7_P6"
-  },
-  "Q3_P6": {
-    "module": "Environment",
-    "sub_module": "Water and Waste",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 6",
-    "description": "Water Usage",
-    "schema_path": "section_c.principle_6.Q3_P6"
-  },
-  "Q8_P6": {
-    "module": "Environment",
-    "sub_module": "Water and Waste",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 6",
-    "description": "Waste Management",
-    "schema_path": "section_c.principle_6.Q8_P6"
-  },
-  "Q9_P6": {
-    "module": "Environment",
-    "sub_module": "Water and Waste",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 6",
-    "description": "Waste Practices",
-    "schema_path": "section_c.principle_6.Q9_P6"
-  },
-  "Q2_P6": {
-    "module": "Environment",
-    "sub_module": "Environmental Compliance",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 6",
-    "description": "PAT Scheme",
-    "schema_path": "section_c.principle_6.Q2_P6"
-  },
-  "Q10_P6": {
-    "module": "Environment",
-    "sub_module": "Environmental Compliance",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 6",
-    "description": "Ecologically Sensitive Areas",
-    "schema_path": "section_c.principle_6.Q10_P6"
-  },
-  "Q11_P6": {
-    "module": "Environment",
-    "sub_module": "Environmental Compliance",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 6",
-    "description": "Environmental Impact Assessments",
-    "schema_path": "section_c.principle_6.Q11_P6"
-  },
-  "Q12_P6": {
-    "module": "Environment",
-    "sub_module": "Environmental Compliance",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 6",
-    "description": "Compliance with Laws",
-    "schema_path": "section_c.principle_6.Q12_P6"
-  },
-  "Q14_A": {
-    "module": "Finance",
-    "sub_module": "Products and Services",
-    "section": "A",
-    "sub_section": "Products and Services",
-    "principle": None,
-    "description": "Business Activities",
-    "schema_path": "section_a.products_and_operations.Q14_A"
-  },
-  "Q15_A": {
-    "module": "Finance",
-    "sub_module": "Products and Services",
-    "section": "A",
-    "sub_section": "Products and Services",
-    "principle": None,
-    "description": "Products/Services Sold",
-    "schema_path": "section_a.products_and_operations.Q15_A"
-  },
-  "Q22i_A": {
-    "module": "Finance",
-    "sub_module": "CSR",
-    "section": "A",
-    "sub_section": "CSR Details",
-    "principle": None,
-    "description": "CSR Applicability",
-    "schema_path": "section_a.csr_and_governance.Q22i_A"
-  },
-  "Q22ii_A": {
-    "module": "Finance",
-    "sub_module": "CSR",
-    "section": "A",
-    "sub_section": "CSR Details",
-    "principle": None,
-    "description": "Turnover",
-    "schema_path": "section_a.csr_and_governance.Q22ii_A"
-  },
-  "Q22iii_A": {
-    "module": "Finance",
-    "sub_module": "CSR",
-    "section": "A",
-    "sub_section": "CSR Details",
-    "principle": None,
-    "description": "Net Worth",
-    "schema_path": "section_a.csr_and_governance.Q22iii_A"
-  },
-  "Q23_A": {
-    "module": "Finance",
-    "sub_module": "Transparency and Grievances",
-    "section": "A",
-    "sub_section": "Transparency and Disclosures",
-    "principle": None,
-    "description": "Complaints/Grievances",
-    "schema_path": "section_a.csr_and_governance.Q23_A"
-  },
-  "Q24_A": {
-    "module": "Finance",
-    "sub_module": "Transparency and Grievances",
-    "section": "A",
-    "sub_section": "Transparency and Disclosures",
-    "principle": None,
-    "description": "Material ESG Issues",
-    "schema_path": "section_a.csr_and_governance.Q24_A"
-  },
-  "Q1_P8": {
-    "module": "Finance",
-    "sub_module": "Inclusive Growth",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 8",
-    "description": "Social Impact Assessments",
-    "schema_path": "section_c.principle_8.Q1_P8"
-  },
-  "Q2_P8": {
-    "module": "Finance",
-    "sub_module": "Inclusive Growth",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 8",
-    "description": "Rehabilitation and Resettlement",
-    "schema_path": "section_c.principle_8.Q2_P8"
-  },
-  "Q3_P8": {
-    "module": "Finance",
-    "sub_module": "Inclusive Growth",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 8",
-    "description": "Community Grievances",
-    "schema_path": "section_c.principle_8.Q3_P8"
-  },
-  "Q4_P8": {
-    "module": "Finance",
-    "sub_module": "Inclusive Growth",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 8",
-    "description": "Sourcing from Suppliers",
-    "schema_path": "section_c.principle_8.Q4_P8"
-  },
-  "Q1_P9": {
-    "module": "Finance",
-    "sub_module": "Consumer Responsibility",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 9",
-    "description": "Consumer Complaint Mechanisms",
-    "schema_path": "section_c.principle_9.Q1_P9"
-  },
-  "Q2_P9": {
-    "module": "Finance",
-    "sub_module": "Consumer Responsibility",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 9",
-    "description": "Product Information Turnover",
-    "schema_path": "section_c.principle_9.Q2_P9"
-  },
-  "Q3_P9": {
-    "module": "Finance",
-    "sub_module": "Consumer Responsibility",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 9",
-    "description": "Consumer Complaints",
-    "schema_path": "section_c.principle_9.Q3_P9"
-  },
-  "Q4_P9": {
-    "module": "Finance",
-    "sub_module": "Consumer Responsibility",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 9",
-    "description": "Product Recalls",
-    "schema_path": "section_c.principle_9.Q4_P9"
-  },
-  "Q5_P9": {
-    "module": "Finance",
-    "sub_module": "Consumer Responsibility",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 9",
-    "description": "Cyber Security Policy",
-    "schema_path": "section_c.principle_9.Q5_P9"
-  },
-  "Q6_P9": {
-    "module": "Finance",
-    "sub_module": "Consumer Responsibility",
-    "section": "C",
-    "sub_section": None,
-    "principle": "Principle 9",
-    "description": "Corrective Actions",
-    "schema_path": "section_c.principle_9.Q6_P9"
-  }
-}
+from utils.lazyData import LazyMapping, load_json_data
+
+# Question ID -> report schema path, module and section metadata.
+# The table lives in data/question_mappings.json and is parsed on first access, not at import.
+QUESTION_MAPPINGS = LazyMapping(lambda: load_json_data("question_mappings.json"))
@@ -1,27 +1,42 @@
-from typing import Dict
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from typing import Dict, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
 from auth import get_current_user
-from models.auditModel import AuditLog, ActionLog
-from services.auditServices import get_audit_log_service, log_action_service  # You will implement this
+from models.auditModel import AuditLogPage, ActionLog
+from services.auditServices import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, get_audit_log_service, log_action_service
 from logging import getLogger
 
 logger = getLogger(__name__)
 
 router = APIRouter(prefix="/audit", tags=["Audit"])
 
-@router.get("/", response_model=AuditLog)
-async def get_audit_log(current_user: Dict = Depends(get_current_user)):
+@router.get("/", response_model=AuditLogPage)
+async def get_audit_log(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    action: Optional[str] = None,
+    user_id: Optional[str] = None,
+    performed_after: Optional[datetime] = None,
+    performed_before: Optional[datetime] = None,
+    current_user: Dict = Depends(get_current_user)
+):
     """
-    Fetch audit log for the current user's company, plant, and financial year.
+    Fetch one page of the audit log for the current user's company, plant, and financial year.
 
     Args:
+        limit: Page size.
+        cursor: `next_cursor` from the previous page.
+        action: Filter by action name.
+        user_id: Filter by the user who performed the action.
+        performed_after: Only actions at or after this time.
+        performed_before: Only actions before this time.
         current_user: User info including company_id, plant_id, financial_year, user_id, user_role.
 
     Returns:
-        AuditLog: Audit log data.
+        AuditLogPage: Actions newest first plus the cursor for the next page.
 
     Raises:
-        HTTPException: If required fields are missing or audit log is not found.
+        HTTPException: If required fields are missing or the cursor is invalid.
     """
     company_id = current_user["company_id"]
     plant_id = current_user["plant_id"]
@@ -33,15 +48,17 @@ async def get_audit_log(current_user: Dict = Depends(get_current_user)):
 
     try:
         logger.debug(f"Fetching audit log for company_id={company_id}, plant_id={plant_id}, financial_year={financial_year}")
-        result = await get_audit_log_service(
+        return await get_audit_log_service(
             company_id=company_id,
             plant_id=plant_id,
-            financial_year=financial_year.replace("-", "_")  # Convert to MongoDB format
+            financial_year=financial_year.replace("-", "_"),  # Convert to MongoDB format
+            limit=limit,
+            cursor=cursor,
+            action=action,
+            user_id=user_id,
+            performed_after=performed_after,
+            performed_before=performed_before
         )
-        if not result:
-            logger.warning(f"No audit log found for company_id={company_id}, plant_id={plant_id}, financial_year={financial_year}")
-            raise HTTPException(status_code=404, detail="Audit log not found")
-        return result
     except HTTPException as e:
         raise
     except Exception as e:
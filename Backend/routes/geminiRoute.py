@@ -3,8 +3,8 @@ from fastapi import APIRouter, HTTPException
 from typing import Optional, Dict, Any
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from datetime import datetime
 from services.gemini_services import GeminiService
+from utils.streamRegistry import stream_registry
 import logging
 
 # Configure logging
@@ -18,9 +18,6 @@ router = APIRouter(
 # Initialize Gemini service
 gemini_service = GeminiService()
 
-# Store active streams (shared across all streaming routes)
-active_streams = {}
-
 class MessageRequest(BaseModel):
     message: str
     context: Optional[Dict[Any, Any]] = None
@@ -49,14 +46,11 @@ async def generate_text(request: MessageRequest):
 @router.post("/messages/stream")
 async def create_stream(request: StreamRequest):
     try:
-        # Create a unique stream ID
-        stream_id = datetime.now().strftime("%Y%m%d%H%M%S") + str(len(active_streams))
-        
-        # Store stream context
-        active_streams[stream_id] = {
+        # Store stream context under a unique, expiring stream ID
+        stream_id = await stream_registry.create({
             "message": request.message,
             "context": request.context
-        }
+        })
         
         return {"streamId": stream_id}
     except Exception as e:
@@ -65,10 +59,9 @@ async def create_stream(request: StreamRequest):
 
 @router.get("/messages/stream/{stream_id}")
 async def get_stream(stream_id: str):
-    if stream_id not in active_streams:
+    stream_data = await stream_registry.get(stream_id)
+    if stream_data is None:
         raise HTTPException(status_code=404, detail="Stream not found")
-
-    stream_data = active_streams[stream_id]
     prompt = gemini_service.create_prompt_with_context(
         stream_data["message"], 
         stream_data["context"]
@@ -76,21 +69,18 @@ async def get_stream(stream_id: str):
 
     async def stream_response():
         try:
-            stream = await gemini_service.generate_content_stream(prompt)
-            
-            async for chunk in stream:
-                if chunk.text:
-                    logger.info(f"Streaming chunk for {stream_id}: {chunk.text}")
-                    yield f"data: {chunk.text}\n\n"
+            async for text in gemini_service.stream_text(prompt):
+                logger.info(f"Streaming chunk for {stream_id}: {text}")
+                yield f"data: {text}\n\n"
             
             logger.info(f"Stream {stream_id} complete")
             yield "event: complete\ndata: \n\n"
-            del active_streams[stream_id]
+            await stream_registry.discard(stream_id)
             
         except Exception as e:
             logger.error(f"Streaming error for {stream_id}: {str(e)}")
             yield f"error: {str(e)}\n\n"
-            del active_streams[stream_id]
+            await stream_registry.discard(stream_id)
 
     return StreamingResponse(
         stream_response(),
@@ -119,39 +109,34 @@ async def generate_stream_from_first(request: StreamRequest):
         logger.error("AI service unavailable: API key missing or invalid")
         raise HTTPException(status_code=500, detail="AI service unavailable")
 
-    stream_id = datetime.now().strftime("%Y%m%d%H%M%S") + str(len(active_streams))
-    active_streams[stream_id] = {
+    stream_id = await stream_registry.create({
         "message": request.message,
         "context": request.context
-    }
+    })
     
     return {"streamId": stream_id}
 
 @router.get("/generate_stream/{stream_id}")
 async def get_stream_from_first(stream_id: str):
-    if stream_id not in active_streams:
+    stream_data = await stream_registry.get(stream_id)
+    if stream_data is None:
         raise HTTPException(status_code=404, detail="Stream not found")
-
-    stream_data = active_streams[stream_id]
     prompt = gemini_service.create_prompt_with_context(stream_data["message"], stream_data["context"])
 
     async def stream_response():
         try:
-            stream = await gemini_service.generate_content_stream(prompt)
-            
-            async for chunk in stream:
-                if chunk.text:
-                    logger.info(f"Streaming chunk for {stream_id}: {chunk.text}")
-                    yield f"data: {chunk.text}\n\n"
+            async for text in gemini_service.stream_text(prompt):
+                logger.info(f"Streaming chunk for {stream_id}: {text}")
+                yield f"data: {text}\n\n"
             
             logger.info(f"Stream {stream_id} complete")
             yield "event: complete\ndata: \n\n"
-            del active_streams[stream_id]
+            await stream_registry.discard(stream_id)
             
         except Exception as e:
             logger.error(f"Streaming error for {stream_id}: {str(e)}")
             yield f"error: {str(e)}\n\n"
-            del active_streams[stream_id]
+            await stream_registry.discard(stream_id)
 
     return StreamingResponse(
         stream_response(),
@@ -169,14 +154,11 @@ async def create_brsr_stream(request: BRSRStreamRequest):
         raise HTTPException(status_code=500, detail="AI service unavailable")
 
     try:
-        # Create a unique stream ID
-        stream_id = datetime.now().strftime("%Y%m%d%H%M%S") + str(len(active_streams))
-        
-        # Store BRSR stream data
-        active_streams[stream_id] = {
+        # Store BRSR stream data under a unique, expiring stream ID
+        stream_id = await stream_registry.create({
             "question": request.question,
             "response": request.response
-        }
+        })
         
         logger.info(f"Created BRSR stream with ID: {stream_id}")
         return {"streamId": stream_id}
@@ -186,11 +168,10 @@ async def create_brsr_stream(request: BRSRStreamRequest):
 
 @router.get("/brsr/improve/stream/{stream_id}")
 async def get_brsr_stream(stream_id: str):
-    if stream_id not in active_streams:
+    stream_data = await stream_registry.get(stream_id)
+    if stream_data is None:
         raise HTTPException(status_code=404, detail="Stream not found")
 
-    stream_data = active_streams[stream_id]
-
     async def stream_response():
         try:
             # Stream the improved BRSR response
@@ -203,12 +184,12 @@ async def get_brsr_stream(stream_id: str):
             
             logger.info(f"BRSR stream {stream_id} complete")
             yield "event: complete\ndata: \n\n"
-            del active_streams[stream_id]
+            await stream_registry.discard(stream_id)
             
         except Exception as e:
             logger.error(f"Streaming error for BRSR stream {stream_id}: {str(e)}")
             yield f"error: {str(e)}\n\n"
-            del active_streams[stream_id]
+            await stream_registry.discard(stream_id)
 
     return StreamingResponse(
         stream_response(),
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, EmailStr
-from passlib.context import CryptContext
 import logging
 from typing import List, Optional, Dict, Any
 from bson import ObjectId
 from utils.jwt_handler import create_access_token
-from database import get_auth_users_collection, get_plants_employees_collection
+from utils.passwordHasher import verify_password
+from database import get_auth_users_collection
+from services.credentialService import PLANT_MANAGER, find_credential
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -13,12 +14,8 @@ logging.basicConfig(level=logging.INFO)
 
 router = APIRouter(prefix="/users", tags=["users"])
 
-# Initialize password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # Get database collections
 auth_users_collection = get_auth_users_collection()
-plant_employee_collection = get_plants_employees_collection()
 
 # Request model for login
 class LoginRequest(BaseModel):
@@ -50,12 +47,6 @@ async def login_user(login_data: LoginRequest):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Internal server error: Database configuration issue"
             )
-        if plant_employee_collection is None:
-            logger.error("Database collection 'plant_employee' is not initialized")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Internal server error: Database configuration issue"
-            )
 
         # Try authenticating as company admin in auth_users
         user: Optional[Dict[str, Any]] = await auth_users_collection.find_one({"email": login_data.email.lower()})
@@ -77,7 +68,7 @@ async def login_user(login_data: LoginRequest):
                     detail="Internal server error: User data corrupted"
                 )
 
-            if not pwd_context.verify(login_data.password, password_hash):
+            if not await verify_password(login_data.password, password_hash):
                 logger.warning(f"Invalid password attempt for admin email: {login_data.email}")
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
@@ -106,116 +97,52 @@ async def login_user(login_data: LoginRequest):
             logger.info(f"Admin logged in: user_id={user_id}, user_role={user_role}, company_id={company_id}")
 
         else:
-            # Try authenticating as plant manager or employee in plant_employee
-            pipeline = [
-                {
-                    "$match": {
-                        "$or": [
-                            {"plant_manager.contact_email": login_data.email.lower()},
-                            {"employees.email": login_data.email.lower()}
-                        ]
-                    }
-                },
-                {
-                    "$project": {
-                        "company_id": 1,
-                        "plant_id": 1,
-                        "financial_year": 1,
-                        "plant_manager": 1,
-                        "employees": 1
-                    }
-                }
-            ]
-            result = await plant_employee_collection.aggregate(pipeline).to_list(length=1)
-            if not result:
+            # Try authenticating as plant manager or employee via the indexed credential lookup
+            credential = await find_credential(login_data.email)
+            if not credential:
                 logger.warning(f"Login attempt with non-existent email: {login_data.email}")
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid email or password"
                 )
 
-            data = result[0]
-            company_id = data["company_id"]
-            plant_id = data["plant_id"]
-            financial_year = data.get("financial_year", "2023-2024")
-
-            # Check if the user is the plant manager
-            if data.get("plant_manager") and data["plant_manager"].get("contact_email") == login_data.email.lower():
-                plant_manager = data["plant_manager"]
-                password_hash = plant_manager.get("password")
-                if not password_hash:
-                    logger.error(f"Plant manager with email {login_data.email} has missing password field")
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail="Internal server error: Plant manager data corrupted"
-                    )
-
-                if not pwd_context.verify(login_data.password, password_hash):
-                    logger.warning(f"Invalid password attempt for plant manager email: {login_data.email}")
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="Invalid email or password"
-                    )
-
-                # Validate required fields
-                required_fields = ["employee_id", "user_role", "contact_email", "name"]
-                missing_fields = [field for field in required_fields if field not in plant_manager or plant_manager[field] is None]
-                if missing_fields:
-                    logger.error(f"Missing required fields for plant manager email {login_data.email}: {missing_fields}")
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail=f"Plant manager data incomplete: missing {', '.join(missing_fields)}"
-                    )
-
-                user_id = plant_manager["employee_id"]
-                user_role = [plant_manager["user_role"]]  # Convert to list for consistency
-                user_name = plant_manager["name"]
-                email = plant_manager["contact_email"]
-
-                logger.info(f"Plant manager logged in: user_id={user_id}, user_role={user_role}, company_id={company_id}, plant_id={plant_id}")
-
-            else:
-                # Check employees array
-                employee = next((emp for emp in data.get("employees", []) if emp["email"] == login_data.email.lower()), None)
-                if not employee:
-                    logger.warning(f"Login attempt with non-existent employee email: {login_data.email}")
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="Invalid email or password"
-                    )
-
-                # Verify password
-                password_hash = employee.get("password")
-                if not password_hash:
-                    logger.error(f"Employee with email {login_data.email} has missing password field")
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail="Internal server error: Employee data corrupted"
-                    )
-
-                if not pwd_context.verify(login_data.password, password_hash):
-                    logger.warning(f"Invalid password attempt for employee email: {login_data.email}")
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="Invalid email or password"
-                    )
-
-                # Validate required fields
-                required_fields = ["employee_id", "user_role", "email", "name"]
-                missing_fields = [field for field in required_fields if field not in employee or employee[field] is None]
-                if missing_fields:
-                    logger.error(f"Missing required fields for employee email {login_data.email}: {missing_fields}")
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail=f"Employee data incomplete: missing {', '.join(missing_fields)}"
-                    )
-
-                user_id = employee["employee_id"]
-                user_role = employee["user_role"]
-                user_name = employee["name"]
-                email = employee["email"]
-
-                logger.info(f"Employee logged in: user_id={user_id}, user_role={user_role}, company_id={company_id}, plant_id={plant_id}")
+            account_label = "Plant manager" if credential.get("account_type") == PLANT_MANAGER else "Employee"
+            company_id = credential["company_id"]
+            plant_id = credential["plant_id"]
+            financial_year = credential.get("financial_year") or "2023-2024"
+
+            # Verify password
+            password_hash = credential.get("password")
+            if not password_hash:
+                logger.error(f"{account_label} with email {login_data.email} has missing password field")
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Internal server error: {account_label} data corrupted"
+                )
+
+            if not await verify_password(login_data.password, password_hash):
+                logger.warning(f"Invalid password attempt for {account_label.lower()} email: {login_data.email}")
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid email or password"
+                )
+
+            # Validate required fields
+            required_fields = ["user_id", "user_role", "email", "name"]
+            missing_fields = [field for field in required_fields if field not in credential or credential[field] is None]
+            if missing_fields:
+                logger.error(f"Missing required fields for {account_label.lower()} email {login_data.email}: {missing_fields}")
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"{account_label} data incomplete: missing {', '.join(missing_fields)}"
+                )
+
+            user_id = credential["user_id"]
+            user_role = credential["user_role"]
+            user_name = credential["name"]
+            email = credential["email"]
+
+            logger.info(f"{account_label} logged in: user_id={user_id}, user_role={user_role}, company_id={company_id}, plant_id={plant_id}")
 
         # Generate JWT with user details
         token_data = {
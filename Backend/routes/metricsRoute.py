@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends
+from auth import require_company_level_admin
+from services.auditQueue import audit_queue
+from services.gemini_services import get_gemini_stats
+from services.moduleService import module_cache
+from services.progressJob import progress_job
+from utils.passwordHasher import get_password_hasher_stats
+from utils.responseCache import gemini_response_cache
+from utils.streamRegistry import stream_registry
+
+# Internal pool, queue, cache and stream-session counters: company admins only
+router = APIRouter(prefix="/metrics", tags=["Metrics"], dependencies=[Depends(require_company_level_admin)])
+
+@router.get("/")
+async def get_metrics():
+    """
+    Return in-process counters for this worker's pools, queues and caches.
+    """
+    return {
+        "password_hashing": get_password_hasher_stats(),
+        "audit_queue": audit_queue.stats(),
+        "progress_job": progress_job.stats(),
+        "gemini": get_gemini_stats(),
+        "stream_sessions": stream_registry.stats(),
+        "gemini_cache": gemini_response_cache.stats() if gemini_response_cache else None,
+        "module_cache": module_cache.stats()
+    }
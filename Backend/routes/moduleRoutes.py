@@ -4,6 +4,7 @@ from models.module_model import Module, SubModule, QuestionCategory, Question, M
 from services.moduleService import (
     get_all_modules_service,
     get_module_by_id,
+    get_modules_by_ids_service,
     create_module_service,
     update_module_service,
     get_submodule_by_id_service,
@@ -17,6 +18,7 @@ from services.moduleService import (
 )
 from pydantic import BaseModel
 from auth import get_current_user
+from utils.helpers import serialize_mongo_document
 import uuid
 from datetime import datetime
 
@@ -205,16 +207,19 @@ async def get_module_names(module_ids: List[str], current_user: Dict = Depends(g
     This endpoint is specifically for the sidebar navigation.
     """
     try:
-        module_names = []
-        for module_id in module_ids:
-            module = await get_module_by_id(module_id)
-            if module:
-                module_names.append({
-                    "id": module_id,
-                    "name": module.get("module_name", "Unknown Module"),
-                    "icon": module.get("icon", "default"),  # Optional: for sidebar icons
-                    "route": f"/module/{module_id}"  # Frontend routing path
-                })
+        modules = await get_modules_by_ids_service(
+            module_ids,
+            projection={"_id": 0, "id": 1, "module_name": 1, "icon": 1}
+        )
+        module_names = [
+            {
+                "id": module["id"],
+                "name": module.get("module_name", "Unknown Module"),
+                "icon": module.get("icon", "default"),  # Optional: for sidebar icons
+                "route": f"/module/{module['id']}"  # Frontend routing path
+            }
+            for module in modules
+        ]
         
         return {
             "modules": module_names
@@ -232,43 +237,12 @@ async def get_modules_by_ids(module_ids: List[str], current_user: Dict = Depends
     This endpoint returns full module data for the sidebar and future use.
     """
     try:
-        modules_data = []
-        for module_id in module_ids:
-            module = await get_module_by_id(module_id)
-            if module and isinstance(module, dict):
-                # Convert ObjectId to string
-                if '_id' in module:
-                    module['_id'] = str(module['_id'])
-                
-                # Handle nested ObjectIds in submodules
-                if 'submodules' in module:
-                    for submodule in module['submodules']:
-                        if '_id' in submodule:
-                            submodule['_id'] = str(submodule['_id'])
-                        # Handle nested categories
-                        if 'categories' in submodule:
-                            for category in submodule['categories']:
-                                if '_id' in category:
-                                    category['_id'] = str(category['_id'])
-                                # Handle nested questions
-                                if 'questions' in category:
-                                    for question in category['questions']:
-                                        if '_id' in question:
-                                            question['_id'] = str(question['_id'])
-
-                # Handle datetime serialization
-                if 'created_at' in module:
-                    module['created_at'] = module['created_at'].isoformat() if module['created_at'] else None
-                if 'updated_at' in module:
-                    module['updated_at'] = module['updated_at'].isoformat() if module['updated_at'] else None
-                
-                modules_data.append(module)
-        
+        modules = await get_modules_by_ids_service(module_ids)
         return {
-            "modules": modules_data
+            "modules": serialize_mongo_document(modules)
         }
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error fetching module details: {str(e)}"
-        ) 
\ No newline at end of file
+        )
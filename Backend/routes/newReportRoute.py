@@ -1,12 +1,16 @@
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, File, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from typing import Dict, List, Optional
 from models.auditModel import ActionLog
-from models.newReportModel import Report, CreateReportRequest, QuestionUpdate
+from models.newReportModel import Report, CreateReportRequest, QuestionUpdate, ImportResult
 from services.auditServices import log_action_service
 from services.newReportService import create_report, get_report, update_report, fetch_question_responses
+from services.reportExportService import EXPORT_MEDIA_TYPES, export_reports
+from services.reportImportService import import_report_responses
+from utils.config import settings
 from pydantic import ValidationError, BaseModel
-from auth import get_current_user
+from auth import get_current_user, require_company_level_admin
 
 router = APIRouter()
 
@@ -125,6 +129,81 @@ async def update_report_endpoint(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update report: {str(e)}")
 
+@router.post("/company/{company_id}/reportsNew/import", response_model=ImportResult)
+async def import_report_responses_endpoint(
+    company_id: str,
+    file: UploadFile = File(...),
+    current_user: Dict[str, str] = Depends(require_company_level_admin)
+):
+    """
+    Bulk import report responses for any of the company's plants and years from a CSV or XLSX file.
+
+    Args:
+        company_id: ID of the company from URL; rows for other companies are rejected.
+        file: Spreadsheet with company_id, plant_id, financial_year, question_id and response columns.
+        current_user: Company admin info from JWT token.
+
+    Returns:
+        ImportResult with row counts and a per-row error report.
+    """
+    if current_user.get("company_id") != company_id:
+        raise HTTPException(status_code=403, detail=f"Not authorized to import reports for company {company_id}")
+    try:
+        return await import_report_responses(
+            file.file,
+            file.filename,
+            user_id=current_user.get("user_id"),
+            company_id=company_id
+        )
+    finally:
+        await file.close()
+
+@router.get("/company/{company_id}/reportsNew/export")
+async def export_reports_endpoint(
+    company_id: str,
+    format: str = Query("ndjson", description="ndjson, csv or parquet"),
+    source: str = Query("new_report", description="new_report or reports"),
+    financial_year: Optional[str] = None,
+    plant_id: Optional[List[str]] = Query(None),
+    question_ids: Optional[List[str]] = Query(None),
+    batch_size: int = Query(settings.REPORT_EXPORT_BATCH_SIZE, ge=1, le=settings.REPORT_EXPORT_MAX_BATCH_SIZE),
+    current_user: Dict[str, str] = Depends(require_company_level_admin)
+):
+    """
+    Stream all reports of a company across plants and years with chunked transfer encoding.
+
+    Args:
+        company_id: ID of the company from URL.
+        format: Output format.
+        source: Collection to export from.
+        financial_year: Optional financial year filter.
+        plant_id: Optional plant filter; may be repeated.
+        question_ids: Optional question IDs to export; may be repeated.
+        batch_size: Reports per cursor batch and per streamed chunk.
+        current_user: Company admin info from JWT token.
+
+    Returns:
+        StreamingResponse with the encoded reports.
+    """
+    if current_user.get("company_id") != company_id:
+        raise HTTPException(status_code=403, detail=f"Not authorized to export reports for company {company_id}")
+
+    chunks = await export_reports(
+        company_id,
+        export_format=format,
+        source=source,
+        financial_year=financial_year,
+        plant_ids=plant_id,
+        question_ids=question_ids,
+        batch_size=batch_size
+    )
+    filename = f"{company_id}_{source}.{format}"
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @router.post("/questionResponses", response_model=Dict[str, Dict])
 async def fetch_question_responses_endpoint(
     request: QuestionIdsRequest,
@@ -1,11 +1,15 @@
-from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends, status
-from typing import List, Dict
-
-from flask import app
-from models.notificationsModal import Notification, NotificationCollection
-from pydantic import Field, ValidationError, BaseModel
-from database import notfications_collection 
+from fastapi import APIRouter, HTTPException, Depends, Query, status
+from typing import List, Optional
+
+from models.notificationsModal import NotificationPage
+from pydantic import BaseModel
+from services.notificationService import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    create_notification_service,
+    get_notifications_service,
+    mark_notifications_read_service
+)
 
 from auth import get_current_user
 
@@ -16,114 +20,57 @@ class NotificationCreate(BaseModel):
     description: str
     recipients: List[str]
 
+class NotificationRead(BaseModel):
+    notification_ids: Optional[List[str]] = None
+
+
+def _inbox_owner(current_user: dict):
+    # Extract details from token
+    company_id = current_user.get("company_id")
+    plant_id = current_user.get("plant_id")
+    user_id = current_user.get("user_id")
+
+    if not all([company_id, plant_id, user_id]):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token: missing required fields"
+        )
+    return company_id, plant_id, user_id
+
 # API endpoint to post a notification
 @router.post("/", response_model=dict)
 async def create_notification(
     notification_data: NotificationCreate,
     current_user: dict = Depends(get_current_user)
 ):
-    try:
-        # Extract details from token
-        company_id = current_user.get("company_id")
-        plant_id = current_user.get("plant_id")
-        sender_id = current_user.get("user_id")
-
-        if not all([company_id, plant_id, sender_id]):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token: missing required fields"
-            )
-
-        # Assert types to satisfy Pylance
-        assert isinstance(company_id, str), "company_id must be a string"
-        assert isinstance(plant_id, str), "plant_id must be a string"
-        assert isinstance(sender_id, str), "sender_id must be a string"
-
-        # Create new notification as a Notification object
-        new_notification = Notification(
-            sender=sender_id,
-            recipients=notification_data.recipients,
-            title=notification_data.title,
-            description=notification_data.description
-        )
-
-        # Find existing document
-        existing_doc = await notfications_collection.find_one({
-            "company_id": company_id,
-            "plant_id": plant_id
-        })
-
-        if existing_doc:
-            # Append new notification (as dict) to existing notifications list
-            existing_doc["notifications"].append(new_notification.dict(by_alias=True))
-
-            # Update the document
-            await notfications_collection.update_one(
-                {"company_id": company_id, "plant_id": plant_id},
-                {
-                    "$set": {
-                        "notifications": existing_doc["notifications"],
-                        "updated_at": datetime.utcnow()
-                    }
-                }
-            )
-        else:
-            # Create a new document
-            new_doc = NotificationCollection(
-                company_id=company_id,
-                plant_id=plant_id,
-                notifications=[new_notification],
-                updated_at=datetime.utcnow()
-            ).dict(by_alias=True)
-            await notfications_collection.insert_one(new_doc)
-
-        return {"message": "Notification created successfully", "notification_id": new_notification.notification_id}
-
-    except ValidationError as ve:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"Invalid notification data: {str(ve)}"
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create notification: {str(e)}"
-        )
+    company_id, plant_id, sender_id = _inbox_owner(current_user)
+    notification_id = await create_notification_service(
+        company_id=company_id,
+        plant_id=plant_id,
+        sender_id=sender_id,
+        title=notification_data.title,
+        description=notification_data.description,
+        recipients=notification_data.recipients
+    )
+    return {"message": "Notification created successfully", "notification_id": notification_id}
 
 # API endpoint to get notifications
-@router.get("/", response_model=Dict)
-async def get_notifications(current_user: dict = Depends(get_current_user)):
-    try:
-        # Extract details from token
-        company_id = current_user.get("company_id")
-        plant_id = current_user.get("plant_id")
-        user_id = current_user.get("user_id")
-
-        if not all([company_id, plant_id, user_id]):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token: missing required fields"
-            )
-
-        # Find notifications for the company and plant
-        notifications_doc = await notfications_collection.find_one({
-            "company_id": company_id,
-            "plant_id": plant_id
-        })
-
-        if not notifications_doc:
-            return {"notifications": []}
-
-        # Filter notifications where the user is a recipient
-        user_notifications = [
-            notification for notification in notifications_doc["notifications"]
-            if user_id in notification["recipients"]
-        ]
-
-        return {"notifications": user_notifications}
+@router.get("/", response_model=NotificationPage)
+async def get_notifications(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    unread_only: bool = Query(False),
+    current_user: dict = Depends(get_current_user)
+):
+    company_id, plant_id, user_id = _inbox_owner(current_user)
+    return await get_notifications_service(company_id, plant_id, user_id, limit, cursor, unread_only)
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch notifications: {str(e)}"
-        )
\ No newline at end of file
+# API endpoint to mark notifications as read
+@router.patch("/read", response_model=dict)
+async def mark_notifications_read(
+    read_data: NotificationRead,
+    current_user: dict = Depends(get_current_user)
+):
+    company_id, plant_id, user_id = _inbox_owner(current_user)
+    updated = await mark_notifications_read_service(company_id, plant_id, user_id, read_data.notification_ids)
+    return {"message": "Notifications marked as read", "updated": updated}
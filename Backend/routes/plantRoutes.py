@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from models.auditModel import ActionLog
 from models.plantEmployeeModel import Employee, EmployeeUpdate, InitializePlantRequest, PlantEmployee, PlantManager, UpdateEmployeeRolesRequest
-from services.auditServices import log_action_service
+from services.auditQueue import enqueue_action_log
 from services.plantService import delete_employee_service, get_all_plant_employees_service, get_section_progress_service, initialize_plant_service, create_employee_service, update_employee_roles_service, update_employee_service
 from auth import get_current_user
 
@@ -90,7 +90,7 @@ async def create_employee(
             performed_at=datetime.utcnow(),
             details=None
 )
-        await log_action_service(current_user["company_id"],current_user["plant_id"],current_user["financial_year"],action_log)
+        await enqueue_action_log(current_user["company_id"],current_user["plant_id"],current_user["financial_year"],action_log)
         return await create_employee_service(
             company_id=current_user["company_id"],
             plant_id=current_user["plant_id"],
@@ -141,7 +141,7 @@ async def update_employee_roles(
             performed_at=datetime.utcnow(),
             details=None
 )
-        await log_action_service(current_user["company_id"],current_user["plant_id"],current_user["financial_year"],action_log)
+        await enqueue_action_log(current_user["company_id"],current_user["plant_id"],current_user["financial_year"],action_log)
         
         return await update_employee_roles_service(
             company_id=current_user["company_id"],
@@ -175,7 +175,7 @@ async def update_employee(
             performed_at=datetime.utcnow(),
             details=None
 )
-        await log_action_service(current_user["company_id"],current_user["plant_id"],current_user["financial_year"],action_log)
+        await enqueue_action_log(current_user["company_id"],current_user["plant_id"],current_user["financial_year"],action_log)
         
         return await update_employee_service(
             company_id=current_user["company_id"],
@@ -270,7 +270,7 @@ async def delete_employee(
             details=None
 )
         
-        await log_action_service(current_user["company_id"],current_user["plant_id"],current_user["financial_year"],action_log)
+        await enqueue_action_log(current_user["company_id"],current_user["plant_id"],current_user["financial_year"],action_log)
         # Log audit action
         return {"detail": "Employee deleted successfully"}
     except HTTPException as e:
@@ -1,27 +1,48 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
-from models.module_model import Question
-from database import landing_flow_questions_collection
+from fastapi import APIRouter, HTTPException, Query
+from typing import Any, Dict, List, Optional, Union
+from models.module_model import QuestionPage
+from services.questionCatalogService import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    get_catalogue_questions_service,
+    list_catalogue_questions_service
+)
 
 router = APIRouter()
 
-@router.get("/questions/module/{module_id}", response_model=List[Question])
-async def get_questions_by_module(module_id: str):
+@router.get("/questions/module/{module_id}", response_model=Union[QuestionPage, List[Dict[str, Any]]])
+async def get_questions_by_module(
+    module_id: str,
+    submodule_id: Optional[str] = None,
+    category_id: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description=f"Page size; pages default to {DEFAULT_PAGE_SIZE}"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[List[str]] = Query(None, description="Only return these question fields")
+):
     """
-    Get all questions for a specific module.
+    Get the questions of a specific module.
+
+    Without `limit` or `cursor` the whole module is returned as a plain list, as before
+    paging was added; passing either returns one QuestionPage at a time.
     
     Args:
         module_id: ID of the module to fetch questions for.
+        submodule_id: Optionally narrow to one submodule.
+        category_id: Optionally narrow to one question category.
+        limit: Maximum number of questions per page.
+        cursor: Cursor from the previous page.
+        fields: Optional field projection; question_id and position are always included.
         
     Returns:
-        List of questions.
+        List of questions, or a QuestionPage with the questions and the next cursor.
     """
     try:
-        # Fetch all questions for the module
-        questions = await landing_flow_questions_collection.find({}).to_list(None)
-        if not questions:
-            return []
-            
-        return questions
+        if limit is None and cursor is None:
+            return await list_catalogue_questions_service(module_id, submodule_id, category_id, fields)
+        return await get_catalogue_questions_service(
+            module_id, submodule_id, category_id, limit or DEFAULT_PAGE_SIZE, cursor, fields
+        )
+    except HTTPException as e:
+        raise e
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch questions: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to fetch questions: {str(e)}")
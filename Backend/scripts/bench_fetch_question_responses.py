@@ -0,0 +1,116 @@
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+
+import bson
+import pytz
+
+# Add parent directory to path to import from Backend
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import client
+from models.tableQuestionResponse import TableQuestionResponse
+from services.newReportService import extract_question_responses, question_responses_projection
+
+# Run against a throwaway database so real reports are never touched
+bench_collection = client["esg_benchmark"]["new_report_reads"]
+
+REPORT_SIZE = 1000
+TABLE_EVERY = 10
+FETCHES = 500
+QUESTIONS_PER_FETCH = 5
+
+REPORT_KEY = {"company_id": "bench_company", "plant_id": "bench_plant", "financial_year": "2024-2025"}
+
+
+def question_id(i: int) -> str:
+    # Every TABLE_EVERY-th question is a table question (see is_table_question)
+    return f"TBL_Q{i}_BENCH" if i % TABLE_EVERY == 0 else f"Q{i}_BENCH"
+
+
+def make_response(i: int) -> dict:
+    if i % TABLE_EVERY == 0:
+        return TableQuestionResponse(
+            question_id=question_id(i),
+            columns=[{"col_id": f"c{c}", "label": f"Column {c}"} for c in range(4)],
+            rows=[
+                {"row_id": f"r{r}", "cells": [{"row_id": f"r{r}", "col_id": f"c{c}", "value": float(r * c)} for c in range(4)]}
+                for r in range(10)
+            ]
+        ).dict()
+    return {
+        "string_value": f"Answer {i} " + "lorem ipsum " * 20,
+        "decimal_value": float(i),
+        "bool_value": i % 2 == 0,
+        "link": None,
+        "note": f"Note for question {i}"
+    }
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def seed_report():
+    await bench_collection.delete_many({})
+    await bench_collection.insert_one({
+        **REPORT_KEY,
+        "responses": {question_id(i): make_response(i) for i in range(REPORT_SIZE)},
+        "created_at": datetime.now(pytz.UTC),
+        "last_modified_at": datetime.now(pytz.UTC),
+        "created_by": "bench"
+    })
+
+
+async def legacy_fetch(question_ids: list) -> int:
+    """Previous path: load the whole report and re-validate every table answer on each read."""
+    report = await bench_collection.find_one(REPORT_KEY)
+    responses = report.get("responses", {})
+    for qid in question_ids:
+        if qid.startswith("TBL_"):
+            TableQuestionResponse(**responses[qid]).dict()
+    return len(bson.encode(report))
+
+
+async def projected_fetch(question_ids: list) -> int:
+    """New path: project responses.<qid> server-side; tables are validated once per revision."""
+    report = await bench_collection.find_one(REPORT_KEY, question_responses_projection(question_ids))
+    extract_question_responses(report, question_ids)
+    return len(bson.encode(report))
+
+
+async def run_case(fetch) -> dict:
+    latencies = []
+    payloads = []
+    for n in range(FETCHES):
+        # Rotate through the report so each fetch includes one table question
+        start_index = (n * QUESTIONS_PER_FETCH * TABLE_EVERY) % REPORT_SIZE
+        question_ids = [question_id(start_index + k) for k in range(QUESTIONS_PER_FETCH)]
+        start = time.perf_counter()
+        payloads.append(await fetch(question_ids))
+        latencies.append((time.perf_counter() - start) * 1000)
+    return {
+        "p50_ms": percentile(latencies, 50),
+        "p99_ms": percentile(latencies, 99),
+        "avg_bytes": sum(payloads) / len(payloads)
+    }
+
+
+async def main():
+    await seed_report()
+    print(f"Fetching {QUESTIONS_PER_FETCH} of {REPORT_SIZE} questions, {FETCHES} times")
+    print(f"{'path':>9} | {'p50 ms':>8} | {'p99 ms':>8} | {'bytes/fetch':>11}")
+    try:
+        for name, fetch in (("legacy", legacy_fetch), ("projected", projected_fetch)):
+            stats = await run_case(fetch)
+            print(f"{name:>9} | {stats['p50_ms']:>8.2f} | {stats['p99_ms']:>8.2f} | {stats['avg_bytes']:>11.0f}")
+    finally:
+        await bench_collection.drop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
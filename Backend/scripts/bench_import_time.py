@@ -0,0 +1,81 @@
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+# Measures worker cold start with `python -X importtime -c "import main"` and fails when it
+# regresses past a threshold, or when modules meant to load lazily are imported at boot:
+#   python scripts/bench_import_time.py --runs 5 --max-ms 1500
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Heavy modules that must only be imported on first use, never by `import main`
+LAZY_MODULES = ("google.genai", "pyarrow", "openpyxl")
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure_once(target: str):
+    """
+    Import `target` in a fresh interpreter.
+
+    Returns:
+        (cumulative microseconds for `target`, {module: cumulative microseconds}).
+    """
+    env = dict(os.environ)
+    env.setdefault("GEMINI_API_KEY", "import-time-benchmark")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr[-2000:])
+        raise SystemExit(f"import {target} failed")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            modules[match.group(4)] = int(match.group(2))
+    return modules.get(target, 0), modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker cold-start import time benchmark")
+    parser.add_argument("--target", default="main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=1500.0, help="fail when the median import exceeds this")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    # The first run writes bytecode and warms the filesystem cache, like a worker after deploy
+    measure_once(args.target)
+    samples = []
+    modules = {}
+    for _ in range(args.runs):
+        total_us, modules = measure_once(args.target)
+        samples.append(total_us / 1000)
+
+    median_ms = statistics.median(samples)
+    print(f"import {args.target}: median {median_ms:.1f} ms, min {min(samples):.1f} ms over {args.runs} runs")
+    print("Slowest modules (cumulative ms, last run):")
+    for name, cumulative in sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {cumulative / 1000:>8.1f}  {name}")
+
+    failed = False
+    eager = sorted(name for name in modules if any(name == lazy or name.startswith(lazy + ".") for lazy in LAZY_MODULES))
+    if eager:
+        print(f"FAIL: modules meant to load lazily were imported at startup: {', '.join(eager[:10])}")
+        failed = True
+    if median_ms > args.max_ms:
+        print(f"FAIL: median import time {median_ms:.1f} ms exceeds {args.max_ms:.1f} ms")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print("ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+
+import bson
+import pytz
+
+# Add parent directory to path to import from Backend
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import client
+from models.newReportModel import QuestionUpdate
+from services.newReportService import build_responses_delta
+
+# Run against a throwaway database so real reports are never touched
+bench_collection = client["esg_benchmark"]["new_report_writes"]
+
+REPORT_SIZES = [100, 250, 500, 1000]
+PATCHES_PER_SIZE = 200
+QUESTIONS_PER_PATCH = 5
+
+REPORT_KEY = {"company_id": "bench_company", "plant_id": "bench_plant", "financial_year": "2024-2025"}
+
+
+def make_response(i: int) -> dict:
+    return {
+        "string_value": f"Answer {i} " + "lorem ipsum " * 20,
+        "decimal_value": float(i),
+        "bool_value": i % 2 == 0,
+        "link": None,
+        "note": f"Note for question {i}"
+    }
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def seed_report(size: int):
+    await bench_collection.delete_many({})
+    await bench_collection.insert_one({
+        **REPORT_KEY,
+        "responses": {f"Q{i}_BENCH": make_response(i) for i in range(size)},
+        "created_at": datetime.now(pytz.UTC),
+        "created_by": "bench"
+    })
+
+
+async def legacy_write(updates: list) -> int:
+    """Previous path: read the whole report, mutate it, rewrite the full responses map."""
+    report = await bench_collection.find_one(REPORT_KEY)
+    responses = report.get("responses", {})
+    for update in updates:
+        responses[update.question_id] = update.response
+    update_doc = {"$set": {"responses": responses, "last_modified_at": datetime.now(pytz.UTC), "last_modified_by": "bench"}}
+    await bench_collection.update_one(REPORT_KEY, update_doc)
+    return len(bson.encode(update_doc))
+
+
+async def delta_write(updates: list) -> int:
+    """New path: one upsert that only sets the changed responses.<question_id> fields."""
+    now = datetime.now(pytz.UTC)
+    update_doc = {
+        "$set": {**build_responses_delta(updates), "last_modified_at": now, "last_modified_by": "bench"},
+        "$setOnInsert": {"created_at": now, "created_by": "bench"}
+    }
+    await bench_collection.update_one(REPORT_KEY, update_doc, upsert=True)
+    return len(bson.encode(update_doc))
+
+
+async def run_case(size: int, writer) -> dict:
+    await seed_report(size)
+    latencies = []
+    bytes_written = []
+    for n in range(PATCHES_PER_SIZE):
+        updates = [
+            QuestionUpdate(question_id=f"Q{(n * QUESTIONS_PER_PATCH + k) % size}_BENCH", response=make_response(n + k))
+            for k in range(QUESTIONS_PER_PATCH)
+        ]
+        start = time.perf_counter()
+        bytes_written.append(await writer(updates))
+        latencies.append((time.perf_counter() - start) * 1000)
+    return {
+        "p50_ms": percentile(latencies, 50),
+        "p99_ms": percentile(latencies, 99),
+        "avg_bytes": sum(bytes_written) / len(bytes_written)
+    }
+
+
+async def main():
+    print(f"{'questions':>9} | {'path':>6} | {'p50 ms':>8} | {'p99 ms':>8} | {'bytes/write':>11}")
+    try:
+        for size in REPORT_SIZES:
+            for name, writer in (("legacy", legacy_write), ("delta", delta_write)):
+                stats = await run_case(size, writer)
+                print(f"{size:>9} | {name:>6} | {stats['p50_ms']:>8.2f} | {stats['p99_ms']:>8.2f} | {stats['avg_bytes']:>11.0f}")
+    finally:
+        await bench_collection.drop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,124 @@
+import os
+import sys
+import timeit
+
+# Add parent directory to path to import from Backend
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from questionsMapping import QUESTION_MAPPINGS
+from report_init import initialize_report
+from services.reportService import stage_question_update
+from utils.questionIndex import QUESTION_INDEX, get_at_path, set_at_path
+
+ITERATIONS = 2000
+
+Q18A_VALUE = {
+    category: {"male": 10, "female": 8, "other": 1}
+    for category in ("permanent_employees", "non_permanent_employees", "permanent_workers", "contractual_workers")
+}
+
+
+def build_full_report() -> dict:
+    report = initialize_report("bench_company", "bench_plant", "2024_2025", "bench")
+    for compiled in QUESTION_INDEX.values():
+        if compiled.in_report:
+            set_at_path(report, compiled.path, f"answer for {compiled.question_id}")
+    return report
+
+
+def legacy_stage_composite(report: dict, question_id: str, value: dict) -> tuple:
+    """Composite handling as it was before the index: split and walk schema_path per subcomponent."""
+    mapping = QUESTION_MAPPINGS[question_id]
+    update_ops, progress = {}, {}
+    for category, genders in value.items():
+        for gender, sub_value in genders.items():
+            granular_id = f"{question_id}_{category}_{gender}"
+            if granular_id not in mapping["subcomponents"]:
+                raise ValueError(granular_id)
+            granular_mapping = QUESTION_MAPPINGS.get(granular_id)
+            schema_path = granular_mapping["schema_path"]
+            schema_parts = schema_path.split(".")[1:]
+            update_ops[schema_path] = int(sub_value)
+            current_value = report
+            for part in schema_path.split(".")[:-1]:
+                current_value = current_value.get(part, {})
+            previous_value = current_value.get(gender) if isinstance(current_value, dict) else None
+            if previous_value is None:
+                if schema_parts[0] in ("section_a", "section_b", "section_c"):
+                    progress[schema_parts[0]] = 1
+                module = granular_mapping["module"].lower()
+                sub_module = granular_mapping["sub_module"].lower().replace(" ", "_")
+                progress[f"section_progress.modules.{module}.{sub_module}.answered_questions"] = 1
+    return update_ops, progress
+
+
+def indexed_stage_composite(report: dict, question_id: str, value: dict) -> tuple:
+    compiled = QUESTION_INDEX[question_id]
+    update_ops, update_logs = {}, []
+    for category, genders in value.items():
+        for gender, sub_value in genders.items():
+            granular_id = f"{question_id}_{category}_{gender}"
+            if granular_id not in compiled.subcomponents:
+                raise ValueError(granular_id)
+            granular = QUESTION_INDEX[granular_id]
+            update_ops[granular.schema_path] = int(sub_value)
+            stage_question_update(granular, int(sub_value), report, "bench", update_logs)
+    return update_ops, update_logs
+
+
+def legacy_filter_report(report: dict, accessible_questions: list) -> dict:
+    filtered = {"section_a": {}, "section_b": {}, "section_c": {}}
+    for question_id in accessible_questions:
+        if question_id not in QUESTION_MAPPINGS:
+            continue
+        schema_path = QUESTION_MAPPINGS[question_id].get("schema_path")
+        if not schema_path or not schema_path.startswith(("section_a", "section_b", "section_c")):
+            continue
+        current = report
+        path_parts = schema_path.split(".")
+        for part in path_parts[:-1]:
+            current = current.get(part, {})
+            if not isinstance(current, dict):
+                break
+        value = current.get(path_parts[-1]) if isinstance(current, dict) else None
+        if value is not None:
+            target = filtered
+            for part in path_parts[:-1]:
+                target = target.setdefault(part, {})
+            target[path_parts[-1]] = value
+    return filtered
+
+
+def indexed_filter_report(report: dict, accessible_questions: list) -> dict:
+    filtered = {"section_a": {}, "section_b": {}, "section_c": {}}
+    for question_id in accessible_questions:
+        compiled = QUESTION_INDEX.get(question_id)
+        if compiled is None or not compiled.in_report:
+            continue
+        value = get_at_path(report, compiled.path)
+        if value is not None:
+            set_at_path(filtered, compiled.path, value)
+    return filtered
+
+
+def run(label: str, func, *args):
+    seconds = timeit.timeit(lambda: func(*args), number=ITERATIONS)
+    print(f"{label:<32} {seconds / ITERATIONS * 1e6:>10.1f} us/op")
+
+
+def main():
+    empty_report = initialize_report("bench_company", "bench_plant", "2024_2025", "bench")
+    full_report = build_full_report()
+    accessible_questions = list(QUESTION_MAPPINGS)
+
+    print(f"Q18a composite update, 12 subcomponents ({ITERATIONS} iterations)")
+    run("  before (split per request)", legacy_stage_composite, empty_report, "Q18a", Q18A_VALUE)
+    run("  after (compiled index)", indexed_stage_composite, empty_report, "Q18a", Q18A_VALUE)
+
+    print(f"get_report filtering, {len(accessible_questions)} questions ({ITERATIONS} iterations)")
+    run("  before (split per request)", legacy_filter_report, full_report, accessible_questions)
+    run("  after (compiled index)", indexed_filter_report, full_report, accessible_questions)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import argparse
+import asyncio
+import sys
+import os
+
+# Add parent directory to path to import from Backend
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.reportImportService import import_report_responses
+
+# Bulk import report responses from a CSV or XLSX file:
+#   python scripts/import_report_responses.py responses.xlsx --user-id importer --company-id C1
+
+async def main():
+    parser = argparse.ArgumentParser(description="Bulk import report responses from CSV/XLSX")
+    parser.add_argument("path")
+    parser.add_argument("--user-id", default="bulk_import")
+    parser.add_argument("--company-id", help="reject rows for any other company")
+    args = parser.parse_args()
+
+    try:
+        with open(args.path, "rb") as stream:
+            result = await import_report_responses(stream, args.path, args.user_id, args.company_id)
+    except Exception as e:
+        print(f"Error importing {args.path}: {getattr(e, 'detail', str(e))}")
+        sys.exit(1)
+
+    print(f"Processed {result.rows_processed} rows: {result.rows_imported} imported, {result.rows_failed} failed")
+    for error in result.errors:
+        print(f"  row {error.row} ({error.question_id or '-'}): {error.error}")
+    if result.errors_truncated:
+        print("  ... more errors not shown")
+    if result.rows_failed:
+        sys.exit(2)
+
+if __name__ == "__main__":
+    asyncio.run(main())
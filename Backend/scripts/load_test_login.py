@@ -0,0 +1,94 @@
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+# Load test against a running server: fire concurrent logins while probing an unrelated
+# endpoint, and report how much the probe latency degrades while logins are in flight.
+#
+# Example:
+#   python scripts/load_test_login.py --email manager@example.com --password secret \
+#       --company-id C1 --plant-id P1 --financial-year 2024_2025 --admin-token <company admin JWT>
+
+
+async def probe_progress(client: httpx.AsyncClient, args, stop: asyncio.Event, samples: list):
+    url = f"/plants/{args.plant_id}/sectionProgress"
+    params = {"company_id": args.company_id, "plant_id": args.plant_id, "financial_year": args.financial_year}
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get(url, params=params)
+        samples.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(args.probe_interval)
+
+
+async def login(client: httpx.AsyncClient, args, samples: list):
+    start = time.perf_counter()
+    response = await client.post("/users/login", json={"email": args.email, "password": args.password})
+    samples.append((time.perf_counter() - start) * 1000)
+    return response.status_code
+
+
+def summarize(label: str, samples: list):
+    if not samples:
+        print(f"{label:<28} no samples")
+        return
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(0.99 * (len(ordered) - 1)))]
+    print(f"{label:<28} n={len(samples):<5} p50={statistics.median(samples):8.1f} ms  p99={p99:8.1f} ms  max={ordered[-1]:8.1f} ms")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Concurrent login load test")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--company-id", required=True)
+    parser.add_argument("--plant-id", required=True)
+    parser.add_argument("--financial-year", required=True)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--probe-interval", type=float, default=0.02)
+    parser.add_argument("--admin-token", help="company admin JWT, to read the pool counters from /metrics/")
+    args = parser.parse_args()
+
+    limits = httpx.Limits(max_connections=args.concurrency + 5)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60) as client:
+        # Baseline: probe alone
+        baseline, stop = [], asyncio.Event()
+        probe = asyncio.create_task(probe_progress(client, args, stop, baseline))
+        await asyncio.sleep(2)
+        stop.set()
+        await probe
+
+        # Under load: probe while logins run with bounded concurrency
+        under_load, login_samples, stop = [], [], asyncio.Event()
+        probe = asyncio.create_task(probe_progress(client, args, stop, under_load))
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def bounded_login():
+            async with semaphore:
+                return await login(client, args, login_samples)
+
+        start = time.perf_counter()
+        statuses = await asyncio.gather(*[bounded_login() for _ in range(args.logins)])
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await probe
+
+        metrics = None
+        if args.admin_token:
+            response = await client.get("/metrics/", headers={"Authorization": f"Bearer {args.admin_token}"})
+            metrics = response.json() if response.status_code == 200 else None
+
+    print(f"{args.logins} logins in {elapsed:.1f}s ({args.logins / elapsed:.1f}/s), statuses: {sorted(set(statuses))}")
+    summarize("sectionProgress (idle)", baseline)
+    summarize("sectionProgress (logins)", under_load)
+    summarize("login", login_samples)
+    if metrics is not None:
+        print(f"password hashing pool: {metrics.get('password_hashing')}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
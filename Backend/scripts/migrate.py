@@ -0,0 +1,48 @@
+import argparse
+import asyncio
+import sys
+import os
+
+# Add parent directory to path to import from Backend
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.migrations import MIGRATIONS, get_applied_migrations, run_migrations
+
+# Offline data migration runner. Run before (or alongside) deploying a new version:
+#   python scripts/migrate.py --list
+#   python scripts/migrate.py
+#   python scripts/migrate.py --target 0002_rebuild_credentials
+
+
+async def list_migrations():
+    applied = await get_applied_migrations()
+    for migration in MIGRATIONS:
+        record = applied.get(migration.migration_id)
+        status = f"applied {record['applied_at']:%Y-%m-%d %H:%M}" if record else "pending"
+        print(f"{migration.migration_id:<40} {status:<24} {migration.description}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Apply pending data migrations")
+    parser.add_argument("--list", action="store_true", help="show applied and pending migrations")
+    parser.add_argument("--target", help="stop after applying this migration ID")
+    parser.add_argument("--dry-run", action="store_true", help="print pending migrations without applying them")
+    args = parser.parse_args()
+
+    if args.list:
+        await list_migrations()
+        return
+
+    try:
+        ran = await run_migrations(target=args.target, dry_run=args.dry_run)
+    except Exception as e:
+        print(f"Error running migrations: {str(e)}")
+        sys.exit(1)
+
+    if not ran:
+        print("No pending migrations")
+    for migration_id in ran:
+        print(f"{'Pending' if args.dry_run else 'Applied'}: {migration_id}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,22 @@
+import asyncio
+import sys
+import os
+
+# Add parent directory to path to import from Backend
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.auditServices import migrate_embedded_audit_logs
+
+async def migrate_audit_log():
+    """
+    Move embedded audit_collection action arrays into per-action audit_events documents.
+    Safe to re-run.
+    """
+    try:
+        migrated = await migrate_embedded_audit_logs()
+        print(f"Successfully migrated {migrated} audit actions")
+    except Exception as e:
+        print(f"Error migrating audit log: {str(e)}")
+
+if __name__ == "__main__":
+    asyncio.run(migrate_audit_log())
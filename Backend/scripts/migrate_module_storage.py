@@ -0,0 +1,41 @@
+import argparse
+import asyncio
+import sys
+import os
+
+# Add parent directory to path to import from Backend
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import reconcile_indexes
+from services.moduleService import invalidate_module_cache
+from services.moduleStore import embed_module_storage, normalize_module_storage
+
+# Convert module storage before flipping MODULE_STORAGE_MODE, with every worker stopped:
+#   python scripts/migrate_module_storage.py            # embedded -> normalized
+#   python scripts/migrate_module_storage.py --reverse  # normalized -> embedded
+
+async def migrate_module_storage(reverse: bool = False, dry_run: bool = False):
+    """
+    Move module trees between the embedded and normalized layouts. Safe to re-run:
+    modules already in the target layout are skipped.
+    """
+    try:
+        # The child collections need their parent-ID indexes before they are filled
+        await reconcile_indexes()
+        if reverse:
+            total = await embed_module_storage(dry_run=dry_run)
+        else:
+            total = await normalize_module_storage(dry_run=dry_run)
+        if not dry_run:
+            await invalidate_module_cache()
+        action = "Would convert" if dry_run else "Successfully converted"
+        print(f"{action} {total} modules to {'embedded' if reverse else 'normalized'} storage")
+    except Exception as e:
+        print(f"Error migrating module storage: {str(e)}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert module storage between embedded and normalized layouts")
+    parser.add_argument("--reverse", action="store_true", help="fold normalized modules back into embedded documents")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(migrate_module_storage(args.reverse, args.dry_run))
@@ -0,0 +1,22 @@
+import asyncio
+import sys
+import os
+
+# Add parent directory to path to import from Backend
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.notificationService import migrate_embedded_notifications
+
+async def migrate_notifications():
+    """
+    Fan embedded notifications arrays out into per-recipient notification_inbox documents.
+    Safe to re-run.
+    """
+    try:
+        migrated = await migrate_embedded_notifications()
+        print(f"Successfully migrated {migrated} inbox entries")
+    except Exception as e:
+        print(f"Error migrating notifications: {str(e)}")
+
+if __name__ == "__main__":
+    asyncio.run(migrate_notifications())
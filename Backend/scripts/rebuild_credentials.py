@@ -0,0 +1,22 @@
+import asyncio
+import sys
+import os
+
+# Add parent directory to path to import from Backend
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.credentialService import rebuild_all_credentials
+
+async def rebuild_credentials():
+    """
+    Backfill the login credential index from every plants_employees document.
+    Safe to re-run: entries are upserted per account and stale ones removed.
+    """
+    try:
+        total = await rebuild_all_credentials()
+        print(f"Successfully rebuilt {total} credentials")
+    except Exception as e:
+        print(f"Error rebuilding credentials: {str(e)}")
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_credentials())
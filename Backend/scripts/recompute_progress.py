@@ -0,0 +1,28 @@
+import argparse
+import asyncio
+import sys
+import os
+
+# Add parent directory to path to import from Backend
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.progressService import recompute_section_progress
+
+async def recompute_progress(company_id: str = None, plant_id: str = None):
+    """
+    Recompute plant section_progress answered counters from report contents, for one plant
+    or every plant. Safe to re-run: counters are overwritten, never incremented.
+    """
+    try:
+        plant_keys = [(company_id, plant_id)] if company_id and plant_id else None
+        total = await recompute_section_progress(plant_keys)
+        print(f"Successfully recomputed section progress for {total} plants")
+    except Exception as e:
+        print(f"Error recomputing section progress: {str(e)}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute plant section_progress counters")
+    parser.add_argument("--company-id")
+    parser.add_argument("--plant-id")
+    args = parser.parse_args()
+    asyncio.run(recompute_progress(args.company_id, args.plant_id))
@@ -1,5 +1,4 @@
 import asyncio
-import json
 from motor.motor_asyncio import AsyncIOMotorClient
 from datetime import datetime
 import sys
@@ -8,59 +7,35 @@ import os
 # Add parent directory to path to import from Backend
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database import landing_flow_questions_collection
-from models.module_model import Question, QuestionType
+from services.questionCatalogService import CATALOGUE_FILE, load_catalogue_file, sync_catalogue
+from services.roleService import QUESTIONS_VERSION
+from utils.versionedCache import bump_version, get_version
 
 async def sync_questions():
     """
-    Sync questions from the JSON file to MongoDB.
+    Sync questions from the JSON file to MongoDB. Cheap when nothing changed,
+    so it can run on every deploy.
     """
     try:
         # Read questions from JSON file
-        json_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
-                               'data', 'questions.json')
-        
-        print(f"Looking for JSON file at: {json_path}")
-        
-        with open(json_path, 'r') as f:
-            data = json.load(f)
-
-        # Clear existing questions
-        await landing_flow_questions_collection.delete_many({})
-
-        # Extract all questions from the JSON structure
-        all_questions = []
-        for module in data['modules']:
-            for submodule in module['submodules']:
-                for category in submodule['question_categories']:
-                    for q in category['questions']:
-                        # Convert to Question model
-                        question = Question(
-                            question_id=q['question_id'],
-                            question=q['question'],
-                            type=QuestionType.SUBJECTIVE,  # Default to subjective
-                            has_string_value=q.get('has_string_value', False),
-                            has_decimal_value=q.get('has_decimal_value', False),
-                            has_boolean_value=q.get('has_boolean_value', False),
-                            has_link=q.get('has_link', False),
-                            has_note=q.get('has_note', False),
-                            string_value_required=q.get('string_value_required', False),
-                            decimal_value_required=q.get('decimal_value_required', False),
-                            boolean_value_required=q.get('boolean_value_required', False),
-                            link_required=q.get('link_required', False),
-                            note_required=q.get('note_required', False),
-                            tab_id=q.get('tab_id'),
-                            category_id=category['id'],
-                            category_name=category['category_name']
-                        )
-                        all_questions.append(question.dict())
-
-        # Insert all questions
-        if all_questions:
-            result = await landing_flow_questions_collection.insert_many(all_questions)
-            print(f"Successfully synced {len(result.inserted_ids)} questions")
-        else:
-            print("No questions found to sync")
+        print(f"Looking for JSON file at: {CATALOGUE_FILE}")
+        data = load_catalogue_file()
+
+        # Upsert changed questions and delete vanished ones in a single bulk_write
+        counts = await sync_catalogue(data)
+        print(
+            f"Synced questions: {counts['inserted']} inserted, {counts['updated']} updated, "
+            f"{counts['deleted']} deleted, {counts['unchanged']} unchanged"
+        )
+        if not any(counts[key] for key in ("inserted", "updated", "deleted")):
+            # Nothing changed, so downstream caches keyed on the catalogue version stay warm
+            version = await get_version(QUESTIONS_VERSION, max_age=0)
+            print(f"Question catalogue version is still {version}")
+            return
+
+        # Invalidate accessible-question caches in every running worker
+        version = await bump_version(QUESTIONS_VERSION)
+        print(f"Question catalogue version is now {version}")
 
     except Exception as e:
         print(f"Error syncing questions: {str(e)}")
@@ -0,0 +1,142 @@
+import asyncio
+from typing import Dict, List, Optional
+from logging import getLogger
+from pymongo.errors import BulkWriteError
+from database import audit_events_collection
+from models.auditModel import ActionLog
+from services.auditServices import build_audit_event, log_action_service
+from utils.config import settings
+
+logger = getLogger(__name__)
+
+_STOP = object()
+
+
+class AuditQueue:
+    """
+    In-process buffer that batches audit events into `insert_many` calls.
+
+    Requests enqueue and return immediately; a background task flushes when
+    AUDIT_BATCH_SIZE events are buffered or AUDIT_FLUSH_INTERVAL_SECONDS elapse.
+    When the buffer is full, callers wait up to AUDIT_ENQUEUE_TIMEOUT_SECONDS
+    (backpressure) before the event is dropped and counted.
+    """
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.counters = {"queued": 0, "flushed": 0, "dropped": 0, "failed_batches": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=settings.AUDIT_QUEUE_MAX_SIZE)
+        self._task = asyncio.create_task(self._run())
+        logger.info("Audit queue started")
+
+    async def stop(self) -> None:
+        """Flush everything still buffered and stop the background task."""
+        if not self.running:
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        logger.info(f"Audit queue stopped: {self.counters}")
+
+    async def enqueue(
+        self,
+        company_id: str,
+        plant_id: Optional[str],
+        financial_year: str,
+        action_log: ActionLog
+    ) -> None:
+        """
+        Buffer an action for the next batch. Falls back to a direct write when the
+        queue is not running (e.g. in scripts). Never raises on audit failures.
+        """
+        if not self.running:
+            try:
+                await log_action_service(company_id, plant_id, financial_year, action_log)
+            except Exception as e:
+                self.counters["dropped"] += 1
+                logger.error(f"Dropped audit action {action_log.action}: {str(e)}")
+            return
+
+        event = build_audit_event(company_id, plant_id, financial_year, action_log)
+        try:
+            await asyncio.wait_for(self._queue.put(event), timeout=settings.AUDIT_ENQUEUE_TIMEOUT_SECONDS)
+            self.counters["queued"] += 1
+        except asyncio.TimeoutError:
+            self.counters["dropped"] += 1
+            logger.warning(f"Audit queue full, dropped action {action_log.action} for target_id={action_log.target_id}")
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            stopping = item is _STOP
+            batch = [] if stopping else [item]
+            deadline = loop.time() + settings.AUDIT_FLUSH_INTERVAL_SECONDS
+            while not stopping and len(batch) < settings.AUDIT_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            if stopping:
+                # Drain whatever is left so shutdown loses nothing
+                while not self._queue.empty():
+                    item = self._queue.get_nowait()
+                    if item is not _STOP:
+                        batch.append(item)
+                for start in range(0, len(batch), settings.AUDIT_BATCH_SIZE):
+                    await self._flush(batch[start:start + settings.AUDIT_BATCH_SIZE])
+                return
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Dict]) -> None:
+        if not batch:
+            return
+        try:
+            await audit_events_collection.insert_many(batch, ordered=False)
+            self.counters["flushed"] += len(batch)
+        except BulkWriteError as e:
+            inserted = e.details.get("nInserted", 0)
+            self.counters["failed_batches"] += 1
+            self.counters["flushed"] += inserted
+            self.counters["dropped"] += len(batch) - inserted
+            logger.error(f"Partially flushed audit batch: {inserted}/{len(batch)} written: {str(e)}")
+        except Exception as e:
+            self.counters["failed_batches"] += 1
+            self.counters["dropped"] += len(batch)
+            logger.error(f"Failed to flush {len(batch)} audit events: {str(e)}", exc_info=True)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            **self.counters,
+            "buffered": self._queue.qsize() if self._queue is not None else 0
+        }
+
+
+audit_queue = AuditQueue()
+
+
+async def enqueue_action_log(
+    company_id: str,
+    plant_id: Optional[str],
+    financial_year: str,
+    action_log: ActionLog
+) -> None:
+    await audit_queue.enqueue(company_id, plant_id, financial_year, action_log)
@@ -1,45 +1,127 @@
-from typing import Optional
+from datetime import datetime
+from typing import Dict, Optional
 from fastapi import HTTPException
-from database import audit_collection
-from models.auditModel import ActionLog, AuditLog
+from pymongo import ReplaceOne
+from database import audit_collection, audit_events_collection
+from models.auditModel import ActionLog, AuditLogPage
+from utils.pagination import after_cursor, encode_cursor
 from logging import getLogger
 
 logger = getLogger(__name__)
 
-async def get_audit_log_service(company_id: str, plant_id: str, financial_year: str) -> AuditLog:
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+AUDIT_SORT = [("performed_at", -1), ("_id", -1)]
+
+
+def build_audit_event(
+    company_id: str,
+    plant_id: Optional[str],
+    financial_year: str,
+    action_log: ActionLog
+) -> Dict:
+    return {
+        "company_id": company_id,
+        "plant_id": plant_id if plant_id else None,
+        "financial_year": financial_year,
+        **action_log.dict(exclude_unset=True)
+    }
+
+
+def build_audit_query(
+    company_id: str,
+    plant_id: Optional[str],
+    financial_year: str,
+    cursor: Optional[str] = None,
+    action: Optional[str] = None,
+    user_id: Optional[str] = None,
+    performed_after: Optional[datetime] = None,
+    performed_before: Optional[datetime] = None
+) -> Dict:
+    """Filter for one audit log page, read in AUDIT_SORT order."""
+    query: Dict = {
+        "company_id": company_id,
+        "plant_id": plant_id if plant_id else None,
+        "financial_year": financial_year
+    }
+    if action:
+        query["action"] = action
+    if user_id:
+        query["user_id"] = user_id
+    if performed_after or performed_before:
+        query["performed_at"] = {}
+        if performed_after:
+            query["performed_at"]["$gte"] = performed_after
+        if performed_before:
+            query["performed_at"]["$lt"] = performed_before
+    if cursor:
+        query.update(after_cursor(cursor, "performed_at"))
+    return query
+
+
+async def get_audit_log_service(
+    company_id: str,
+    plant_id: str,
+    financial_year: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    action: Optional[str] = None,
+    user_id: Optional[str] = None,
+    performed_after: Optional[datetime] = None,
+    performed_before: Optional[datetime] = None
+) -> AuditLogPage:
     """
-    Fetch audit log for a company, plant, and financial year.
+    Fetch one page of the audit log for a company, plant, and financial year, newest first.
 
     Args:
         company_id: ID of the company.
         plant_id: ID of the plant.
         financial_year: Financial year.
+        limit: Maximum number of actions to return (capped at MAX_PAGE_SIZE).
+        cursor: `next_cursor` from the previous page.
+        action: Only return actions with this name.
+        user_id: Only return actions performed by this user.
+        performed_after: Only return actions at or after this time.
+        performed_before: Only return actions before this time.
 
     Returns:
-        AuditLog object.
+        AuditLogPage with the actions and the cursor for the next page.
 
     Raises:
-        HTTPException: If audit log is not found.
+        HTTPException: If the cursor is invalid or the query fails.
     """
-    audit = await audit_collection.find_one({
-        "company_id": company_id,
-        "plant_id": plant_id,
-        "financial_year": financial_year
-    })
-    if not audit:
-        raise HTTPException(status_code=404, detail="Audit log not found")
-    
-    # Convert _id to string and rename to id
-    audit["id"] = str(audit["_id"]) if "_id" in audit else None
-    audit.pop("_id", None)  # Ensure _id is removed
-    
-    # Validate and return AuditLog
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    query = build_audit_query(
+        company_id, plant_id, financial_year, cursor, action, user_id, performed_after, performed_before
+    )
+
     try:
-        return AuditLog(**audit)
+        events = await audit_events_collection.find(query) \
+            .sort(AUDIT_SORT) \
+            .limit(limit + 1) \
+            .to_list(limit + 1)
+    except Exception as e:
+        logger.error(f"Error fetching audit log: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+    next_cursor = None
+    if len(events) > limit:
+        events = events[:limit]
+        next_cursor = encode_cursor(events[-1]["performed_at"], events[-1]["_id"])
+
+    try:
+        return AuditLogPage(
+            company_id=company_id,
+            plant_id=plant_id,
+            financial_year=financial_year,
+            actions=[ActionLog(**event) for event in events],
+            next_cursor=next_cursor
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to validate audit log: {str(e)}")
-    
-    
+
+
 async def log_action_service(
     company_id: str,
     plant_id: Optional[str],
@@ -47,7 +129,7 @@ async def log_action_service(
     action_log: ActionLog
 ) -> None:
     """
-    Append an action to the audit log in MongoDB.
+    Append an action to the audit log in MongoDB as its own event document.
 
     Args:
         company_id: Company ID.
@@ -59,29 +141,49 @@ async def log_action_service(
         HTTPException: If the database operation fails.
     """
     try:
-        query = {
-            "company_id": company_id,
-            "financial_year": financial_year,
-            "plant_id": plant_id if plant_id else None
-        }
-        update = {
-            "$push": {
-                "actions": action_log.dict(exclude_unset=True)
-            },
-            "$setOnInsert": {
-                "company_id": company_id,
-                "plant_id": plant_id,
-                "financial_year": financial_year,
-                
-            }
-        }
-
-        result = await audit_collection.update_one(query, update, upsert=True)
-        if result.modified_count == 0 and result.upserted_id is None:
+        result = await audit_events_collection.insert_one(
+            build_audit_event(company_id, plant_id, financial_year, action_log)
+        )
+        if not result.inserted_id:
             logger.warning(f"Failed to log action: {action_log.action} for target_id={action_log.target_id}")
             raise HTTPException(status_code=400, detail="No changes applied")
 
         logger.info(f"Logged action: {action_log.action} for target_id={action_log.target_id}")
     except Exception as e:
         logger.error(f"Error logging action: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+async def migrate_embedded_audit_logs() -> int:
+    """
+    Move actions embedded in legacy audit_collection documents into audit_events.
+
+    Each action is upserted under a deterministic `legacy_ref`, so re-running after a
+    partial failure never duplicates events. A legacy document is deleted only after
+    all of its actions have been written.
+
+    Returns:
+        Number of actions migrated.
+    """
+    migrated = 0
+    async for legacy in audit_collection.find({"actions": {"$exists": True}}):
+        operations = []
+        for index, action in enumerate(legacy.get("actions") or []):
+            legacy_ref = f"{legacy['_id']}:{index}"
+            operations.append(ReplaceOne(
+                {"legacy_ref": legacy_ref},
+                {
+                    "company_id": legacy.get("company_id"),
+                    "plant_id": legacy.get("plant_id"),
+                    "financial_year": legacy.get("financial_year"),
+                    **action,
+                    "legacy_ref": legacy_ref
+                },
+                upsert=True
+            ))
+        if operations:
+            await audit_events_collection.bulk_write(operations, ordered=False)
+        await audit_collection.delete_one({"_id": legacy["_id"]})
+        migrated += len(operations)
+        logger.info(f"Migrated {len(operations)} audit actions from legacy document {legacy['_id']}")
+    return migrated
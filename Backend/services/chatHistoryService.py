@@ -0,0 +1,177 @@
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+from fastapi import HTTPException
+import pytz
+from database import chat_messages_collection
+from models.chatModel import ChatHistoryPage, ChatMessage
+from utils.config import settings
+from utils.pagination import after_cursor, encode_cursor
+from logging import getLogger
+
+logger = getLogger(__name__)
+
+DEFAULT_CONVERSATION = "default"
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+CHAT_SORT = [("timestamp", -1), ("_id", -1)]
+
+IST = pytz.timezone("Asia/Kolkata")
+
+ConversationKey = Tuple[str, str]
+
+
+def to_chat_message(doc: Dict) -> ChatMessage:
+    return ChatMessage(
+        message_id=str(doc["_id"]),
+        conversation_id=doc["conversation_id"],
+        user_message=doc["user_message"],
+        bot_reply=doc["bot_reply"],
+        timestamp=pytz.utc.localize(doc["timestamp"]).astimezone(IST).isoformat()
+    )
+
+
+def build_conversation_query(user_id: str, conversation_id: str, cursor: Optional[str] = None) -> Dict:
+    """Filter for one page of a conversation, read in CHAT_SORT order."""
+    query: Dict = {"user_id": user_id, "conversation_id": conversation_id}
+    if cursor:
+        query.update(after_cursor(cursor, "timestamp"))
+    return query
+
+
+class ChatHistoryStore:
+    """
+    Chat history persisted in `chat_messages`, one document per exchange.
+
+    MongoDB is the source of truth: other workers append to the same conversations, so pages
+    are always resolved against the collection. Each worker keeps the bodies of the most recent
+    CHAT_HISTORY_RECENT_MESSAGES exchanges per conversation as a read-through buffer; the first
+    page reads only the `_id`s from the index and takes the bodies from the buffer when it
+    holds all of them. Only CHAT_HISTORY_MAX_CONVERSATIONS conversations are buffered, least
+    recently used first out.
+    """
+
+    def __init__(self, recent_messages: int, max_conversations: int):
+        self.recent_messages = recent_messages
+        self.max_conversations = max_conversations
+        # Recently read or written exchanges per conversation, looked up by _id
+        self._recent: "OrderedDict[ConversationKey, Deque[Dict]]" = OrderedDict()
+
+    def _remember(self, key: ConversationKey, docs: List[Dict]) -> None:
+        """Add newest-first `docs` to the conversation buffer."""
+        buffer = self._recent.get(key)
+        if buffer is None:
+            buffer = self._recent[key] = deque(maxlen=self.recent_messages)
+            while len(self._recent) > self.max_conversations:
+                self._recent.popitem(last=False)
+        self._recent.move_to_end(key)
+        buffered = {doc["_id"] for doc in buffer}
+        for doc in sorted(docs, key=lambda doc: (doc["timestamp"], doc["_id"])):
+            if doc["_id"] not in buffered:
+                buffer.append(doc)
+
+    async def _first_page(self, key: ConversationKey, query: Dict, limit: int) -> List[Dict]:
+        buffered = {doc["_id"]: doc for doc in self._recent.get(key, ())}
+        if buffered:
+            # Covered by the chat_messages index, so no message bodies are read
+            ids = await chat_messages_collection.find(query, {"_id": 1}) \
+                .sort(CHAT_SORT) \
+                .limit(limit + 1) \
+                .to_list(limit + 1)
+            if all(doc["_id"] in buffered for doc in ids):
+                self._recent.move_to_end(key)
+                return [buffered[doc["_id"]] for doc in ids]
+
+        docs = await chat_messages_collection.find(query) \
+            .sort(CHAT_SORT) \
+            .limit(limit + 1) \
+            .to_list(limit + 1)
+        self._remember(key, docs)
+        return docs
+
+    async def append(self, user_id: str, conversation_id: str, user_message: str, bot_reply: str) -> ChatMessage:
+        now = datetime.utcnow()
+        doc = {
+            "user_id": user_id,
+            "conversation_id": conversation_id,
+            "user_message": user_message,
+            "bot_reply": bot_reply,
+            # MongoDB keeps milliseconds; buffered copies must match what cursors compare against
+            "timestamp": now.replace(microsecond=now.microsecond // 1000 * 1000)
+        }
+        await chat_messages_collection.insert_one(doc)
+        self._remember((user_id, conversation_id), [doc])
+        return to_chat_message(doc)
+
+    async def page(self, user_id: str, conversation_id: str, limit: int, cursor: Optional[str]) -> ChatHistoryPage:
+        query = build_conversation_query(user_id, conversation_id, cursor)
+        if cursor is None:
+            docs = await self._first_page((user_id, conversation_id), query, limit)
+        else:
+            docs = await chat_messages_collection.find(query) \
+                .sort(CHAT_SORT) \
+                .limit(limit + 1) \
+                .to_list(limit + 1)
+
+        next_cursor = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            next_cursor = encode_cursor(docs[-1]["timestamp"], docs[-1]["_id"])
+        return ChatHistoryPage(messages=[to_chat_message(doc) for doc in docs], next_cursor=next_cursor)
+
+
+chat_history = ChatHistoryStore(
+    recent_messages=settings.CHAT_HISTORY_RECENT_MESSAGES,
+    max_conversations=settings.CHAT_HISTORY_MAX_CONVERSATIONS
+)
+
+
+async def save_chat_message_service(
+    user_id: str,
+    user_message: str,
+    bot_reply: str,
+    conversation_id: str = DEFAULT_CONVERSATION
+) -> ChatMessage:
+    """
+    Record one chat exchange for a user's conversation.
+
+    Raises:
+        HTTPException: If the database operation fails.
+    """
+    try:
+        return await chat_history.append(user_id, conversation_id, user_message, bot_reply)
+    except Exception as e:
+        logger.error(f"Error saving chat message: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to save chat message: {str(e)}")
+
+
+async def get_chat_history_service(
+    user_id: str,
+    conversation_id: str = DEFAULT_CONVERSATION,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None
+) -> ChatHistoryPage:
+    """
+    Fetch one page of a user's conversation, newest first.
+
+    Args:
+        user_id: ID of the user.
+        conversation_id: Conversation to read.
+        limit: Maximum number of exchanges to return (capped at MAX_PAGE_SIZE).
+        cursor: `next_cursor` from the previous page.
+
+    Returns:
+        ChatHistoryPage with the exchanges and the cursor for the next page.
+
+    Raises:
+        HTTPException: If the cursor is invalid or the query fails.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    try:
+        return await chat_history.page(user_id, conversation_id, limit, cursor)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching chat history: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to fetch chat history: {str(e)}")
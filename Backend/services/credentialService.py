@@ -0,0 +1,151 @@
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from pymongo import DeleteMany, ReplaceOne
+from database import credentials_collection, plants_employees_collection
+import logging
+
+logger = logging.getLogger(__name__)
+
+PLANT_MANAGER = "plant_manager"
+EMPLOYEE = "employee"
+
+
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+
+def credential_user_id(employee_id: Optional[str], email: str) -> str:
+    """
+    The user_id of a credential: the employee ID, or the normalized email for accounts
+    without one, so the unique (plant, year, account_type, user_id) index never sees None twice.
+    """
+    return employee_id or normalize_email(email)
+
+
+def build_plant_credentials(plant: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Build credential documents for the plant manager and employees of a plants_employees document.
+
+    Args:
+        plant: plants_employees document.
+
+    Returns:
+        List of credential documents, one per account with an email.
+    """
+    key = {
+        "company_id": plant["company_id"],
+        "plant_id": plant["plant_id"],
+        "financial_year": plant.get("financial_year")
+    }
+    credentials = []
+
+    manager = plant.get("plant_manager")
+    if manager and manager.get("contact_email"):
+        role = manager.get("user_role")
+        credentials.append({
+            **key,
+            "account_type": PLANT_MANAGER,
+            "user_id": credential_user_id(manager.get("employee_id"), manager["contact_email"]),
+            "email": normalize_email(manager["contact_email"]),
+            "name": manager.get("name"),
+            "user_role": [role] if isinstance(role, str) else role,
+            "password": manager.get("password"),
+            "updated_at": datetime.utcnow()
+        })
+
+    for employee in plant.get("employees", []):
+        if not employee.get("email"):
+            continue
+        role = employee.get("user_role")
+        credentials.append({
+            **key,
+            "account_type": EMPLOYEE,
+            "user_id": credential_user_id(employee.get("employee_id"), employee["email"]),
+            "email": normalize_email(employee["email"]),
+            "name": employee.get("name"),
+            "user_role": [role] if isinstance(role, str) else role,
+            "password": employee.get("password"),
+            "updated_at": datetime.utcnow()
+        })
+
+    return credentials
+
+
+async def sync_plant_credentials(company_id: str, plant_id: str, financial_year: str) -> int:
+    """
+    Re-derive the credential index entries for one plant from plants_employees.
+
+    Called after every employee create/update/delete so login can do a single indexed read.
+
+    Returns:
+        Number of credential documents written.
+    """
+    plant = await plants_employees_collection.find_one({
+        "company_id": company_id,
+        "plant_id": plant_id,
+        "financial_year": financial_year
+    })
+    plant_key = {"company_id": company_id, "plant_id": plant_id, "financial_year": financial_year}
+    if not plant:
+        await credentials_collection.delete_many(plant_key)
+        return 0
+
+    credentials = build_plant_credentials(plant)
+    operations = [
+        ReplaceOne(
+            {**plant_key, "account_type": credential["account_type"], "user_id": credential["user_id"]},
+            credential,
+            upsert=True
+        )
+        for credential in credentials
+    ]
+    # Drop entries for accounts that no longer exist in the plant
+    operations.append(DeleteMany({
+        **plant_key,
+        "$nor": [
+            {"account_type": credential["account_type"], "user_id": credential["user_id"]}
+            for credential in credentials
+        ] or [{"_id": None}]
+    }))
+    await credentials_collection.bulk_write(operations, ordered=True)
+    logger.info(f"Synced {len(credentials)} credentials for company_id={company_id}, plant_id={plant_id}, financial_year={financial_year}")
+    return len(credentials)
+
+
+async def rebuild_all_credentials() -> int:
+    """Backfill the credential index from every plants_employees document."""
+    total = 0
+    async for plant in plants_employees_collection.find({}, {"company_id": 1, "plant_id": 1, "financial_year": 1}):
+        total += await sync_plant_credentials(plant["company_id"], plant["plant_id"], plant.get("financial_year"))
+    return total
+
+
+async def find_credential(email: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a plant manager or employee by email with one indexed read.
+    When the same email exists in several financial years, the latest year wins.
+
+    On a miss, the plants listing the email in plants_employees are synced and the lookup
+    is retried once, so accounts missing from the credential index (for instance before
+    the backfill migration has run) can still log in.
+    """
+    normalized = normalize_email(email)
+    credential = await credentials_collection.find_one({"email": normalized}, sort=[("financial_year", -1)])
+    if credential is not None:
+        return credential
+
+    emails = list({email.strip(), normalized})
+    plants = plants_employees_collection.find(
+        {"$or": [
+            {"plant_manager.contact_email": {"$in": emails}},
+            {"employees.email": {"$in": emails}}
+        ]},
+        {"company_id": 1, "plant_id": 1, "financial_year": 1}
+    )
+    synced = 0
+    async for plant in plants:
+        synced += await sync_plant_credentials(plant["company_id"], plant["plant_id"], plant.get("financial_year"))
+    if not synced:
+        return None
+    logger.warning(f"Credential index was missing {normalized}; synced it from plants_employees")
+    return await credentials_collection.find_one({"email": normalized}, sort=[("financial_year", -1)])
@@ -1,32 +1,123 @@
 import os
 import logging
-from typing import Optional, Dict, Any
-from google import genai
-from google.genai import types
+from typing import Optional, Dict, Any, AsyncIterator
 
 
 from dotenv import load_dotenv
 import asyncio
 
+from utils.config import settings
+from utils.responseCache import ResponseCache, gemini_response_cache, prompt_cache_key
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class GeminiService:
-    def __init__(self):
-        """Initialize the Gemini service with API key."""
-        # Load environment variables
-        load_dotenv()
-        # Support both VITE_API_KEY and GEMINI_API_KEY
-        self.api_key = os.getenv("GEMINI_API_KEY") or os.getenv("VITE_API_KEY")
-        
-        if not self.api_key:
+# One client per process: its async transport keeps a single pooled HTTP connection set
+# that every GeminiService instance reuses instead of reconnecting per request.
+# google.genai is only imported when the first client is built, keeping it off worker boot.
+_client = None
+
+# Caps concurrent LLM calls per worker; a stream holds its slot until it finishes
+_slots = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY)
+
+_stats = {
+    "waiting": 0,      # callers blocked on a free slot
+    "in_flight": 0,    # calls or streams currently holding a slot
+    "completed": 0,
+    "failed": 0,
+    "peak_in_flight": 0
+}
+
+
+def get_api_key() -> Optional[str]:
+    # Support both VITE_API_KEY and GEMINI_API_KEY
+    load_dotenv()
+    return os.getenv("GEMINI_API_KEY") or os.getenv("VITE_API_KEY")
+
+
+def get_genai_client():
+    """Return the process-wide Gemini client, creating it on first use."""
+    global _client
+    if _client is None:
+        from google import genai
+        from google.genai import types
+
+        api_key = get_api_key()
+        if not api_key:
             logger.error("API key not found in environment variables (checked GEMINI_API_KEY and VITE_API_KEY)")
             raise ValueError("API key not found in environment variables")
-        
-        # Initialize the Gemini client
-        self.client = genai.Client(api_key=self.api_key)
-        self.model = "gemini-1.5-flash"
+        _client = genai.Client(
+            api_key=api_key,
+            http_options=types.HttpOptions(timeout=int(settings.GEMINI_TIMEOUT_SECONDS * 1000))
+        )
+    return _client
+
+
+class _FakeChunk:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGeminiModels:
+    """
+    Offline stand-in for `client.aio.models` with a fixed simulated latency.
+    Enabled with GEMINI_USE_FAKE_MODEL for local runs and benchmarks.
+    """
+
+    def __init__(self, latency_seconds: float = 0.5, chunks: int = 5):
+        self.latency_seconds = latency_seconds
+        self.chunks = chunks
+
+    def _reply(self, contents: str) -> str:
+        return f"[fake model] {len(contents)} characters received."
+
+    async def generate_content(self, model: str, contents: str, config=None) -> _FakeChunk:
+        await asyncio.sleep(self.latency_seconds)
+        return _FakeChunk(self._reply(contents))
+
+    async def generate_content_stream(self, model: str, contents: str, config=None) -> AsyncIterator[_FakeChunk]:
+        reply = self._reply(contents)
+        step = max(1, -(-len(reply) // self.chunks))
+
+        async def chunks():
+            for start in range(0, len(reply), step):
+                await asyncio.sleep(self.latency_seconds / self.chunks)
+                yield _FakeChunk(reply[start:start + step])
+
+        return chunks()
+
+
+class GeminiService:
+    def __init__(self, models=None, cache: Optional[ResponseCache] = gemini_response_cache):
+        """
+        Initialize the Gemini service.
+
+        Args:
+            models: Async models API to call; defaults to the shared client's `aio.models`,
+                or FakeGeminiModels when GEMINI_USE_FAKE_MODEL is set. The default is
+                resolved on first call, so constructing the service never builds a client.
+            cache: Response cache for repeated prompts; None disables caching.
+        """
+        self._models = models
+        self._config = None
+        self.cache = cache
+        self.model = settings.GEMINI_MODEL
+
+    @property
+    def models(self):
+        if self._models is None:
+            self._models = FakeGeminiModels() if settings.GEMINI_USE_FAKE_MODEL else get_genai_client().aio.models
+        return self._models
+
+    @property
+    def config(self):
+        if self._config is None:
+            from google.genai import types
+            self._config = types.GenerateContentConfig(
+                response_mime_type="text/plain",
+            )
+        return self._config
 
     def create_prompt_with_context(self, message: str, context: Optional[Dict[Any, Any]] = None) -> str:
         """Create a structured prompt with context."""
@@ -53,80 +144,113 @@ Please provide a detailed response considering the above context."""
         logger.info(f"Generated prompt with context:\n{structured_prompt}")
         return structured_prompt
 
+    def create_brsr_prompt(self, question: str, response: str) -> str:
+        """Create the prompt asking the model to improve a BRSR response."""
+        brsr_prompt = f"""This is my BRSR question and its response. Please improve the response with more details and structure it with clear headers and bullet points in markdown.
+
+**BRSR Question**: {question}
+
+**Response**: {response}
+
+Please provide an improved version of the response."""
+
+        logger.info(f"BRSR prompt generated:\n{brsr_prompt}")
+        return brsr_prompt
+
+    async def _acquire(self) -> None:
+        _stats["waiting"] += 1
+        try:
+            await _slots.acquire()
+        finally:
+            _stats["waiting"] -= 1
+        _stats["in_flight"] += 1
+        _stats["peak_in_flight"] = max(_stats["peak_in_flight"], _stats["in_flight"])
+
+    def _release(self, failed: bool) -> None:
+        _stats["in_flight"] -= 1
+        _stats["failed" if failed else "completed"] += 1
+        _slots.release()
+
     async def generate_content(self, prompt: str) -> str:
-        """Generate content using the Gemini model."""
+        """Generate content using the Gemini model, serving repeated prompts from the cache."""
+        cache_key = prompt_cache_key(self.model, prompt)
+        if self.cache is not None:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        await self._acquire()
+        failed = True
         try:
-            generate_content_config = types.GenerateContentConfig(
-                response_mime_type="text/plain",
-            )
-            
-            response = self.client.models.generate_content(
+            response = await self.models.generate_content(
                 model=self.model,
                 contents=prompt,
-                config=generate_content_config,
+                config=self.config,
             )
-            
-            if not response or not hasattr(response, 'text'):
-                return ""
-            return str(response.text)
+            failed = False
         except Exception as e:
             logger.error(f"Error generating content: {str(e)}")
             raise
+        finally:
+            self._release(failed)
 
-    async def generate_content_stream(self, prompt: str):
-        """Generate streaming content using the Gemini model."""
+        if not response or not getattr(response, 'text', None):
+            return ""
+        text = str(response.text)
+        if self.cache is not None:
+            await self.cache.set(cache_key, self.model, text)
+        return text
+
+    async def stream_text(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream the text of each non-empty chunk generated for a prompt.
+
+        A cached response is replayed in GEMINI_CACHE_REPLAY_CHUNK_CHARS pieces without
+        calling the model; a completed live stream is stored for the next caller.
+        """
+        cache_key = prompt_cache_key(self.model, prompt)
+        if self.cache is not None:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                step = settings.GEMINI_CACHE_REPLAY_CHUNK_CHARS
+                for start in range(0, len(cached), step):
+                    yield cached[start:start + step]
+                return
+
+        await self._acquire()
+        failed = True
+        parts = []
         try:
-            generate_content_config = types.GenerateContentConfig(
-                response_mime_type="text/plain",
+            stream = await self.models.generate_content_stream(
+                model=self.model,
+                contents=prompt,
+                config=self.config,
             )
-            
-            # Wrap synchronous iterator in an async generator
-            async def stream_wrapper():
-                for chunk in self.client.models.generate_content_stream(
-                    model=self.model,
-                    contents=prompt,
-                    config=generate_content_config,
-                ):
-                    yield chunk
-                    # Small delay to prevent blocking the event loop
-                    await asyncio.sleep(0)
-            
-            return stream_wrapper()
+            async for chunk in stream:
+                if chunk.text:
+                    parts.append(chunk.text)
+                    yield chunk.text
+            failed = False
         except Exception as e:
             logger.error(f"Error generating content stream: {str(e)}")
             raise
+        finally:
+            self._release(failed)
 
-    async def improve_brsr_response(self, question: str, response: str):
-        """Improve a BRSR question response with detailed markdown output."""
-        try:
-            # Define the BRSR-specific prompt, preserving the original logic
-            brsr_prompt = f"""This is my BRSR question and its response. Please improve the response with more details and structure it with clear headers and bullet points in markdown.
-
-**BRSR Question**: {question}
-
-**Response**: {response}
-
-Please provide an improved version of the response."""
+        if self.cache is not None:
+            await self.cache.set(cache_key, self.model, "".join(parts))
 
-            logger.info(f"BRSR prompt generated:\n{brsr_prompt}")
+    async def improve_brsr_response(self, question: str, response: str) -> AsyncIterator[str]:
+        """Improve a BRSR question response with detailed markdown output."""
+        async for text in self.stream_text(self.create_brsr_prompt(question, response)):
+            yield text
 
-            # Use the existing generate_content_stream method
-            generate_content_config = types.GenerateContentConfig(
-                response_mime_type="text/plain",
-            )
-            
-            stream =  self.client.models.generate_content_stream(
-                model=self.model,
-                contents=brsr_prompt,
-                config=generate_content_config,
-            )
 
-            # Stream the response asynchronously
-            for chunk in stream:
-                if chunk.text:
-                    yield chunk.text
-                    # Small delay to prevent blocking the event loop
-                    await asyncio.sleep(0)
-        except Exception as e:
-            logger.error(f"Error generating streaming BRSR response: {str(e)}")
-            raise
\ No newline at end of file
+def get_gemini_stats() -> Dict[str, Any]:
+    """Concurrency counters for Gemini calls in this worker."""
+    return {
+        **_stats,
+        "max_concurrency": settings.GEMINI_MAX_CONCURRENCY,
+        "model": settings.GEMINI_MODEL,
+        "fake_model": settings.GEMINI_USE_FAKE_MODEL
+    }
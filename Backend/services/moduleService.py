@@ -1,19 +1,40 @@
 from datetime import datetime
 from fastapi import HTTPException
 from models.module_model import Module, SubModule, QuestionCategory, Question, ModuleCollection
-from database import company_collection, plants_collection, get_module_collection
+from database import company_collection, plants_collection
+from services.moduleStore import module_store
 from typing import List, Dict, Optional
 import logging
 
-# Initialize a new collection for modules
-from motor.motor_asyncio import AsyncIOMotorClient
 from utils.config import settings
+from utils.versionedCache import VersionedCache, bump_version
 
 # Get logger
 logger = logging.getLogger(__name__)
 
-# Get database collection
-modules_collection = get_module_collection()
+# Version namespace bumped by every module/submodule/category/question write
+MODULES_VERSION = "modules"
+
+# Read-through cache of module trees and questions. Entries are shared with callers and must
+# not be mutated. Other workers notice a bump within CACHE_VERSION_POLL_SECONDS.
+module_cache = VersionedCache((MODULES_VERSION,), maxsize=settings.MODULE_CACHE_MAX_ENTRIES)
+
+async def invalidate_module_cache() -> None:
+    """Invalidate cached module metadata in this worker and, via the shared version, in all others."""
+    await bump_version(MODULES_VERSION)
+
+async def raise_missing_parent(module_id: str, submodule_id: Optional[str] = None) -> None:
+    """
+    Raise a 404 for the first missing ancestor of a node that was not found.
+
+    Raises:
+        HTTPException: If the module, or the submodule when given, does not exist.
+    """
+    submodule_names = await module_store.list_submodule_names(module_id)
+    if submodule_names is None:
+        raise HTTPException(status_code=404, detail=f"Module {module_id} not found")
+    if submodule_id is not None and await module_store.find_submodule(module_id, submodule_id) is None:
+        raise HTTPException(status_code=404, detail=f"Submodule {submodule_id} not found")
 
 async def get_all_modules_service(company_id: str, plant_id: str, financial_year: str) -> List[ModuleCollection]:
     """
@@ -22,29 +43,35 @@ async def get_all_modules_service(company_id: str, plant_id: str, financial_year
     # Normalize financial year
     normalized_financial_year = financial_year.replace("-", "_")
 
-    # Validate company and plant exist
-    company = await company_collection.find_one({"company_id": company_id})
-    if not company:
-        raise HTTPException(status_code=404, detail=f"Company {company_id} not found")
-
-    plant = await plants_collection.find_one({
-        "company_id": company_id,
-        "plant_id": plant_id
-    })
-    if not plant:
-        raise HTTPException(status_code=404, detail=f"Plant {plant_id} not found")
-
-    # Get modules
-    modules = await modules_collection.find({
-        "company_id": company_id,
-        "plant_id": plant_id,
-        "financial_year": normalized_financial_year
-    }).to_list(None)
-
-    if not modules:
-        return []
-
-    return modules
+    async def load_modules() -> List[Dict]:
+        # Validate company and plant exist
+        company = await company_collection.find_one({"company_id": company_id}, {"_id": 1})
+        if not company:
+            raise HTTPException(status_code=404, detail=f"Company {company_id} not found")
+
+        plant = await plants_collection.find_one({
+            "company_id": company_id,
+            "plant_id": plant_id
+        }, {"_id": 1})
+        if not plant:
+            raise HTTPException(status_code=404, detail=f"Plant {plant_id} not found")
+
+        # Get modules
+        modules = await module_store.find_modules({
+            "company_id": company_id,
+            "plant_id": plant_id,
+            "financial_year": normalized_financial_year
+        })
+
+        if not modules:
+            return []
+
+        return modules
+
+    # Misses that raise (unknown company/plant) are not cached
+    return await module_cache.get_or_load(
+        ("plant_year", company_id, plant_id, normalized_financial_year), load_modules
+    )
 
 async def get_module_by_id(module_id: str) -> Optional[Dict]:
     """
@@ -52,12 +79,31 @@ async def get_module_by_id(module_id: str) -> Optional[Dict]:
     Returns None if module is not found.
     """
     try:
-        module = await modules_collection.find_one({"id": module_id})
-        return module
+        return await module_cache.get_or_load(
+            ("module", module_id), lambda: module_store.find_module(module_id)
+        )
     except Exception as e:
         logger.error(f"Error fetching module {module_id}: {str(e)}")
         return None
 
+async def get_modules_by_ids_service(module_ids: List[str], projection: Optional[Dict] = None) -> List[Dict]:
+    """
+    Fetch several modules in a single `$in` query, preserving the order of `module_ids`.
+    Unknown IDs are skipped.
+
+    Args:
+        module_ids: Module IDs in the order they should be returned.
+        projection: Optional MongoDB projection (e.g. only sidebar fields).
+
+    Returns:
+        List of module documents.
+    """
+    if not module_ids:
+        return []
+    modules = await module_store.find_modules({"id": {"$in": list(set(module_ids))}}, projection)
+    modules_by_id = {module["id"]: module for module in modules}
+    return [modules_by_id[module_id] for module_id in module_ids if module_id in modules_by_id]
+
 # Helper to match the usage of get_module_by_id_service in this file
 async def get_module_by_id_service(module_id: str) -> Dict:
     module = await get_module_by_id(module_id)
@@ -85,12 +131,12 @@ async def create_module_service(module: Module) -> Module:
         raise HTTPException(status_code=404, detail=f"Plant {module.plant_id} not found")
 
     # Check if module already exists
-    existing_module = await modules_collection.find_one({
+    existing_module = await module_store.find_modules({
         "company_id": module.company_id,
         "plant_id": module.plant_id,
         "financial_year": module.financial_year,
         "module_name": module.module_name
-    })
+    }, {"_id": 1})
     if existing_module:
         raise HTTPException(
             status_code=400,
@@ -101,17 +147,17 @@ async def create_module_service(module: Module) -> Module:
     module.created_at = datetime.utcnow()
 
     # Insert module
-    result = await modules_collection.insert_one(module.dict(by_alias=True))
-    if not result.inserted_id:
+    if not await module_store.insert_module(module.dict(by_alias=True)):
         raise HTTPException(status_code=500, detail="Failed to create module")
 
+    await invalidate_module_cache()
     return module
 
 async def update_module_service(module_id: str, module: Module) -> Module:
     """
     Update an existing module.
     """
-    existing_module = await modules_collection.find_one({"id": module_id})
+    existing_module = await module_store.find_module_header(module_id)
     if not existing_module:
         raise HTTPException(status_code=404, detail=f"Module {module_id} not found")
 
@@ -120,22 +166,19 @@ async def update_module_service(module_id: str, module: Module) -> Module:
     module.updated_at = datetime.utcnow()
 
     # Update module
-    result = await modules_collection.replace_one(
-        {"id": module_id},
-        module.dict(by_alias=True)
-    )
-    if result.modified_count == 0:
+    if not await module_store.replace_module(module_id, module.dict(by_alias=True)):
         raise HTTPException(status_code=500, detail="Failed to update module")
 
+    await invalidate_module_cache()
     return module
 
 async def get_submodule_by_id_service(module_id: str, submodule_id: str) -> SubModule:
     """
     Get a specific submodule from a module.
     """
-    module = await get_module_by_id_service(module_id)
-    submodule = next((s for s in module["submodules"] if s["id"] == submodule_id), None)
+    submodule = await module_store.find_submodule(module_id, submodule_id)
     if not submodule:
+        await raise_missing_parent(module_id)
         raise HTTPException(status_code=404, detail=f"Submodule {submodule_id} not found")
     return SubModule(**submodule)
 
@@ -143,27 +186,23 @@ async def create_submodule_service(module_id: str, submodule: SubModule) -> SubM
     """
     Add a new submodule to a module.
     """
-    # Get existing module
-    module = await get_module_by_id_service(module_id)
+    # Get existing submodule names
+    submodule_names = await module_store.list_submodule_names(module_id)
+    if submodule_names is None:
+        raise HTTPException(status_code=404, detail=f"Module {module_id} not found")
 
     # Check if submodule with same name exists
-    if any(s["submodule_name"] == submodule.submodule_name for s in module["submodules"]):
+    if submodule.submodule_name in submodule_names:
         raise HTTPException(
             status_code=400,
             detail=f"Submodule {submodule.submodule_name} already exists in this module"
         )
 
     # Add submodule
-    result = await modules_collection.update_one(
-        {"id": module_id},
-        {
-            "$push": {"submodules": submodule.dict()},
-            "$set": {"updated_at": datetime.utcnow()}
-        }
-    )
-    if result.modified_count == 0:
+    if not await module_store.add_submodule(module_id, submodule.dict(), datetime.utcnow()):
         raise HTTPException(status_code=500, detail="Failed to add submodule")
 
+    await invalidate_module_cache()
     return submodule
 
 async def get_question_category_service(
@@ -174,14 +213,11 @@ async def get_question_category_service(
     """
     Get a specific question category.
     """
-    submodule = await get_submodule_by_id_service(module_id, submodule_id)
-    category = next(
-        (c for c in submodule.question_categories if c.id == category_id),
-        None
-    )
+    category = await module_store.find_category(module_id, submodule_id, category_id)
     if not category:
+        await raise_missing_parent(module_id, submodule_id)
         raise HTTPException(status_code=404, detail=f"Category {category_id} not found")
-    return category
+    return QuestionCategory(**category)
 
 async def create_question_category_service(
     module_id: str,
@@ -202,19 +238,10 @@ async def create_question_category_service(
         )
 
     # Add category
-    result = await modules_collection.update_one(
-        {
-            "id": module_id,
-            "submodules.id": submodule_id
-        },
-        {
-            "$push": {"submodules.$.question_categories": category.dict()},
-            "$set": {"updated_at": datetime.utcnow()}
-        }
-    )
-    if result.modified_count == 0:
+    if not await module_store.add_category(module_id, submodule_id, category.dict(), datetime.utcnow()):
         raise HTTPException(status_code=500, detail="Failed to add category")
 
+    await invalidate_module_cache()
     return category
 
 async def get_question_service(
@@ -226,14 +253,17 @@ async def get_question_service(
     """
     Get a specific question.
     """
-    category = await get_question_category_service(module_id, submodule_id, category_id)
-    question = next(
-        (q for q in category.questions if q.question_id == question_id),
-        None
+    async def load_question() -> Question:
+        question = await module_store.find_question(module_id, submodule_id, category_id, question_id)
+        if not question:
+            # Distinguish a missing question from a missing category/submodule/module
+            await get_question_category_service(module_id, submodule_id, category_id)
+            raise HTTPException(status_code=404, detail=f"Question {question_id} not found")
+        return Question(**question)
+
+    return await module_cache.get_or_load(
+        ("question", module_id, submodule_id, category_id, question_id), load_question
     )
-    if not question:
-        raise HTTPException(status_code=404, detail=f"Question {question_id} not found")
-    return question
 
 async def create_question_service(
     module_id: str,
@@ -285,24 +315,10 @@ async def create_question_service(
     validate_table_metadata(question)
 
     # Add question
-    result = await modules_collection.update_one(
-        {
-            "id": module_id,
-            "submodules.id": submodule_id,
-            "submodules.question_categories.id": category_id
-        },
-        {
-            "$push": {"submodules.$[sm].question_categories.$[cat].questions": question.dict()},
-            "$set": {"updated_at": datetime.utcnow()}
-        },
-        array_filters=[
-            {"sm.id": submodule_id},
-            {"cat.id": category_id}
-        ]
-    )
-    if result.modified_count == 0:
+    if not await module_store.add_questions(module_id, submodule_id, category_id, [question.dict()], datetime.utcnow()):
         raise HTTPException(status_code=500, detail="Failed to add question")
 
+    await invalidate_module_cache()
     return question
 
 async def update_question_service(
@@ -353,28 +369,13 @@ async def update_question_service(
     validate_table_metadata(question)
 
     # Update question
-    result = await modules_collection.update_one(
-        {
-            "id": module_id,
-            "submodules.id": submodule_id,
-            "submodules.question_categories.id": category_id,
-            "submodules.question_categories.questions.question_id": question_id
-        },
-        {
-            "$set": {
-                "submodules.$[sm].question_categories.$[cat].questions.$[q]": question.dict(),
-                "updated_at": datetime.utcnow()
-            }
-        },
-        array_filters=[
-            {"sm.id": submodule_id},
-            {"cat.id": category_id},
-            {"q.question_id": question_id}
-        ]
+    updated = await module_store.replace_question(
+        module_id, submodule_id, category_id, question_id, question.dict(), datetime.utcnow()
     )
-    if result.modified_count == 0:
+    if not updated:
         raise HTTPException(status_code=500, detail="Failed to update question")
 
+    await invalidate_module_cache()
     return question
 
 async def create_multiple_questions_service(
@@ -436,24 +437,13 @@ async def create_multiple_questions_service(
         validate_table_metadata(q)
 
     # Add all questions at once
-    result = await modules_collection.update_one(
-        {
-            "id": module_id,
-            "submodules.id": submodule_id,
-            "submodules.question_categories.id": category_id
-        },
-        {
-            "$push": {"submodules.$[sm].question_categories.$[cat].questions": {"$each": [q.dict() for q in questions]}},
-            "$set": {"updated_at": datetime.utcnow()}
-        },
-        array_filters=[
-            {"sm.id": submodule_id},
-            {"cat.id": category_id}
-        ]
+    added = await module_store.add_questions(
+        module_id, submodule_id, category_id, [q.dict() for q in questions], datetime.utcnow()
     )
-    if result.modified_count == 0:
+    if not added:
         raise HTTPException(status_code=500, detail="Failed to add questions")
 
+    await invalidate_module_cache()
     return questions
 
 def validate_table_metadata(question: Question):
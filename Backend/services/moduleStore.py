@@ -0,0 +1,444 @@
+from typing import Any, Dict, List, Optional
+from pymongo import ASCENDING
+from database import (
+    client,
+    supports_transactions,
+    modules_collection,
+    module_submodules_collection,
+    module_categories_collection,
+    module_questions_collection
+)
+from utils.config import settings
+
+# Fields that identify a node's place in the tree; stripped when assembling it back
+LINEAGE_FIELDS = ("_id", "module_id", "submodule_id", "category_id", "position")
+
+
+def _strip(doc: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in doc.items() if key not in LINEAGE_FIELDS}
+
+
+class EmbeddedModuleStore:
+    """
+    Module trees stored as one `modules` document with nested submodule/category/question arrays.
+    """
+
+    mode = "embedded"
+
+    async def find_module(self, module_id: str) -> Optional[Dict[str, Any]]:
+        return await modules_collection.find_one({"id": module_id})
+
+    async def find_modules(self, query: Dict[str, Any], projection: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        return await modules_collection.find(query, projection).to_list(None)
+
+    async def find_module_header(self, module_id: str) -> Optional[Dict[str, Any]]:
+        return await modules_collection.find_one({"id": module_id}, {"submodules": 0})
+
+    async def insert_module(self, module: Dict[str, Any]) -> bool:
+        result = await modules_collection.insert_one(module)
+        return bool(result.inserted_id)
+
+    async def replace_module(self, module_id: str, module: Dict[str, Any]) -> bool:
+        result = await modules_collection.replace_one({"id": module_id}, module)
+        return result.modified_count > 0
+
+    async def list_submodule_names(self, module_id: str) -> Optional[List[str]]:
+        module = await modules_collection.find_one({"id": module_id}, {"submodules.submodule_name": 1})
+        if module is None:
+            return None
+        return [s["submodule_name"] for s in module.get("submodules", [])]
+
+    async def find_submodule(self, module_id: str, submodule_id: str) -> Optional[Dict[str, Any]]:
+        module = await modules_collection.find_one(
+            {"id": module_id, "submodules.id": submodule_id},
+            {"submodules.$": 1}
+        )
+        return module["submodules"][0] if module else None
+
+    async def add_submodule(self, module_id: str, submodule: Dict[str, Any], now) -> bool:
+        result = await modules_collection.update_one(
+            {"id": module_id},
+            {"$push": {"submodules": submodule}, "$set": {"updated_at": now}}
+        )
+        return result.modified_count > 0
+
+    async def find_category(self, module_id: str, submodule_id: str, category_id: str) -> Optional[Dict[str, Any]]:
+        submodule = await self.find_submodule(module_id, submodule_id)
+        if submodule is None:
+            return None
+        return next((c for c in submodule["question_categories"] if c["id"] == category_id), None)
+
+    async def add_category(self, module_id: str, submodule_id: str, category: Dict[str, Any], now) -> bool:
+        result = await modules_collection.update_one(
+            {"id": module_id, "submodules.id": submodule_id},
+            {"$push": {"submodules.$.question_categories": category}, "$set": {"updated_at": now}}
+        )
+        return result.modified_count > 0
+
+    async def find_question(
+        self, module_id: str, submodule_id: str, category_id: str, question_id: str
+    ) -> Optional[Dict[str, Any]]:
+        category = await self.find_category(module_id, submodule_id, category_id)
+        if category is None:
+            return None
+        return next((q for q in category["questions"] if q["question_id"] == question_id), None)
+
+    async def add_questions(
+        self, module_id: str, submodule_id: str, category_id: str, questions: List[Dict[str, Any]], now
+    ) -> bool:
+        result = await modules_collection.update_one(
+            {
+                "id": module_id,
+                "submodules.id": submodule_id,
+                "submodules.question_categories.id": category_id
+            },
+            {
+                "$push": {"submodules.$[sm].question_categories.$[cat].questions": {"$each": questions}},
+                "$set": {"updated_at": now}
+            },
+            array_filters=[
+                {"sm.id": submodule_id},
+                {"cat.id": category_id}
+            ]
+        )
+        return result.modified_count > 0
+
+    async def replace_question(
+        self, module_id: str, submodule_id: str, category_id: str, question_id: str, question: Dict[str, Any], now
+    ) -> bool:
+        result = await modules_collection.update_one(
+            {
+                "id": module_id,
+                "submodules.id": submodule_id,
+                "submodules.question_categories.id": category_id,
+                "submodules.question_categories.questions.question_id": question_id
+            },
+            {
+                "$set": {
+                    "submodules.$[sm].question_categories.$[cat].questions.$[q]": question,
+                    "updated_at": now
+                }
+            },
+            array_filters=[
+                {"sm.id": submodule_id},
+                {"cat.id": category_id},
+                {"q.question_id": question_id}
+            ]
+        )
+        return result.modified_count > 0
+
+
+class NormalizedModuleStore:
+    """
+    Module trees split across `modules` (header only), `module_submodules`, `module_categories`
+    and `module_questions`, each child keyed and indexed by its parent IDs.
+
+    Single-node reads and writes touch one small document; whole trees are assembled with
+    one query per level.
+    """
+
+    mode = "normalized"
+
+    async def _run(self, operation) -> Any:
+        # Multi-collection writes commit together when the deployment supports transactions
+        if await supports_transactions():
+            async with await client.start_session() as session:
+                return await session.with_transaction(operation)
+        return await operation(None)
+
+    async def _next_position(self, collection, query: Dict[str, Any]) -> int:
+        last = await collection.find_one(query, {"position": 1}, sort=[("position", -1)])
+        return last["position"] + 1 if last else 0
+
+    async def _assemble(self, modules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Attach submodules, categories and questions to module headers with one query per level."""
+        if not modules:
+            return modules
+        module_ids = [module["id"] for module in modules]
+        order = [("position", ASCENDING)]
+        submodules = await module_submodules_collection.find({"module_id": {"$in": module_ids}}).sort(order).to_list(None)
+        categories = await module_categories_collection.find({"module_id": {"$in": module_ids}}).sort(order).to_list(None)
+        questions = await module_questions_collection.find({"module_id": {"$in": module_ids}}).sort(order).to_list(None)
+
+        questions_by_category: Dict[str, List[Dict[str, Any]]] = {}
+        for question in questions:
+            questions_by_category.setdefault(question["category_id"], []).append(_strip(question))
+        categories_by_submodule: Dict[str, List[Dict[str, Any]]] = {}
+        for category in categories:
+            categories_by_submodule.setdefault(category["submodule_id"], []).append(
+                {**_strip(category), "questions": questions_by_category.get(category["id"], [])}
+            )
+        submodules_by_module: Dict[str, List[Dict[str, Any]]] = {}
+        for submodule in submodules:
+            submodules_by_module.setdefault(submodule["module_id"], []).append(
+                {**_strip(submodule), "question_categories": categories_by_submodule.get(submodule["id"], [])}
+            )
+        for module in modules:
+            module["submodules"] = submodules_by_module.get(module["id"], [])
+        return modules
+
+    async def find_module(self, module_id: str) -> Optional[Dict[str, Any]]:
+        module = await modules_collection.find_one({"id": module_id})
+        if module is None:
+            return None
+        return (await self._assemble([module]))[0]
+
+    async def find_modules(self, query: Dict[str, Any], projection: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        modules = await modules_collection.find(query, projection).to_list(None)
+        # Projections that leave out the tree (e.g. sidebar names) need only the headers
+        if projection is None or projection.get("submodules"):
+            modules = await self._assemble(modules)
+        return modules
+
+    async def find_module_header(self, module_id: str) -> Optional[Dict[str, Any]]:
+        return await modules_collection.find_one({"id": module_id}, {"submodules": 0})
+
+    def _split_tree(self, module: Dict[str, Any]):
+        """Split a nested module dict into a header and one document per child node."""
+        module_id = module["id"]
+        header = {key: value for key, value in module.items() if key != "submodules"}
+        submodules, categories, questions = [], [], []
+        for sm_position, submodule in enumerate(module.get("submodules", [])):
+            submodules.append({
+                **{k: v for k, v in submodule.items() if k != "question_categories"},
+                "module_id": module_id,
+                "position": sm_position
+            })
+            for cat_position, category in enumerate(submodule.get("question_categories", [])):
+                categories.append({
+                    **{k: v for k, v in category.items() if k != "questions"},
+                    "module_id": module_id,
+                    "submodule_id": submodule["id"],
+                    "position": cat_position
+                })
+                for q_position, question in enumerate(category.get("questions", [])):
+                    questions.append({
+                        **question,
+                        "module_id": module_id,
+                        "submodule_id": submodule["id"],
+                        "category_id": category["id"],
+                        "position": q_position
+                    })
+        return header, submodules, categories, questions
+
+    async def _write_children(self, submodules, categories, questions, session) -> None:
+        if submodules:
+            await module_submodules_collection.insert_many(submodules, session=session)
+        if categories:
+            await module_categories_collection.insert_many(categories, session=session)
+        if questions:
+            await module_questions_collection.insert_many(questions, session=session)
+
+    async def insert_module(self, module: Dict[str, Any]) -> bool:
+        header, submodules, categories, questions = self._split_tree(module)
+
+        async def insert(session) -> bool:
+            result = await modules_collection.insert_one(header, session=session)
+            await self._write_children(submodules, categories, questions, session)
+            return bool(result.inserted_id)
+
+        return await self._run(insert)
+
+    async def replace_module(self, module_id: str, module: Dict[str, Any]) -> bool:
+        header, submodules, categories, questions = self._split_tree({**module, "id": module_id})
+
+        async def replace(session) -> bool:
+            result = await modules_collection.replace_one({"id": module_id}, header, session=session)
+            if result.matched_count == 0:
+                return False
+            for collection in (module_submodules_collection, module_categories_collection, module_questions_collection):
+                await collection.delete_many({"module_id": module_id}, session=session)
+            await self._write_children(submodules, categories, questions, session)
+            return True
+
+        return await self._run(replace)
+
+    async def list_submodule_names(self, module_id: str) -> Optional[List[str]]:
+        if await modules_collection.find_one({"id": module_id}, {"_id": 1}) is None:
+            return None
+        cursor = module_submodules_collection.find({"module_id": module_id}, {"submodule_name": 1})
+        return [s["submodule_name"] async for s in cursor]
+
+    async def find_submodule(self, module_id: str, submodule_id: str) -> Optional[Dict[str, Any]]:
+        submodule = await module_submodules_collection.find_one({"id": submodule_id, "module_id": module_id})
+        if submodule is None:
+            return None
+        order = [("position", ASCENDING)]
+        categories = await module_categories_collection.find(
+            {"module_id": module_id, "submodule_id": submodule_id}
+        ).sort(order).to_list(None)
+        questions = await module_questions_collection.find(
+            {"module_id": module_id, "submodule_id": submodule_id}
+        ).sort(order).to_list(None)
+        questions_by_category: Dict[str, List[Dict[str, Any]]] = {}
+        for question in questions:
+            questions_by_category.setdefault(question["category_id"], []).append(_strip(question))
+        return {
+            **_strip(submodule),
+            "question_categories": [
+                {**_strip(category), "questions": questions_by_category.get(category["id"], [])}
+                for category in categories
+            ]
+        }
+
+    async def add_submodule(self, module_id: str, submodule: Dict[str, Any], now) -> bool:
+        _, submodules, categories, questions = self._split_tree({"id": module_id, "submodules": [submodule]})
+        submodules[0]["position"] = await self._next_position(module_submodules_collection, {"module_id": module_id})
+
+        async def add(session) -> bool:
+            await self._write_children(submodules, categories, questions, session)
+            result = await modules_collection.update_one({"id": module_id}, {"$set": {"updated_at": now}}, session=session)
+            return result.matched_count > 0
+
+        return await self._run(add)
+
+    async def find_category(self, module_id: str, submodule_id: str, category_id: str) -> Optional[Dict[str, Any]]:
+        category = await module_categories_collection.find_one(
+            {"id": category_id, "module_id": module_id, "submodule_id": submodule_id}
+        )
+        if category is None:
+            return None
+        questions = await module_questions_collection.find(
+            {"module_id": module_id, "submodule_id": submodule_id, "category_id": category_id}
+        ).sort([("position", ASCENDING)]).to_list(None)
+        return {**_strip(category), "questions": [_strip(question) for question in questions]}
+
+    async def add_category(self, module_id: str, submodule_id: str, category: Dict[str, Any], now) -> bool:
+        if await module_submodules_collection.find_one({"id": submodule_id, "module_id": module_id}, {"_id": 1}) is None:
+            return False
+        _, _, categories, questions = self._split_tree({
+            "id": module_id,
+            "submodules": [{"id": submodule_id, "question_categories": [category]}]
+        })
+        categories[0]["position"] = await self._next_position(
+            module_categories_collection, {"module_id": module_id, "submodule_id": submodule_id}
+        )
+
+        async def add(session) -> bool:
+            await self._write_children([], categories, questions, session)
+            await modules_collection.update_one({"id": module_id}, {"$set": {"updated_at": now}}, session=session)
+            return True
+
+        return await self._run(add)
+
+    async def find_question(
+        self, module_id: str, submodule_id: str, category_id: str, question_id: str
+    ) -> Optional[Dict[str, Any]]:
+        question = await module_questions_collection.find_one({
+            "category_id": category_id,
+            "question_id": question_id,
+            "module_id": module_id,
+            "submodule_id": submodule_id
+        })
+        return _strip(question) if question else None
+
+    async def add_questions(
+        self, module_id: str, submodule_id: str, category_id: str, questions: List[Dict[str, Any]], now
+    ) -> bool:
+        category_filter = {"id": category_id, "module_id": module_id, "submodule_id": submodule_id}
+        if await module_categories_collection.find_one(category_filter, {"_id": 1}) is None:
+            return False
+        start = await self._next_position(
+            module_questions_collection,
+            {"module_id": module_id, "submodule_id": submodule_id, "category_id": category_id}
+        )
+        docs = [
+            {
+                **question,
+                "module_id": module_id,
+                "submodule_id": submodule_id,
+                "category_id": category_id,
+                "position": start + offset
+            }
+            for offset, question in enumerate(questions)
+        ]
+
+        async def add(session) -> bool:
+            await module_questions_collection.insert_many(docs, session=session)
+            await modules_collection.update_one({"id": module_id}, {"$set": {"updated_at": now}}, session=session)
+            return True
+
+        return await self._run(add)
+
+    async def replace_question(
+        self, module_id: str, submodule_id: str, category_id: str, question_id: str, question: Dict[str, Any], now
+    ) -> bool:
+        # Keep the stored lineage and position; only the question fields change
+        result = await module_questions_collection.update_one(
+            {
+                "category_id": category_id,
+                "question_id": question_id,
+                "module_id": module_id,
+                "submodule_id": submodule_id
+            },
+            {"$set": question}
+        )
+        if result.modified_count == 0:
+            return False
+        await modules_collection.update_one({"id": module_id}, {"$set": {"updated_at": now}})
+        return True
+
+
+async def normalize_module_storage(dry_run: bool = False) -> int:
+    """
+    Move embedded submodule/category/question arrays out of `modules` into their own collections.
+
+    Safe to re-run: a module's children are rewritten from its embedded tree, and the tree is
+    only unset from `modules` once they are stored.
+
+    Returns:
+        Number of modules converted (or that would be, for a dry run).
+    """
+    store = NormalizedModuleStore()
+    converted = 0
+    async for module in modules_collection.find({"submodules": {"$exists": True}}):
+        converted += 1
+        if dry_run:
+            continue
+        _, submodules, categories, questions = store._split_tree(module)
+
+        async def convert(session) -> None:
+            for collection in (module_submodules_collection, module_categories_collection, module_questions_collection):
+                await collection.delete_many({"module_id": module["id"]}, session=session)
+            await store._write_children(submodules, categories, questions, session)
+            await modules_collection.update_one({"_id": module["_id"]}, {"$unset": {"submodules": ""}}, session=session)
+
+        await store._run(convert)
+    return converted
+
+
+async def embed_module_storage(dry_run: bool = False) -> int:
+    """
+    Reverse of normalize_module_storage: fold the child collections back into `modules`.
+
+    Returns:
+        Number of modules converted (or that would be, for a dry run).
+    """
+    store = NormalizedModuleStore()
+    converted = 0
+    async for module in modules_collection.find({"submodules": {"$exists": False}}):
+        converted += 1
+        if dry_run:
+            continue
+        tree = (await store._assemble([module]))[0]
+
+        async def convert(session) -> None:
+            await modules_collection.update_one(
+                {"_id": module["_id"]}, {"$set": {"submodules": tree["submodules"]}}, session=session
+            )
+            for collection in (module_submodules_collection, module_categories_collection, module_questions_collection):
+                await collection.delete_many({"module_id": module["id"]}, session=session)
+
+        await store._run(convert)
+    return converted
+
+
+def build_module_store():
+    if settings.MODULE_STORAGE_MODE == "normalized":
+        return NormalizedModuleStore()
+    if settings.MODULE_STORAGE_MODE != "embedded":
+        raise ValueError(f"Unknown MODULE_STORAGE_MODE: {settings.MODULE_STORAGE_MODE}")
+    return EmbeddedModuleStore()
+
+
+module_store = build_module_store()
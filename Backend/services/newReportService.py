@@ -1,5 +1,6 @@
+from collections import OrderedDict
 from fastapi import HTTPException
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from models.newReportModel import Report, QuestionUpdate
 from models.tableQuestionResponse import TableQuestionResponse
 from datetime import datetime
@@ -7,6 +8,7 @@ import json
 from database import new_reports_collection, audit_collection
 import pytz
 from bson import ObjectId
+from utils.config import settings
 
 def normalize_financial_year(financial_year: str) -> str:
     """Normalize financial year format by replacing underscores with hyphens."""
@@ -104,6 +106,46 @@ def is_table_question(question_id: str) -> bool:
     # TODO: Replace with actual metadata/mapping lookup
     return question_id.startswith("TBL_")  # Example: all table questions start with 'TBL_'
 
+def check_question_id(question_id: str) -> None:
+    """
+    Raises:
+        HTTPException: If a question_id cannot be used as a field name.
+    """
+    if not question_id or "." in question_id or question_id.startswith("$"):
+        raise HTTPException(status_code=400, detail=f"Invalid question_id: {question_id}")
+
+def validate_table_response(question_id: str, response: Dict) -> Dict:
+    """
+    Validate a table response and return it in its normalized stored form.
+
+    Raises:
+        HTTPException: If the response does not match TableQuestionResponse.
+    """
+    try:
+        return TableQuestionResponse(**response).dict()
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid table response for {question_id}: {str(e)}")
+
+def build_responses_delta(updates: List[QuestionUpdate]) -> Dict[str, Dict]:
+    """
+    Build a `$set` document touching only `responses.<question_id>` for each update.
+
+    Later updates for the same question_id win, matching the previous dict semantics.
+    Table responses are validated and normalized here, so reads can trust them.
+
+    Raises:
+        HTTPException: If a question_id cannot be used as a field name or a table response is invalid.
+    """
+    delta = {}
+    for update in updates:
+        question_id = update.question_id
+        check_question_id(question_id)
+        response = update.response
+        if is_table_question(question_id):
+            response = validate_table_response(question_id, response)
+        delta[f"responses.{question_id}"] = response
+    return delta
+
 async def update_report(
     company_id: str,
     plant_id: str,
@@ -130,34 +172,19 @@ async def update_report(
     try:
         # Normalize financial year
         normalized_financial_year = normalize_financial_year(financial_year)
-        
-        # Get existing report
-        report = await new_reports_collection.find_one({
-            "company_id": company_id,
-            "plant_id": plant_id,
-            "financial_year": normalized_financial_year
-        })
-        
-        if not report:
-            # Create new report if it doesn't exist
-            report = {
-                "company_id": company_id,
-                "plant_id": plant_id,
-                "financial_year": normalized_financial_year,
-                "responses": {},
-                "created_at": datetime.now(pytz.UTC),
-                "created_by": user_id,
-                "last_modified_at": datetime.now(pytz.UTC),
-                "last_modified_by": user_id
-            }
-            await new_reports_collection.insert_one(report)
-        
-        # Update responses
-        responses = report.get("responses", {})
-        for update in updates:
-            responses[update.question_id] = update.response
-            
-        # Update the report
+        now = datetime.now(pytz.UTC)
+
+        # Build a field-level delta so only the answered questions are written
+        responses_delta = build_responses_delta(updates)
+
+        set_on_insert = {
+            "created_at": now,
+            "created_by": user_id
+        }
+        if not responses_delta:
+            set_on_insert["responses"] = {}
+
+        # Single upsert round trip: creates the report if it does not exist yet
         await new_reports_collection.update_one(
             {
                 "company_id": company_id,
@@ -166,18 +193,88 @@ async def update_report(
             },
             {
                 "$set": {
-                    "responses": responses,
-                    "last_modified_at": datetime.now(pytz.UTC),
+                    **responses_delta,
+                    "last_modified_at": now,
                     "last_modified_by": user_id
-                }
-            }
+                },
+                "$setOnInsert": set_on_insert
+            },
+            upsert=True
         )
         
         return {"message": "Report updated successfully"}
         
+    except HTTPException as e:
+        raise e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update report: {str(e)}")
 
+def question_responses_projection(question_ids: List[str]) -> Dict[str, int]:
+    """
+    Project only `responses.<qid>` for the requested questions.
+
+    Raises:
+        HTTPException: If a question_id cannot be used as a field name.
+    """
+    for question_id in question_ids:
+        check_question_id(question_id)
+    return {"_id": 1, "last_modified_at": 1, **{f"responses.{qid}": 1 for qid in question_ids}}
+
+# (report _id, question_id, last_modified_at) of table responses already known to be in
+# normalized form. Any write bumps last_modified_at, so stale entries are never hit.
+_validated_tables: "OrderedDict[Tuple[Any, str, Any], None]" = OrderedDict()
+
+def read_table_response(report: Dict, question_id: str, response: Dict) -> Dict:
+    """
+    Return a stored table response, validating it at most once per report revision.
+
+    Responses written through update_report are normalized on write; this only does work
+    for data stored before that, or written outside the API.
+
+    Raises:
+        HTTPException: If the stored response is corrupt.
+    """
+    key = (report.get("_id"), question_id, report.get("last_modified_at"))
+    if key in _validated_tables:
+        _validated_tables.move_to_end(key)
+        return response
+    try:
+        normalized = TableQuestionResponse(**response).dict()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Corrupt table response for {question_id}: {str(e)}")
+    if normalized == response:
+        _validated_tables[key] = None
+        if len(_validated_tables) > settings.TABLE_VALIDATION_CACHE_SIZE:
+            _validated_tables.popitem(last=False)
+    return normalized
+
+def extract_question_responses(report: Dict, question_ids: List[str]) -> Dict[str, Dict]:
+    """
+    Pick the requested responses out of a (projected) report.
+
+    Raises:
+        HTTPException: If a question has no response or a table response is corrupt.
+    """
+    responses = report.get("responses", {})
+    result = {}
+    invalid_ids = []
+    for qid in question_ids:
+        if qid in responses:
+            # Use correct model for table-type questions
+            if is_table_question(qid):
+                result[qid] = read_table_response(report, qid, responses[qid])
+            else:
+                result[qid] = responses[qid]
+        else:
+            invalid_ids.append(qid)
+
+    if invalid_ids:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid question IDs: {', '.join(invalid_ids)}"
+        )
+    return result
+
 async def fetch_question_responses(
     company_id: str,
     plant_id: str,
@@ -201,43 +298,22 @@ async def fetch_question_responses(
         HTTPException: If report or question IDs are invalid.
     """
     try:
-        # Fetch report
-        report = await new_reports_collection.find_one({
-            "company_id": company_id,
-            "plant_id": plant_id,
-            "financial_year": financial_year
-        })
+        # Fetch only the requested responses, not the whole report
+        report = await new_reports_collection.find_one(
+            {
+                "company_id": company_id,
+                "plant_id": plant_id,
+                "financial_year": financial_year
+            },
+            question_responses_projection(question_ids)
+        )
         if not report:
             raise HTTPException(
                 status_code=404,
                 detail=f"No report found for company {company_id}, plant {plant_id}, financial year {financial_year}"
             )
 
-        # Extract responses
-        responses = report.get("responses", {})
-        result = {}
-        invalid_ids = []
-
-        for qid in question_ids:
-            if qid in responses:
-                # Use correct model for table-type questions
-                if is_table_question(qid):
-                    try:
-                        result[qid] = TableQuestionResponse(**responses[qid]).dict()
-                    except Exception as e:
-                        raise HTTPException(status_code=500, detail=f"Corrupt table response for {qid}: {str(e)}")
-                else:
-                    result[qid] = responses[qid]
-            else:
-                invalid_ids.append(qid)
-
-        if invalid_ids:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid question IDs: {', '.join(invalid_ids)}"
-            )
-
-        return result
+        return extract_question_responses(report, question_ids)
     except HTTPException as e:
         raise e
     except Exception as e:
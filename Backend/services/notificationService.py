@@ -0,0 +1,215 @@
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Optional
+from fastapi import HTTPException
+from pymongo import ReplaceOne
+from database import notfications_collection, notification_inbox_collection
+from models.notificationsModal import InboxNotification, Notification, NotificationPage
+from utils.pagination import after_cursor, encode_cursor
+from logging import getLogger
+
+logger = getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+INBOX_SORT = [("timestamp", -1), ("_id", -1)]
+
+
+def build_inbox_entries(company_id: str, plant_id: str, notification: Notification) -> List[Dict]:
+    """Fan a notification out into one inbox document per distinct recipient."""
+    return [
+        {
+            "notification_id": notification.notification_id,
+            "company_id": company_id,
+            "plant_id": plant_id,
+            "recipient_id": recipient_id,
+            "sender": notification.sender,
+            "title": notification.title,
+            "description": notification.description,
+            "timestamp": notification.timestamp,
+            "read": False,
+            "read_at": None
+        }
+        for recipient_id in dict.fromkeys(notification.recipients)
+    ]
+
+
+async def create_notification_service(
+    company_id: str,
+    plant_id: str,
+    sender_id: str,
+    title: str,
+    description: str,
+    recipients: List[str]
+) -> str:
+    """
+    Deliver a notification to each recipient's inbox with a single insert_many.
+
+    Args:
+        company_id: ID of the company.
+        plant_id: ID of the plant.
+        sender_id: User ID of the sender.
+        title: Notification title.
+        description: Notification body.
+        recipients: User IDs of the recipients.
+
+    Returns:
+        The notification ID shared by all inbox entries.
+
+    Raises:
+        HTTPException: If there are no recipients or the insert fails.
+    """
+    notification = Notification(
+        sender=sender_id,
+        recipients=recipients,
+        title=title,
+        description=description
+    )
+    entries = build_inbox_entries(company_id, plant_id, notification)
+    if not entries:
+        raise HTTPException(status_code=400, detail="At least one recipient is required")
+
+    try:
+        await notification_inbox_collection.insert_many(entries, ordered=False)
+    except Exception as e:
+        logger.error(f"Error creating notification: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to create notification: {str(e)}")
+
+    logger.info(f"Delivered notification {notification.notification_id} to {len(entries)} recipients")
+    return notification.notification_id
+
+
+def build_inbox_query(
+    company_id: str,
+    plant_id: str,
+    user_id: str,
+    cursor: Optional[str] = None,
+    unread_only: bool = False
+) -> Dict:
+    """Filter for one inbox page, read in INBOX_SORT order."""
+    query: Dict = {"recipient_id": user_id, "company_id": company_id, "plant_id": plant_id}
+    if unread_only:
+        query["read"] = False
+    if cursor:
+        query.update(after_cursor(cursor, "timestamp"))
+    return query
+
+
+async def get_notifications_service(
+    company_id: str,
+    plant_id: str,
+    user_id: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    unread_only: bool = False
+) -> NotificationPage:
+    """
+    Fetch one page of a user's inbox, newest first, together with their unread count.
+
+    Args:
+        company_id: ID of the company.
+        plant_id: ID of the plant.
+        user_id: Recipient user ID.
+        limit: Maximum number of notifications to return (capped at MAX_PAGE_SIZE).
+        cursor: `next_cursor` from the previous page.
+        unread_only: Only return unread notifications.
+
+    Returns:
+        NotificationPage with the notifications, unread count, and next cursor.
+
+    Raises:
+        HTTPException: If the cursor is invalid or the query fails.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    query = build_inbox_query(company_id, plant_id, user_id, cursor, unread_only)
+
+    try:
+        entries, unread_count = await asyncio.gather(
+            notification_inbox_collection.find(query)
+                .sort(INBOX_SORT)
+                .limit(limit + 1)
+                .to_list(limit + 1),
+            notification_inbox_collection.count_documents(build_inbox_query(company_id, plant_id, user_id, unread_only=True))
+        )
+    except Exception as e:
+        logger.error(f"Error fetching notifications: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to fetch notifications: {str(e)}")
+
+    next_cursor = None
+    if len(entries) > limit:
+        entries = entries[:limit]
+        next_cursor = encode_cursor(entries[-1]["timestamp"], entries[-1]["_id"])
+
+    return NotificationPage(
+        notifications=[InboxNotification(**entry) for entry in entries],
+        unread_count=unread_count,
+        next_cursor=next_cursor
+    )
+
+
+async def mark_notifications_read_service(
+    company_id: str,
+    plant_id: str,
+    user_id: str,
+    notification_ids: Optional[List[str]] = None
+) -> int:
+    """
+    Mark notifications in a user's inbox as read.
+
+    Args:
+        company_id: ID of the company.
+        plant_id: ID of the plant.
+        user_id: Recipient user ID.
+        notification_ids: Notifications to mark; all unread notifications when omitted.
+
+    Returns:
+        Number of notifications marked as read.
+
+    Raises:
+        HTTPException: If the update fails.
+    """
+    query: Dict = {"recipient_id": user_id, "company_id": company_id, "plant_id": plant_id, "read": False}
+    if notification_ids is not None:
+        query["notification_id"] = {"$in": notification_ids}
+
+    try:
+        result = await notification_inbox_collection.update_many(
+            query,
+            {"$set": {"read": True, "read_at": datetime.utcnow()}}
+        )
+    except Exception as e:
+        logger.error(f"Error marking notifications read: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to update notifications: {str(e)}")
+    return result.modified_count
+
+
+async def migrate_embedded_notifications() -> int:
+    """
+    Fan notifications embedded in legacy notfications_collection documents out into inbox entries.
+
+    Each entry is upserted under a deterministic `legacy_ref`, so re-running after a partial
+    failure never duplicates notifications. A legacy document is deleted only after all of
+    its entries have been written.
+
+    Returns:
+        Number of inbox entries migrated.
+    """
+    migrated = 0
+    async for legacy in notfications_collection.find({"notifications": {"$exists": True}}):
+        operations = []
+        for raw in legacy.get("notifications") or []:
+            notification = Notification(**raw)
+            for entry in build_inbox_entries(legacy["company_id"], legacy["plant_id"], notification):
+                legacy_ref = f"{legacy['_id']}:{entry['notification_id']}:{entry['recipient_id']}"
+                operations.append(ReplaceOne(
+                    {"legacy_ref": legacy_ref},
+                    {**entry, "legacy_ref": legacy_ref},
+                    upsert=True
+                ))
+        if operations:
+            await notification_inbox_collection.bulk_write(operations, ordered=False)
+        await notfications_collection.delete_one({"_id": legacy["_id"]})
+        migrated += len(operations)
+        logger.info(f"Migrated {len(operations)} inbox entries from legacy document {legacy['_id']}")
+    return migrated
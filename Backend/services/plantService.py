@@ -1,5 +1,4 @@
 from typing import Dict, List
-import bcrypt
 from grpc import Status
 from pydantic import ValidationError
 from bson import ObjectId
@@ -8,12 +7,11 @@ from models.plantEmployeeModel import Employee, EmployeeUpdate, PlantEmployee, P
 from database import company_collection, get_plants_employees_collection, plants_collection , plants_employees_collection , reports_collection
 from fastapi import HTTPException
 import logging
-from passlib.context import CryptContext
 from services.auditServices import log_action_service
+from services.credentialService import sync_plant_credentials
+from utils.passwordHasher import hash_password
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # Configure logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -140,6 +138,8 @@ async def initialize_plant_service(
     if not result.inserted_id:
         raise HTTPException(status_code=500, detail="Failed to initialize plant")
 
+    await sync_plant_credentials(company_id, plant_id, normalized_financial_year)
+
 
 async def create_employee_service(company_id: str, plant_id: str, financial_year: str, employee: Employee) -> PlantEmployee:
     """
@@ -190,7 +190,7 @@ async def create_employee_service(company_id: str, plant_id: str, financial_year
         )
 
     # Hash password
-    hashed_password = bcrypt.hashpw(employee.password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    hashed_password = await hash_password(employee.password)
 
     # Prepare employee data
     employee_data = employee.dict()
@@ -214,6 +214,8 @@ async def create_employee_service(company_id: str, plant_id: str, financial_year
     if result.modified_count == 0 and result.upserted_id is None:
         raise HTTPException(status_code=500, detail="Failed to add employee")
 
+    await sync_plant_credentials(company_id, plant_id, normalized_financial_year)
+
     # Retrieve updated document and convert to PlantEmployee model
     updated_plant = await plants_employees_collection.find_one({
         "company_id": company_id,
@@ -286,6 +288,8 @@ async def update_employee_roles_service(
     if result.modified_count == 0:
         raise HTTPException(status_code=500, detail="Failed to update employee roles")
 
+    await sync_plant_credentials(company_id, plant_id, normalized_financial_year)
+
     updated_plant = await plants_employees_collection.find_one({
         "company_id": company_id,
         "plant_id": plant_id,
@@ -386,7 +390,7 @@ async def update_employee_service(company_id: str, plant_id: str, financial_year
             )
         update_data = {k: v for k, v in employee_update.dict(exclude_unset=True).items() if k != "employee_id"}
         if update_data.get("password"):
-            update_data["password"] = pwd_context.hash(update_data["password"])
+            update_data["password"] = await hash_password(update_data["password"])
         employees[employee_index].update(update_data)
         result = await collection.update_one(
             {"company_id": company_id, "plant_id": plant_id, "financial_year": financial_year},
@@ -398,6 +402,7 @@ async def update_employee_service(company_id: str, plant_id: str, financial_year
                 status_code=400,
                 
             )
+        await sync_plant_credentials(company_id, plant_id, financial_year)
         updated_plant = await collection.find_one({
             "company_id": company_id,
             "plant_id": plant_id,
@@ -451,7 +456,7 @@ async def delete_employee_service(company_id: str, plant_id: str, financial_year
             logger.warning(f"Failed to delete employee {employee_id} from plant_id={plant_id}")
             raise HTTPException(status_code=400, detail="No changes applied")
         
-        
+        await sync_plant_credentials(company_id, plant_id, financial_year)
         
         logger.info(f"Deleted employee {employee_id} from plant_id={plant_id}")
         return {"detail": "Employee deleted successfully"}
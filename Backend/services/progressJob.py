@@ -0,0 +1,94 @@
+import asyncio
+from typing import Dict, Optional, Set
+from logging import getLogger
+from services.progressService import PlantKey, recompute_section_progress
+from utils.config import settings
+
+logger = getLogger(__name__)
+
+
+class ProgressRecomputeJob:
+    """
+    Background task that keeps plant section_progress in step with report contents.
+
+    Report writes mark their plant dirty and return immediately. Every
+    PROGRESS_RECOMPUTE_INTERVAL_SECONDS the task recomputes all dirty plants in one
+    aggregation, so a burst of saves to the same plant costs a single recompute.
+    """
+
+    def __init__(self):
+        self._dirty: Set[PlantKey] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.counters = {"marked": 0, "runs": 0, "plants_recomputed": 0, "failed_runs": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info("Progress recompute job started")
+
+    async def stop(self) -> None:
+        """Recompute whatever is still dirty and stop the background task."""
+        if not self.running:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        logger.info(f"Progress recompute job stopped: {self.counters}")
+
+    async def mark_dirty(self, company_id: str, plant_id: str) -> None:
+        """
+        Schedule a plant for recompute. Recomputes immediately when the job is not
+        running (e.g. in scripts).
+        """
+        self.counters["marked"] += 1
+        if not self.running:
+            try:
+                self.counters["plants_recomputed"] += await recompute_section_progress([(company_id, plant_id)])
+            except Exception as e:
+                self.counters["failed_runs"] += 1
+                logger.error(f"Failed to recompute section progress for plant {plant_id}: {str(e)}", exc_info=True)
+            return
+        self._dirty.add((company_id, plant_id))
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            if not self._stopping:
+                # Let further saves accumulate before recomputing
+                await asyncio.sleep(settings.PROGRESS_RECOMPUTE_INTERVAL_SECONDS)
+            self._wakeup.clear()
+
+            batch, self._dirty = self._dirty, set()
+            if batch:
+                try:
+                    self.counters["plants_recomputed"] += await recompute_section_progress(batch)
+                    self.counters["runs"] += 1
+                except Exception as e:
+                    self.counters["failed_runs"] += 1
+                    # Keep the plants dirty so the next run retries them
+                    self._dirty |= batch
+                    logger.error(f"Failed to recompute section progress for {len(batch)} plants: {str(e)}", exc_info=True)
+
+            if self._stopping:
+                return
+
+    def stats(self) -> Dict[str, int]:
+        return {**self.counters, "dirty": len(self._dirty)}
+
+
+progress_job = ProgressRecomputeJob()
+
+
+async def mark_progress_dirty(company_id: str, plant_id: str) -> None:
+    await progress_job.mark_dirty(company_id, plant_id)
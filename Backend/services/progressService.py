@@ -0,0 +1,166 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+from pymongo import UpdateOne
+from pydantic import BaseModel
+from database import plants_collection, reports_collection
+from models.plantModel import Progress
+from utils.lazyData import LazyMapping
+from utils.questionIndex import QUESTION_INDEX
+from logging import getLogger
+
+logger = getLogger(__name__)
+
+WRITE_BATCH_SIZE = 500
+
+PlantKey = Tuple[str, str]
+
+
+def model_field_paths(model: Type[BaseModel], prefix: str = "") -> Iterator[str]:
+    """Dotted paths of every leaf field of a (nested) pydantic model."""
+    fields = getattr(model, "model_fields", None) or model.__fields__
+    for name, field in fields.items():
+        annotation = getattr(field, "annotation", None) or getattr(field, "outer_type_", None)
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            yield from model_field_paths(annotation, f"{prefix}{name}.")
+        else:
+            yield f"{prefix}{name}"
+
+
+def check_progress_keys(keys: Iterable[str]) -> None:
+    """
+    Raises:
+        ValueError: If a counter key does not resolve to a field of the plant Progress model.
+    """
+    known = {f"section_progress.{path}" for path in model_field_paths(Progress)}
+    unknown = sorted(key for key in keys if key not in known)
+    if unknown:
+        raise ValueError(f"Progress counter keys missing from the Progress model: {unknown}")
+
+
+def build_progress_counters() -> Dict[str, List[List[str]]]:
+    """
+    Map every plant section_progress counter key to the questions it counts, one entry per
+    question holding its report paths. A composite question counts once, through the paths
+    of its subcomponents; the subcomponents themselves are not counted separately.
+
+    Raises:
+        ValueError: If a counter key does not resolve to a field of the Progress model.
+    """
+    grouped = {sub for compiled in QUESTION_INDEX.values() for sub in compiled.subcomponents}
+    counters: Dict[str, List[List[str]]] = {}
+    for compiled in QUESTION_INDEX.values():
+        if compiled.question_id in grouped:
+            continue
+        if compiled.subcomponents:
+            paths = sorted(
+                QUESTION_INDEX[sub].schema_path for sub in compiled.subcomponents
+                if sub in QUESTION_INDEX and QUESTION_INDEX[sub].in_report
+            )
+        else:
+            paths = [compiled.schema_path] if compiled.in_report else []
+        if not paths:
+            continue
+        for key in compiled.progress_keys:
+            counters.setdefault(key, []).append(paths)
+    check_progress_keys(counters)
+    return counters
+
+
+PROGRESS_COUNTERS: Dict[str, List[List[str]]] = LazyMapping(build_progress_counters)
+
+
+def progress_keys() -> List[str]:
+    """Counter keys in a fixed order, aligned with the `counts` array of the pipeline."""
+    return list(PROGRESS_COUNTERS)
+
+
+def total_key(key: str) -> str:
+    """The total_questions field next to an answered_questions counter key."""
+    return key.rsplit(".", 1)[0] + ".total_questions"
+
+
+def answered_expression(questions: List[List[str]]) -> Dict[str, Any]:
+    """
+    Aggregation expression counting the answered questions; a question is answered when
+    any of its paths holds a non-null value.
+    """
+    return {"$add": [
+        {"$cond": [
+            {"$or": [{"$ne": [{"$ifNull": [f"${path}", None]}, None]} for path in paths]},
+            1,
+            0
+        ]}
+        for paths in questions
+    ]}
+
+
+def build_progress_pipeline(match: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    One pipeline that computes every answered_questions counter from report contents.
+
+    Each counter is the number of questions with at least one non-null report path, so a
+    composite counts once however many subcomponents are filled. Counts are emitted as an
+    array aligned with progress_keys(). Section progress lives on the plant document, so when
+    a plant has reports for several financial years the latest wins.
+    """
+    return [
+        {"$match": match},
+        {"$project": {
+            "company_id": 1,
+            "plant_id": 1,
+            "financial_year": 1,
+            "counts": [answered_expression(PROGRESS_COUNTERS[key]) for key in progress_keys()]
+        }},
+        {"$sort": {"financial_year": -1}},
+        {"$group": {
+            "_id": {"company_id": "$company_id", "plant_id": "$plant_id"},
+            "financial_year": {"$first": "$financial_year"},
+            "counts": {"$first": "$counts"}
+        }}
+    ]
+
+
+async def recompute_section_progress(plant_keys: Optional[Iterable[PlantKey]] = None) -> int:
+    """
+    Recompute plant section_progress answered counters from report contents.
+
+    total_questions is written alongside each counter from the same question table, so
+    answered never exceeds total.
+
+    Args:
+        plant_keys: (company_id, plant_id) pairs to recompute; every plant when omitted.
+
+    Returns:
+        Number of plants whose counters were written.
+    """
+    if plant_keys is None:
+        match: Dict[str, Any] = {}
+    else:
+        pairs = [{"company_id": company_id, "plant_id": plant_id} for company_id, plant_id in set(plant_keys)]
+        if not pairs:
+            return 0
+        match = {"$or": pairs}
+
+    keys = progress_keys()
+    totals = {total_key(key): len(PROGRESS_COUNTERS[key]) for key in keys}
+    written = 0
+    operations = []
+    now = datetime.utcnow()
+    async for result in reports_collection.aggregate(build_progress_pipeline(match), allowDiskUse=True):
+        operations.append(UpdateOne(
+            {"company_id": result["_id"]["company_id"], "plant_id": result["_id"]["plant_id"]},
+            {"$set": {
+                **totals,
+                **dict(zip(keys, result["counts"])),
+                "section_progress_financial_year": result["financial_year"],
+                "section_progress_updated_at": now
+            }}
+        ))
+        if len(operations) >= WRITE_BATCH_SIZE:
+            written += (await plants_collection.bulk_write(operations, ordered=False)).matched_count
+            operations = []
+    if operations:
+        written += (await plants_collection.bulk_write(operations, ordered=False)).matched_count
+
+    logger.info(f"Recomputed section progress for {written} plants")
+    return written
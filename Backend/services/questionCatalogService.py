@@ -0,0 +1,259 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi import HTTPException
+from pymongo import DeleteMany, ReplaceOne
+from database import INDEX_PLAN, landing_flow_questions_collection, reconcile_collection_indexes
+from models.module_model import Question, QuestionPage, QuestionType
+from utils.pagination import decode_position_cursor, encode_position_cursor
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+CATALOGUE_SORT = [("position", 1)]
+
+CATALOGUE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "questions.json")
+
+# Where a synced question sits in data/questions.json; `position` is its catalogue order
+LINEAGE_FIELDS = ("module_id", "module_name", "submodule_id", "submodule_name", "category_id", "category_name", "position")
+
+PROJECTABLE_FIELDS = frozenset(Question.__fields__) | frozenset(LINEAGE_FIELDS)
+
+
+def question_lineage(module: Dict[str, Any], submodule: Dict[str, Any], category: Dict[str, Any], position: int) -> Dict[str, Any]:
+    """Lineage fields stored on a synced catalogue question."""
+    return {
+        "module_id": module["id"],
+        "module_name": module.get("name"),
+        "submodule_id": submodule["id"],
+        "submodule_name": submodule.get("submodule_name"),
+        "category_id": category["id"],
+        "category_name": category.get("category_name"),
+        "position": position
+    }
+
+
+def build_catalogue_questions(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flatten data/questions.json into the documents stored in landing_flow_questions.
+    """
+    questions = []
+    for module in data['modules']:
+        for submodule in module['submodules']:
+            for category in submodule['question_categories']:
+                for q in category['questions']:
+                    # Convert to Question model
+                    question = Question(
+                        question_id=q['question_id'],
+                        question=q['question'],
+                        type=QuestionType.SUBJECTIVE,  # Default to subjective
+                        has_string_value=q.get('has_string_value', False),
+                        has_decimal_value=q.get('has_decimal_value', False),
+                        has_boolean_value=q.get('has_boolean_value', False),
+                        has_link=q.get('has_link', False),
+                        has_note=q.get('has_note', False),
+                        string_value_required=q.get('string_value_required', False),
+                        decimal_value_required=q.get('decimal_value_required', False),
+                        boolean_value_required=q.get('boolean_value_required', False),
+                        link_required=q.get('link_required', False),
+                        note_required=q.get('note_required', False),
+                        tab_id=q.get('tab_id'),
+                    )
+                    # Keep where the question sits so it can be queried by module
+                    questions.append({
+                        **question.dict(),
+                        **question_lineage(module, submodule, category, len(questions))
+                    })
+    return questions
+
+
+def load_catalogue_file(path: str = CATALOGUE_FILE) -> Dict[str, Any]:
+    """Read the question catalogue that sync_catalogue stores."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def content_hash(question: Dict[str, Any]) -> str:
+    """Stable hash of a catalogue document's content, ignoring storage-only fields."""
+    content = {key: value for key, value in question.items() if key not in ("_id", "content_hash")}
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def plan_catalogue_sync(
+    questions: List[Dict[str, Any]],
+    existing_hashes: Dict[str, str]
+) -> Tuple[list, Dict[str, int]]:
+    """
+    Diff the desired catalogue against the stored content hashes.
+
+    Args:
+        questions: Documents from build_catalogue_questions.
+        existing_hashes: question_id -> content_hash currently stored.
+
+    Returns:
+        (bulk_write operations, counts of inserted/updated/unchanged/deleted questions)
+    """
+    operations = []
+    counts = {"inserted": 0, "updated": 0, "unchanged": 0, "deleted": 0}
+    seen = set()
+    for question in questions:
+        question_id = question["question_id"]
+        seen.add(question_id)
+        digest = content_hash(question)
+        if existing_hashes.get(question_id) == digest:
+            counts["unchanged"] += 1
+            continue
+        counts["updated" if question_id in existing_hashes else "inserted"] += 1
+        operations.append(ReplaceOne({"question_id": question_id}, {**question, "content_hash": digest}, upsert=True))
+
+    removed = sorted(set(existing_hashes) - seen)
+    if removed:
+        counts["deleted"] = len(removed)
+        operations.append(DeleteMany({"question_id": {"$in": removed}}))
+    return operations, counts
+
+
+async def sync_catalogue(data: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Bring landing_flow_questions in line with `data` using one unordered bulk_write.
+
+    Only new or changed questions are written and vanished ones deleted, so readers
+    never see an empty catalogue.
+
+    Returns:
+        Counts of inserted/updated/unchanged/deleted questions.
+    """
+    questions = build_catalogue_questions(data)
+    existing_hashes = {
+        doc["question_id"]: doc.get("content_hash")
+        async for doc in landing_flow_questions_collection.find({}, {"_id": 0, "question_id": 1, "content_hash": 1})
+    }
+    operations, counts = plan_catalogue_sync(questions, existing_hashes)
+    if operations:
+        await landing_flow_questions_collection.bulk_write(operations, ordered=False)
+    return counts
+
+
+async def dedupe_catalogue_questions() -> int:
+    """
+    Keep only the newest document per question_id, then rebuild the question_id index as unique.
+
+    Before the index was unique, concurrent syncs could upsert the same question twice.
+
+    Returns:
+        Number of duplicate documents deleted.
+    """
+    deleted = 0
+    duplicates = landing_flow_questions_collection.aggregate([
+        {"$group": {"_id": "$question_id", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}}
+    ], allowDiskUse=True)
+    async for group in duplicates:
+        stale = sorted(group["ids"])[:-1]
+        result = await landing_flow_questions_collection.delete_many({"_id": {"$in": stale}})
+        deleted += result.deleted_count
+
+    # Replaces the old non-unique question_id_1, which reconcile reports as changed
+    await reconcile_collection_indexes(
+        landing_flow_questions_collection,
+        INDEX_PLAN[landing_flow_questions_collection.name],
+        rebuild=True
+    )
+    return deleted
+
+
+def catalogue_projection(fields: Optional[List[str]]) -> Dict[str, int]:
+    """
+    Raises:
+        HTTPException: If a requested field is not a question or lineage field.
+    """
+    if not fields:
+        return {"_id": 0, "content_hash": 0}
+    unknown = sorted(set(fields) - PROJECTABLE_FIELDS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown question fields: {', '.join(unknown)}")
+    # position is always returned so the page cursor can be built
+    return {"_id": 0, "question_id": 1, "position": 1, **{field: 1 for field in fields}}
+
+
+def build_catalogue_query(
+    module_id: str,
+    submodule_id: Optional[str] = None,
+    category_id: Optional[str] = None,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Filter for one catalogue page, read in CATALOGUE_SORT order.
+
+    Raises:
+        HTTPException: If the cursor is invalid.
+    """
+    query: Dict[str, Any] = {"module_id": module_id}
+    if submodule_id:
+        query["submodule_id"] = submodule_id
+    if category_id:
+        query["category_id"] = category_id
+    if cursor:
+        query["position"] = {"$gt": decode_position_cursor(cursor)}
+    return query
+
+
+async def list_catalogue_questions_service(
+    module_id: str,
+    submodule_id: Optional[str] = None,
+    category_id: Optional[str] = None,
+    fields: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Every synced catalogue question of one module, in catalogue order, as a single list.
+
+    Kept for clients of the unpaged endpoint; prefer get_catalogue_questions_service.
+
+    Raises:
+        HTTPException: If a field is invalid.
+    """
+    query = build_catalogue_query(module_id, submodule_id, category_id)
+    return await landing_flow_questions_collection.find(query, catalogue_projection(fields)) \
+        .sort(CATALOGUE_SORT) \
+        .to_list(None)
+
+
+async def get_catalogue_questions_service(
+    module_id: str,
+    submodule_id: Optional[str] = None,
+    category_id: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None
+) -> QuestionPage:
+    """
+    Page through the synced catalogue questions of one module, in catalogue order.
+
+    Args:
+        module_id: Catalogue module ID (e.g. 'landing_flow').
+        submodule_id: Optionally narrow to one submodule.
+        category_id: Optionally narrow to one question category.
+        limit: Maximum number of questions to return (capped at MAX_PAGE_SIZE).
+        cursor: `next_cursor` from the previous page.
+        fields: Only return these question fields.
+
+    Returns:
+        QuestionPage with the questions and the cursor for the next page.
+
+    Raises:
+        HTTPException: If the cursor or a field is invalid.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    query = build_catalogue_query(module_id, submodule_id, category_id, cursor)
+
+    docs = await landing_flow_questions_collection.find(query, catalogue_projection(fields)) \
+        .sort(CATALOGUE_SORT) \
+        .limit(limit + 1) \
+        .to_list(limit + 1)
+
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_position_cursor(docs[-1]["position"])
+    return QuestionPage(questions=docs, next_cursor=next_cursor)
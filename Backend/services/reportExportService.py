@@ -0,0 +1,299 @@
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+from fastapi import HTTPException
+from database import new_reports_collection, reports_collection
+from services import newReportService, reportService
+from utils.questionIndex import QUESTION_INDEX, get_at_path
+from logging import getLogger
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet export is optional
+    pa = None
+    pq = None
+
+logger = getLogger(__name__)
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+EXPORT_SOURCES = ("new_report", "reports")
+
+# Same columns as the bulk import, so a CSV export can be edited and re-imported
+RESPONSE_COLUMNS = ("string_value", "decimal_value", "bool_value", "link", "note", "table")
+ROW_COLUMNS = ("company_id", "plant_id", "financial_year", "question_id") + RESPONSE_COLUMNS
+
+REPORT_KEY_PROJECTION = {"_id": 0, "company_id": 1, "plant_id": 1, "financial_year": 1}
+EXPORT_SORT = [("plant_id", 1), ("financial_year", 1)]
+
+
+def check_export_request(export_format: str, source: str) -> None:
+    """
+    Raises:
+        HTTPException: If the format or source is unknown, or Parquet is requested without pyarrow.
+    """
+    if export_format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported export format: {export_format}")
+    if source not in EXPORT_SOURCES:
+        raise HTTPException(status_code=400, detail=f"Unsupported export source: {source}")
+    if export_format == "parquet" and pa is None:
+        raise HTTPException(status_code=400, detail="Parquet export requires pyarrow to be installed")
+
+
+def _check_question_ids(question_ids: List[str]) -> None:
+    for question_id in question_ids:
+        if not question_id or "." in question_id or question_id.startswith("$"):
+            raise HTTPException(status_code=400, detail=f"Invalid question_id: {question_id}")
+
+
+def legacy_export_questions(question_ids: Optional[List[str]]) -> List[Any]:
+    """
+    Compiled questions to read from the legacy `reports` documents.
+
+    Composite questions are expanded to their granular subcomponents, which hold the values.
+
+    Raises:
+        HTTPException: If a question ID has no report schema path.
+    """
+    if not question_ids:
+        return [
+            compiled for compiled in QUESTION_INDEX.values()
+            if compiled.in_report and not compiled.subcomponents
+        ]
+    questions = []
+    for question_id in question_ids:
+        compiled = QUESTION_INDEX.get(question_id)
+        if compiled is None or not compiled.in_report:
+            raise HTTPException(status_code=400, detail=f"Question {question_id} is not stored in reports")
+        if compiled.subcomponents:
+            questions.extend(QUESTION_INDEX[sub] for sub in sorted(compiled.subcomponents) if sub in QUESTION_INDEX)
+        else:
+            questions.append(compiled)
+    return questions
+
+
+def build_export_query(
+    source: str,
+    company_id: str,
+    financial_year: Optional[str],
+    plant_ids: Optional[List[str]],
+    question_ids: Optional[List[str]]
+) -> Dict[str, Any]:
+    """
+    Build the filter and projection for a company-wide export cursor.
+
+    Returns:
+        Dict with `filter`, `projection` and, for `reports`, the compiled `questions` to read.
+    """
+    query: Dict[str, Any] = {"company_id": company_id}
+    if plant_ids:
+        query["plant_id"] = {"$in": plant_ids}
+
+    if source == "new_report":
+        if financial_year:
+            query["financial_year"] = newReportService.normalize_financial_year(financial_year)
+        if question_ids:
+            _check_question_ids(question_ids)
+            projection = {**REPORT_KEY_PROJECTION, **{f"responses.{qid}": 1 for qid in question_ids}}
+        else:
+            projection = {**REPORT_KEY_PROJECTION, "responses": 1}
+        return {"filter": query, "projection": projection, "questions": None}
+
+    if financial_year:
+        query["financial_year"] = reportService.normalize_financial_year(financial_year)
+    questions = legacy_export_questions(question_ids)
+    projection = {
+        **REPORT_KEY_PROJECTION,
+        **reportService.projection_for_paths([compiled.schema_path for compiled in questions])
+    }
+    return {"filter": query, "projection": projection, "questions": questions}
+
+
+def report_responses(doc: Dict[str, Any], questions: Optional[List[Any]]) -> Dict[str, Any]:
+    """Responses of one exported report keyed by question ID, for either source."""
+    if questions is None:
+        return doc.get("responses") or {}
+    responses = {}
+    for compiled in questions:
+        value = get_at_path(doc, compiled.path)
+        if value is not None:
+            responses[compiled.question_id] = value
+    return responses
+
+
+def response_columns(response: Any) -> Dict[str, Any]:
+    """Spread a response into the typed export columns; legacy scalars go to the matching column."""
+    if isinstance(response, dict):
+        columns = {column: response.get(column) for column in RESPONSE_COLUMNS}
+        if columns["table"] is not None:
+            columns["table"] = json.dumps(columns["table"], default=str)
+        return columns
+    columns = dict.fromkeys(RESPONSE_COLUMNS)
+    if isinstance(response, bool):
+        columns["bool_value"] = response
+    elif isinstance(response, (int, float)):
+        columns["decimal_value"] = float(response)
+    elif isinstance(response, (list, tuple)):
+        columns["string_value"] = json.dumps(response, default=str)
+    else:
+        columns["string_value"] = str(response)
+    return columns
+
+
+def iter_response_rows(doc: Dict[str, Any], questions: Optional[List[Any]]) -> Iterator[Dict[str, Any]]:
+    """One flat row per answered question of a report."""
+    for question_id, response in report_responses(doc, questions).items():
+        yield {
+            "company_id": doc.get("company_id"),
+            "plant_id": doc.get("plant_id"),
+            "financial_year": doc.get("financial_year"),
+            "question_id": question_id,
+            **response_columns(response)
+        }
+
+
+class _ParquetSink(io.RawIOBase):
+    """Write-only file that hands back what pyarrow wrote since the last drain."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+def _parquet_schema():
+    return pa.schema([
+        ("company_id", pa.string()),
+        ("plant_id", pa.string()),
+        ("financial_year", pa.string()),
+        ("question_id", pa.string()),
+        ("string_value", pa.string()),
+        ("decimal_value", pa.float64()),
+        ("bool_value", pa.bool_()),
+        ("link", pa.string()),
+        ("note", pa.string()),
+        ("table", pa.string()),
+    ])
+
+
+async def _iter_batches(cursor, batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+    batch = []
+    async for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def export_reports(
+    company_id: str,
+    export_format: str = "ndjson",
+    source: str = "new_report",
+    financial_year: Optional[str] = None,
+    plant_ids: Optional[List[str]] = None,
+    question_ids: Optional[List[str]] = None,
+    batch_size: int = 200
+) -> AsyncIterator[bytes]:
+    """
+    Stream every report of a company from a single cursor, one encoded chunk per batch.
+
+    NDJSON emits one line per report ({company_id, plant_id, financial_year, responses});
+    CSV and Parquet emit one row per answered question, using the bulk import columns.
+    Only `batch_size` reports are held in memory at a time.
+
+    Args:
+        company_id: ID of the company to export.
+        export_format: 'ndjson', 'csv' or 'parquet'.
+        source: 'new_report' or the legacy 'reports' collection.
+        financial_year: Restrict to one financial year.
+        plant_ids: Restrict to these plants.
+        question_ids: Only export these questions (projected server-side).
+        batch_size: Reports fetched per round trip and encoded per chunk.
+
+    Returns:
+        Async iterator of encoded chunks, suitable for a StreamingResponse.
+
+    Raises:
+        HTTPException: If the request is invalid; raised before the first chunk.
+    """
+    check_export_request(export_format, source)
+    query = build_export_query(source, company_id, financial_year, plant_ids, question_ids)
+    questions = query["questions"]
+    collection = new_reports_collection if source == "new_report" else reports_collection
+
+    async def chunks() -> AsyncIterator[bytes]:
+        cursor = collection.find(query["filter"], query["projection"], batch_size=batch_size).sort(EXPORT_SORT)
+        exported = 0
+        writer = sink = None
+        try:
+            if export_format == "csv":
+                buffer = io.StringIO()
+                csv_writer = csv.DictWriter(buffer, fieldnames=ROW_COLUMNS)
+                csv_writer.writeheader()
+                yield buffer.getvalue().encode()
+            elif export_format == "parquet":
+                sink = _ParquetSink()
+                writer = pq.ParquetWriter(sink, _parquet_schema())
+
+            async for docs in _iter_batches(cursor, batch_size):
+                exported += len(docs)
+                if export_format == "ndjson":
+                    yield "".join(
+                        json.dumps({
+                            "company_id": doc.get("company_id"),
+                            "plant_id": doc.get("plant_id"),
+                            "financial_year": doc.get("financial_year"),
+                            "responses": report_responses(doc, questions)
+                        }, default=str) + "\n"
+                        for doc in docs
+                    ).encode()
+                elif export_format == "csv":
+                    buffer.seek(0)
+                    buffer.truncate()
+                    for doc in docs:
+                        csv_writer.writerows(iter_response_rows(doc, questions))
+                    yield buffer.getvalue().encode()
+                else:
+                    rows = [row for doc in docs for row in iter_response_rows(doc, questions)]
+                    if rows:
+                        writer.write_table(pa.Table.from_pylist(rows, schema=_parquet_schema()))
+                        yield sink.drain()
+
+            if writer is not None:
+                writer.close()
+                writer = None
+                yield sink.drain()
+            logger.info(f"Exported {exported} {source} documents for company {company_id} as {export_format}")
+        except Exception as e:
+            # Headers are already sent; the truncated body is the only signal left to the client
+            logger.error(f"Report export for company {company_id} failed after {exported} documents: {str(e)}", exc_info=True)
+            raise
+        finally:
+            if writer is not None:
+                writer.close()
+            await cursor.close()
+
+    return chunks()
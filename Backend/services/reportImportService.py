@@ -0,0 +1,342 @@
+import asyncio
+import csv
+import io
+import itertools
+import json
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+from fastapi import HTTPException
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+import pytz
+from database import landing_flow_questions_collection, new_reports_collection, plants_collection
+from models.module_model import QuestionType
+from models.newReportModel import ImportResult, ImportRowError
+from models.tableQuestionResponse import TableQuestionResponse
+from services.newReportService import normalize_financial_year
+from utils.config import settings
+from logging import getLogger
+
+try:
+    from openpyxl import load_workbook
+except ImportError:  # XLSX import is optional
+    load_workbook = None
+
+logger = getLogger(__name__)
+
+KEY_COLUMNS = ("company_id", "plant_id", "financial_year", "question_id")
+
+# Response field -> (has_ flag, required flag) in the Question metadata
+VALUE_COLUMNS = {
+    "string_value": ("has_string_value", "string_value_required"),
+    "decimal_value": ("has_decimal_value", "decimal_value_required"),
+    "bool_value": ("has_boolean_value", "boolean_value_required"),
+    "link": ("has_link", "link_required"),
+    "note": ("has_note", "note_required"),
+}
+
+QUESTION_PROJECTION = {
+    "_id": 0, "question_id": 1, "type": 1,
+    **{flag: 1 for flags in VALUE_COLUMNS.values() for flag in flags}
+}
+
+TRUE_VALUES = {"true", "yes", "y", "1"}
+FALSE_VALUES = {"false", "no", "n", "0"}
+
+
+class RowError(ValueError):
+    pass
+
+
+def _normalize_header(header: Any) -> str:
+    return str(header or "").strip().lower()
+
+
+def iter_csv_rows(stream: BinaryIO) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+    reader.fieldnames = [_normalize_header(name) for name in reader.fieldnames or []]
+    for row in reader:
+        yield reader.line_num, row
+
+
+def iter_xlsx_rows(stream: BinaryIO) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    if load_workbook is None:
+        raise HTTPException(status_code=400, detail="XLSX import requires openpyxl to be installed")
+    # read_only streams rows from the archive instead of loading the whole sheet
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        headers = [_normalize_header(name) for name in next(rows, ())]
+        for row_number, values in enumerate(rows, start=2):
+            if any(value is not None for value in values):
+                yield row_number, dict(zip(headers, values))
+    finally:
+        workbook.close()
+
+
+def iter_import_rows(stream: BinaryIO, filename: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (row number, row dict) pairs one at a time from a CSV or XLSX file."""
+    name = (filename or "").lower()
+    if name.endswith(".xlsx"):
+        return iter_xlsx_rows(stream)
+    if name.endswith(".csv"):
+        return iter_csv_rows(stream)
+    raise HTTPException(status_code=400, detail="Unsupported file type: expected .csv or .xlsx")
+
+
+def _blank(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _parse_value(column: str, value: Any) -> Any:
+    if column == "decimal_value":
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            raise RowError(f"decimal_value {value!r} is not a number")
+    if column == "bool_value":
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in TRUE_VALUES:
+            return True
+        if text in FALSE_VALUES:
+            return False
+        raise RowError(f"bool_value {value!r} is not a boolean")
+    return str(value).strip()
+
+
+def build_row_response(row: Dict[str, Any], question: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate a row against its Question metadata flags and build the stored response.
+
+    Raises:
+        RowError: If a value is not allowed, missing, or malformed.
+    """
+    response: Dict[str, Any] = {}
+    for column, (enabled_flag, required_flag) in VALUE_COLUMNS.items():
+        value = row.get(column)
+        if _blank(value):
+            if question.get(required_flag):
+                raise RowError(f"{column} is required")
+            continue
+        if not question.get(enabled_flag):
+            raise RowError(f"{column} is not accepted for this question")
+        response[column] = _parse_value(column, value)
+
+    table = row.get("table")
+    if question.get("type") == QuestionType.TABLE.value:
+        if _blank(table):
+            raise RowError("table is required for table questions")
+        try:
+            table_data = json.loads(table) if isinstance(table, str) else table
+            response["table"] = TableQuestionResponse(**table_data).dict()
+        except Exception as e:
+            raise RowError(f"Invalid table response: {str(e)}")
+    elif not _blank(table):
+        raise RowError("table is only accepted for table questions")
+
+    if not response:
+        raise RowError("Row has no response values")
+    return response
+
+
+async def load_question_metadata() -> Dict[str, Dict[str, Any]]:
+    """Fetch the validation flags of every catalogue question in one query."""
+    return {
+        question["question_id"]: question
+        async for question in landing_flow_questions_collection.find({}, QUESTION_PROJECTION)
+    }
+
+
+async def load_company_plants(company_id: Optional[str]) -> Set[Tuple[str, str]]:
+    """(company_id, plant_id) of every plant rows may target; all companies when company_id is None."""
+    query = {"company_id": company_id} if company_id is not None else {}
+    return {
+        (plant["company_id"], plant["plant_id"])
+        async for plant in plants_collection.find(query, {"_id": 0, "company_id": 1, "plant_id": 1})
+    }
+
+
+class _ImportWriter:
+    """Accumulates validated rows and flushes them with bulk_write in fixed-size chunks."""
+
+    def __init__(self, user_id: str, result: ImportResult):
+        self.user_id = user_id
+        self.result = result
+        # report key -> ({"responses.<qid>": response}, source row numbers)
+        self.pending: Dict[Tuple[str, str, str], Tuple[Dict[str, Any], List[Tuple[int, str]]]] = {}
+        self.pending_rows = 0
+
+    def add_error(self, row: int, question_id: Optional[str], error: str) -> None:
+        self.result.rows_failed += 1
+        if len(self.result.errors) < settings.REPORT_IMPORT_MAX_ERRORS:
+            self.result.errors.append(ImportRowError(row=row, question_id=question_id, error=error))
+        else:
+            self.result.errors_truncated = True
+
+    async def add(self, key: Tuple[str, str, str], row: int, question_id: str, response: Dict[str, Any]) -> None:
+        fields, rows = self.pending.setdefault(key, ({}, []))
+        fields[f"responses.{question_id}"] = response
+        rows.append((row, question_id))
+        self.pending_rows += 1
+        if self.pending_rows >= settings.REPORT_IMPORT_CHUNK_SIZE:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self.pending:
+            return
+        keys = list(self.pending)
+        now = datetime.now(pytz.UTC)
+        operations = [
+            UpdateOne(
+                {"company_id": company_id, "plant_id": plant_id, "financial_year": financial_year},
+                {
+                    "$set": {**self.pending[(company_id, plant_id, financial_year)][0],
+                             "last_modified_at": now, "last_modified_by": self.user_id},
+                    "$setOnInsert": {"created_at": now, "created_by": self.user_id}
+                },
+                upsert=True
+            )
+            for company_id, plant_id, financial_year in keys
+        ]
+        failed = {}
+        try:
+            await new_reports_collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            failed = {error["index"]: error.get("errmsg", "write failed") for error in e.details.get("writeErrors", [])}
+        except Exception as e:
+            logger.error(f"Failed to write import chunk: {str(e)}", exc_info=True)
+            failed = {index: str(e) for index in range(len(operations))}
+
+        for index, key in enumerate(keys):
+            rows = self.pending[key][1]
+            if index in failed:
+                for row, question_id in rows:
+                    self.add_error(row, question_id, f"Write failed: {failed[index]}")
+            else:
+                self.result.rows_imported += len(rows)
+        self.pending = {}
+        self.pending_rows = 0
+
+
+def validate_row(
+    row: Dict[str, Any],
+    questions: Dict[str, Dict[str, Any]],
+    plants: Set[Tuple[str, str]],
+    company_id: Optional[str]
+) -> Tuple[Tuple[str, str, str], str, Dict[str, Any]]:
+    """
+    Check one import row and build its response.
+
+    Returns:
+        (report key, question_id, response)
+
+    Raises:
+        RowError: If the row is incomplete, targets another company or an unknown plant or
+            question, or its values do not match the question.
+    """
+    missing = [column for column in KEY_COLUMNS if _blank(row.get(column))]
+    if missing:
+        raise RowError(f"Missing {', '.join(missing)}")
+    question_id = str(row["question_id"]).strip()
+    row_company_id = str(row["company_id"]).strip()
+    if company_id is not None and row_company_id != company_id:
+        raise RowError(f"Row belongs to company {row_company_id}, not {company_id}")
+    row_plant_id = str(row["plant_id"]).strip()
+    if (row_company_id, row_plant_id) not in plants:
+        raise RowError(f"Unknown plant {row_plant_id} for company {row_company_id}")
+    if "." in question_id or question_id.startswith("$"):
+        raise RowError("Invalid question_id")
+    question = questions.get(question_id)
+    if question is None:
+        raise RowError("Unknown question_id")
+    key = (row_company_id, row_plant_id, normalize_financial_year(str(row["financial_year"]).strip()))
+    return key, question_id, build_row_response(row, question)
+
+
+def read_validated_chunk(
+    rows: Iterator[Tuple[int, Dict[str, Any]]],
+    size: int,
+    questions: Dict[str, Dict[str, Any]],
+    plants: Set[Tuple[str, str]],
+    company_id: Optional[str]
+) -> List[Tuple[int, Optional[str], Any]]:
+    """
+    Parse and validate up to `size` rows. Blocking; runs in a worker thread.
+
+    Returns:
+        (row number, question_id, (key, response) or the RowError) per row; empty at end of file.
+    """
+    chunk = []
+    for row_number, row in itertools.islice(rows, size):
+        question_id = str(row.get("question_id") or "").strip() or None
+        try:
+            key, question_id, response = validate_row(row, questions, plants, company_id)
+            chunk.append((row_number, question_id, (key, response)))
+        except RowError as e:
+            chunk.append((row_number, question_id, e))
+    return chunk
+
+
+async def import_report_responses(
+    stream: BinaryIO,
+    filename: str,
+    user_id: str,
+    company_id: Optional[str] = None
+) -> ImportResult:
+    """
+    Stream a CSV or XLSX file of report responses into new_report, one chunk at a time.
+
+    Each row holds company_id, plant_id, financial_year, question_id and the response
+    columns (string_value, decimal_value, bool_value, link, note, table). Rows are
+    validated against the question catalogue flags and the company's plants. Parsing and
+    validation run in a worker thread, REPORT_IMPORT_CHUNK_SIZE rows at a time, so only the
+    bulk_write of each chunk runs on the event loop and memory stays flat however many
+    plants the file covers.
+
+    Args:
+        stream: Binary file object positioned at the start of the file.
+        filename: Original file name; its extension selects the parser.
+        user_id: ID of the user performing the import.
+        company_id: When given, rows for any other company are rejected.
+
+    Returns:
+        ImportResult with row counts and a per-row error report.
+
+    Raises:
+        HTTPException: If the file type is unsupported or the file cannot be parsed.
+    """
+    questions = await load_question_metadata()
+    plants = await load_company_plants(company_id)
+    result = ImportResult()
+    writer = _ImportWriter(user_id, result)
+    rows = iter_import_rows(stream, filename)
+
+    try:
+        while True:
+            chunk = await asyncio.to_thread(
+                read_validated_chunk, rows, settings.REPORT_IMPORT_CHUNK_SIZE, questions, plants, company_id
+            )
+            if not chunk:
+                break
+            for row_number, question_id, outcome in chunk:
+                result.rows_processed += 1
+                if isinstance(outcome, RowError):
+                    writer.add_error(row_number, question_id, str(outcome))
+                    continue
+                key, response = outcome
+                await writer.add(key, row_number, question_id, response)
+    except HTTPException:
+        raise
+    except Exception as e:
+        # Rows already flushed stay imported; report where parsing stopped
+        await writer.flush()
+        raise HTTPException(
+            status_code=400,
+            detail=f"Failed to parse file after {result.rows_processed} rows ({result.rows_imported} imported): {str(e)}"
+        )
+
+    await writer.flush()
+    logger.info(f"Imported {result.rows_imported}/{result.rows_processed} report response rows from {filename}")
+    return result
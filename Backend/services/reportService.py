@@ -1,17 +1,18 @@
 from fastapi import HTTPException
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from bson import ObjectId
-from database import company_collection, plants_collection, reports_collection
+from pymongo import ReturnDocument
+from database import client, company_collection, plants_collection, reports_collection, supports_transactions
 from models.base import PyObjectId
 from models.reportModel import Report, UpdateLog, QuestionUpdate
 from report_init import initialize_report
 import logging
+from services.progressJob import mark_progress_dirty
 from services.roleService import get_accessible_questions 
 from utils.getCurrentUser import get_current_user
 
-# Mock imports (replace with actual implementations)
-from questionsMapping import QUESTION_MAPPINGS
+from utils.questionIndex import QUESTION_INDEX, CompiledQuestion, get_at_path, set_at_path
 
 # Set up logging
 logging.basicConfig(level=logging.DEBUG)
@@ -142,6 +143,51 @@ def cast_value(value: Any, question_id: str) -> Any:
             )
     return value  # Default: return as-is for other questions
 
+def check_schema_path(compiled: CompiledQuestion) -> None:
+    """
+    Raises:
+        HTTPException: If the schema_path is too short to address a report field.
+    """
+    if len(compiled.path) < 2:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid schema_path for question {compiled.question_id}: {compiled.schema_path}"
+        )
+
+def projection_for_paths(paths: List[str]) -> Dict[str, int]:
+    """Project only the given dotted paths, dropping any nested under another (MongoDB rejects path collisions)."""
+    projection = {}
+    previous = None
+    for path in sorted(set(paths)):
+        if previous is not None and path.startswith(previous + "."):
+            continue
+        projection[path] = 1
+        previous = path
+    return projection
+
+def stage_question_update(
+    compiled: CompiledQuestion,
+    casted_value: Any,
+    report: Dict[str, Any],
+    user_id: str,
+    update_logs: List[Dict[str, Any]]
+) -> None:
+    """
+    Record the update log entry for one granular question, given the report as it was
+    before the update.
+    """
+    previous_value = get_at_path(report, compiled.path)
+
+    # Log the update
+    update_logs.append(UpdateLog(
+        question_id=compiled.question_id,
+        updated_by=user_id,
+        updated_at=datetime.utcnow(),
+        schema_path=compiled.schema_path,
+        previous_value=str(previous_value) if previous_value is not None else None,
+        new_value=str(casted_value) if casted_value is not None else None
+    ).dict())
+
 async def update_report(company_id: str, plant_id: str, financial_year: str, updates: List[QuestionUpdate], user_id: str) -> Dict[str, str]:
     """
     Update specific question responses in an existing report using question IDs.
@@ -162,38 +208,12 @@ async def update_report(company_id: str, plant_id: str, financial_year: str, upd
     logger.debug(f"Incoming updates: {[update.dict() for update in updates]}")
     normalized_financial_year = normalize_financial_year(financial_year)
 
-    # Validate report existence
-    report = await reports_collection.find_one({
-        "company_id": company_id,
-        "plant_id": plant_id,
-        "financial_year": normalized_financial_year
-    })
-    if not report:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Report for company {company_id}, plant {plant_id}, and financial year {financial_year} not found"
-        )
-    logger.debug(f"Report before update: {report}")
-
-    # Validate plant existence
-    plant = await plants_collection.find_one({
-        "plant_id": plant_id,
-        "company_id": company_id
-    })
-    if not plant:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Plant {plant_id} not found or not associated with company {company_id}"
-        )
-
     # Mock user role for access control (replace with actual logic)
     user_role = "hr"  # Replace with actual role retrieval
     accessible_questions = await get_accessible_questions(company_id, plant_id, financial_year, user_role)
 
-    # Prepare update operations
-    update_ops = {}
-    update_logs = []
-    answered_questions_updates = {}
+    # Validate and cast every update before touching the database
+    staged: List[Tuple[CompiledQuestion, Any]] = []
 
     for update in updates:
         question_id = update.question_id
@@ -201,17 +221,15 @@ async def update_report(company_id: str, plant_id: str, financial_year: str, upd
         if new_value is None:
             logger.warning(f"new_value is None for question_id: {question_id}")
 
-        if question_id not in QUESTION_MAPPINGS:
+        compiled = QUESTION_INDEX.get(question_id)
+        if compiled is None:
             raise HTTPException(status_code=400, detail=f"Invalid question_id: {question_id}")
         if question_id not in accessible_questions:
             raise HTTPException(status_code=403, detail=f"No access to question {question_id}")
 
-        mapping = QUESTION_MAPPINGS[question_id]
-        
         # Check if it's a composite question
-        if "schema_path_composite" in mapping and "subcomponents" in mapping:
+        if compiled.subcomponents:
             # Handle composite question (e.g., Q18a, Q18b)
-            schema_path_base = mapping["schema_path_composite"]
             if not isinstance(new_value, dict):
                 raise HTTPException(
                     status_code=400,
@@ -228,212 +246,93 @@ async def update_report(company_id: str, plant_id: str, financial_year: str, upd
                 for gender, value in genders.items():
                     # Construct granular question_id (e.g., Q18a_permanent_employees_male)
                     granular_id = f"{question_id}_{category}_{gender}"
-                    if granular_id not in mapping["subcomponents"]:
+                    if granular_id not in compiled.subcomponents:
                         raise HTTPException(
                             status_code=400,
                             detail=f"Invalid subcomponent {granular_id} for composite question {question_id}"
                         )
 
-                    # Get the granular mapping
-                    granular_mapping = QUESTION_MAPPINGS.get(granular_id)
-                    if not granular_mapping or "schema_path" not in granular_mapping:
+                    granular = QUESTION_INDEX.get(granular_id)
+                    if granular is None or not granular.schema_path:
                         raise HTTPException(
                             status_code=400,
                             detail=f"No schema_path defined for granular question {granular_id}"
                         )
 
-                    schema_path = granular_mapping["schema_path"]
-                    schema_parts = schema_path.split(".")[1:]
-                    if not schema_parts:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"Invalid schema_path for granular question {granular_id}: {schema_path}"
-                        )
-
-                    # Construct report_path (use schema_path directly without appending granular_id)
-                    report_path = schema_path
-
-                    # Cast value to correct type
-                    casted_value = cast_value(value, granular_id)
-
-                    # Store update operation
-                    update_ops[report_path] = casted_value
-
-                    # Get previous value for logging
-                    current_value = report
-                    for part in report_path.split(".")[:-1]:
-                        current_value = current_value.get(part, {})
-                    previous_value = current_value.get(gender) if isinstance(current_value, dict) else None
-
-                    # Update answered_questions for null <-> non-null transitions
-                    if previous_value is None and casted_value is not None:
-                        if schema_parts[0] == "section_a":
-                            subsection = schema_parts[2] if len(schema_parts) > 2 else schema_parts[-1]
-                            answered_questions_updates[f"section_progress.section_a.{subsection}.answered_questions"] = 1
-                            answered_questions_updates["section_progress.section_a.total.answered_questions"] = 1
-                        elif schema_parts[0] == "section_b":
-                            subsection = schema_parts[2] if len(schema_parts) > 2 else schema_parts[-1]
-                            answered_questions_updates[f"section_progress.section_b.{subsection}.answered_questions"] = 1
-                            answered_questions_updates["section_progress.section_b.total.answered_questions"] = 1
-                        elif schema_parts[0] == "section_c":
-                            principle = schema_parts[2] if len(schema_parts) > 2 else schema_parts[-1]
-                            answered_questions_updates[f"section_progress.section_c.principles.{principle}.answered_questions"] = 1
-                            answered_questions_updates["section_progress.section_c.total.answered_questions"] = 1
-                        module = granular_mapping["module"].lower()
-                        sub_module = granular_mapping["sub_module"].lower().replace(" ", "_")
-                        answered_questions_updates[f"section_progress.modules.{module}.{sub_module}.answered_questions"] = 1
-                    elif previous_value is not None and casted_value is None:
-                        if schema_parts[0] == "section_a":
-                            subsection = schema_parts[2] if len(schema_parts) > 2 else schema_parts[-1]
-                            answered_questions_updates[f"section_progress.section_a.{subsection}.answered_questions"] = -1
-                            answered_questions_updates["section_progress.section_a.total.answered_questions"] = -1
-                        elif schema_parts[0] == "section_b":
-                            subsection = schema_parts[2] if len(schema_parts) > 2 else schema_parts[-1]
-                            answered_questions_updates[f"section_progress.section_b.{subsection}.answered_questions"] = -1
-                            answered_questions_updates["section_progress.section_b.total.answered_questions"] = -1
-                        elif schema_parts[0] == "section_c":
-                            principle = schema_parts[2] if len(schema_parts) > 2 else schema_parts[-1]
-                            answered_questions_updates[f"section_progress.section_c.principles.{principle}.answered_questions"] = -1
-                            answered_questions_updates["section_progress.section_c.total.answered_questions"] = -1
-                        module = granular_mapping["module"].lower()
-                        sub_module = granular_mapping["sub_module"].lower().replace(" ", "_")
-                        answered_questions_updates[f"section_progress.modules.][{module}.{sub_module}.answered_questions"] = -1
-
-                    # Log the update
-                    update_logs.append(UpdateLog(
-                        question_id=granular_id,
-                        updated_by=user_id,
-                        updated_at=datetime.utcnow(),
-                        schema_path=schema_path,
-                        previous_value=str(previous_value) if previous_value is not None else None,
-                        new_value=str(casted_value) if casted_value is not None else None
-                    ).dict())
+                    check_schema_path(granular)
+                    staged.append((granular, cast_value(value, granular_id)))
         else:
             # Handle non-composite (granular) question
-            if "schema_path" not in mapping:
+            if not compiled.schema_path:
                 raise HTTPException(
                     status_code=400,
                     detail=f"No schema_path defined for question {question_id}"
                 )
-            schema_path = mapping["schema_path"]
-            schema_parts = schema_path.split(".")[1:]
-            if not schema_parts:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid schema_path for question {question_id}: {schema_path}"
-                )
 
-            # Construct report_path
-            report_path = schema_path
-
-            # Cast value to correct type
-            casted_value = cast_value(new_value, question_id)
-
-            # Store update operation
-            update_ops[report_path] = casted_value
-
-            # Get previous value for logging
-            current_value = report
-            for part in report_path.split(".")[:-1]:
-                current_value = current_value.get(part, {})
-            previous_value = current_value.get(question_id.split(".")[-1]) if isinstance(current_value, dict) else None
-
-            # Update answered_questions for null <-> non-null transitions
-            if previous_value is None and casted_value is not None:
-                if schema_parts[0] == "section_a":
-                    subsection = schema_parts[2] if len(schema_parts) > 2 else schema_parts[-1]
-                    answered_questions_updates[f"section_progress.section_a.{subsection}.answered_questions"] = 1
-                    answered_questions_updates["section_progress.section_a.total.answered_questions"] = 1
-                elif schema_parts[0] == "section_b":
-                    subsection = schema_parts[2] if len(schema_parts) > 2 else schema_parts[-1]
-                    answered_questions_updates[f"section_progress.section_b.{subsection}.answered_questions"] = 1
-                    answered_questions_updates["section_progress.section_b.total.answered_questions"] = 1
-                elif schema_parts[0] == "section_c":
-                    principle = schema_parts[2] if len(schema_parts) > 2 else schema_parts[-1]
-                    answered_questions_updates[f"section_progress.section_c.principles.{principle}.answered_questions"] = 1
-                    answered_questions_updates["section_progress.section_c.total.answered_questions"] = 1
-                module = mapping["module"].lower()
-                sub_module = mapping["sub_module"].lower().replace(" ", "_")
-                answered_questions_updates[f"section_progress.modules.{module}.{sub_module}.answered_questions"] = 1
-            elif previous_value is not None and casted_value is None:
-                if schema_parts[0] == "section_a":
-                    subsection = schema_parts[2] if len(schema_parts) > 2 else schema_parts[-1]
-                    answered_questions_updates[f"section_progress.section_a.{subsection}.answered_questions"] = -1
-                    answered_questions_updates["section_progress.section_a.total.answered_questions"] = -1
-                elif schema_parts[0] == "section_b":
-                    subsection = schema_parts[2] if len(schema_parts) > 2 else schema_parts[-1]
-                    answered_questions_updates[f"section_progress.section_b.{subsection}.answered_questions"] = -1
-                    answered_questions_updates["section_progress.section_b.total.answered_questions"] = -1
-                elif schema_parts[0] == "section_c":
-                    principle = schema_parts[2] if len(schema_parts) > 2 else schema_parts[-1]
-                    answered_questions_updates[f"section_progress.section_c.principles.{principle}.answered_questions"] = -1
-                    answered_questions_updates["section_progress.section_c.total.answered_questions"] = -1
-                module = mapping["module"].lower()
-                sub_module = mapping["sub_module"].lower().replace(" ", "_")
-                answered_questions_updates[f"section_progress.modules.{module}.{sub_module}.answered_questions"] = -1
-
-            # Log the update
-            update_logs.append(UpdateLog(
-                question_id=question_id,
-                updated_by=user_id,
-                updated_at=datetime.utcnow(),
-                schema_path=schema_path,
-                previous_value=str(previous_value) if previous_value is not None else None,
-                new_value=str(casted_value) if casted_value is not None else None
-            ).dict())
+            check_schema_path(compiled)
+            staged.append((compiled, cast_value(new_value, question_id)))
 
-    logger.debug(f"Update operations: {update_ops}")
-    report_update_dict = {
-        "$set": {
-            **update_ops,
-            "updated_at": datetime.utcnow(),
-            "updated_by": user_id
-        },
-        "$push": {"updates": {"$each": update_logs}}
+    report_filter = {
+        "company_id": company_id,
+        "plant_id": plant_id,
+        "financial_year": normalized_financial_year
     }
-    logger.debug(f"Report update dict: {report_update_dict}")
+    update_ops = {compiled.schema_path: casted_value for compiled, casted_value in staged}
+    logger.debug(f"Update operations: {update_ops}")
 
-    try:
-        result = await reports_collection.update_one(
-            {
-                "company_id": company_id,
-                "plant_id": plant_id,
-                "financial_year": normalized_financial_year
-            },
-            report_update_dict
+    async def apply_update(session) -> None:
+        # Validate plant existence; progress is only marked dirty afterwards, which accepts any plant
+        plant = await plants_collection.find_one(
+            {"plant_id": plant_id, "company_id": company_id},
+            {"_id": 1},
+            session=session
+        )
+        if not plant:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Plant {plant_id} not found or not associated with company {company_id}"
+            )
+
+        # One atomic write that also returns the previous values of the touched fields
+        report = await reports_collection.find_one_and_update(
+            report_filter,
+            {"$set": {**update_ops, "updated_at": datetime.utcnow(), "updated_by": user_id}},
+            projection=projection_for_paths(list(update_ops)) or {"_id": 1},
+            return_document=ReturnDocument.BEFORE,
+            session=session
         )
-        logger.debug(f"MongoDB update result: modified_count={result.modified_count}, matched_count={result.matched_count}")
-        if result.modified_count == 0 and result.matched_count > 0:
-            logger.error(f"No changes applied to report. Update ops: {update_ops}, Report: {report}")
-            raise HTTPException(status_code=400, detail="No changes applied to the report despite matching document")
-        elif result.matched_count == 0:
-            logger.error(f"No document matched for update. Query: company_id={company_id}, plant_id={plant_id}, financial_year={normalized_financial_year}")
-            raise HTTPException(status_code=404, detail="Report not found during update")
+        if not report:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Report for company {company_id}, plant {plant_id}, and financial year {financial_year} not found"
+            )
+
+        # Progress counters are recomputed from report contents, so only the log is kept here
+        update_logs: List[Dict[str, Any]] = []
+        for compiled, casted_value in staged:
+            stage_question_update(compiled, casted_value, report, user_id, update_logs)
+
+        if update_logs:
+            await reports_collection.update_one(
+                report_filter,
+                {"$push": {"updates": {"$each": update_logs}}},
+                session=session
+            )
+
+    try:
+        if await supports_transactions():
+            # Report values and update log commit or roll back together
+            async with await client.start_session() as session:
+                await session.with_transaction(apply_update)
+        else:
+            await apply_update(None)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to update report: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to update report: {str(e)}")
 
-    updated_report = await reports_collection.find_one({
-        "company_id": company_id,
-        "plant_id": plant_id,
-        "financial_year": normalized_financial_year
-    })
-    logger.debug(f"Report after update: {updated_report}")
-
-    if answered_questions_updates:
-        try:
-            plant_update_dict = {
-                "$inc": answered_questions_updates,
-                "$set": {"updated_at": datetime.utcnow()}
-            }
-            plant_result = await plants_collection.update_one(
-                {"plant_id": plant_id, "company_id": company_id},
-                plant_update_dict
-            )
-            if plant_result.modified_count == 0:
-                raise HTTPException(status_code=500, detail="Failed to update plant answered_questions")
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Failed to update plant: {str(e)}")
+    await mark_progress_dirty(company_id, plant_id)
 
     return {
         "message": f"Report for company {company_id}, plant {plant_id}, and financial year {financial_year} updated successfully"
@@ -521,39 +420,26 @@ async def get_report(company_id: str, plant_id: str, financial_year: str, user_i
 
     # Copy accessible question responses
     for question_id in accessible_questions:
-        if question_id not in QUESTION_MAPPINGS:
+        compiled = QUESTION_INDEX.get(question_id)
+        if compiled is None:
             logger.warning(f"Question {question_id} not found in QUESTION_MAPPINGS")
             continue
 
-        schema_path = QUESTION_MAPPINGS[question_id].get("schema_path")
-        if not schema_path or not schema_path.startswith(("section_a", "section_b", "section_c")):
-            logger.warning(f"Invalid schema_path for question {question_id}: {schema_path}")
+        if not compiled.in_report:
+            logger.warning(f"Invalid schema_path for question {question_id}: {compiled.schema_path}")
             continue
 
-        logger.debug(f"Processing question {question_id} with schema_path: {schema_path}")
-
         try:
             # Navigate to the question in the original report
-            current = report
-            path_parts = schema_path.split(".")
-            for part in path_parts[:-1]:
-                current = current.get(part, {})
-                if not isinstance(current, dict):
-                    logger.debug(f"Path {part} in {schema_path} is not a dict for {question_id}")
-                    break
-            value = current.get(path_parts[-1])
-            logger.debug(f"Value for {question_id} at {schema_path}: {value}")
+            value = get_at_path(report, compiled.path)
 
             if value is not None:
                 # Navigate to the target in the filtered report
-                target = filtered_report
-                for part in path_parts[:-1]:
-                    target = target.setdefault(part, {})
-                target[path_parts[-1]] = value
+                set_at_path(filtered_report, compiled.path, value)
             else:
-                logger.debug(f"No data found for {question_id} at {schema_path}")
+                logger.debug(f"No data found for {question_id} at {compiled.schema_path}")
         except Exception as e:
-            logger.error(f"Failed to process question {question_id} with path {schema_path}: {str(e)}")
+            logger.error(f"Failed to process question {question_id} with path {compiled.schema_path}: {str(e)}")
             continue
 
     # Validate filtered report with Pydantic
@@ -1,9 +1,16 @@
 from fastapi import HTTPException
-from typing import Dict, List
+from typing import Dict, FrozenSet, List
 from datetime import datetime
 from database import role_access_collection, plants_employees_collection, landing_flow_questions_collection
+from utils.versionedCache import VersionedCache, bump_version
 import uuid
 
+# Version namespaces bumped whenever the underlying data changes
+QUESTIONS_VERSION = "questions"
+ROLE_ACCESS_VERSION = "role_access"
+
+accessible_questions_cache = VersionedCache((QUESTIONS_VERSION, ROLE_ACCESS_VERSION))
+
 async def update_permissions(
     company_id: str,
     plant_id: str,
@@ -92,6 +99,8 @@ async def update_permissions(
         if result.modified_count == 0:
             raise HTTPException(status_code=500, detail="Failed to update employee roles")
 
+        await bump_version(ROLE_ACCESS_VERSION)
+
         return {"message": "Permissions updated successfully"}
     except HTTPException as e:
         raise e
@@ -187,9 +196,12 @@ def is_valid_uuid(val: str) -> bool:
     except ValueError:
         return False
 
-async def get_accessible_questions(company_id: str, plant_id: str, financial_year: str, user_role: str) -> List[str]:
+async def get_accessible_questions(company_id: str, plant_id: str, financial_year: str, user_role: str) -> FrozenSet[str]:
     """
-    Get list of question IDs accessible to a user role.
+    Get the set of question IDs accessible to a user role.
+
+    Results are cached per (company, plant, financial year, role) and invalidated when the
+    question catalogue or role permissions version changes.
 
     Args:
         company_id: Company identifier.
@@ -198,12 +210,18 @@ async def get_accessible_questions(company_id: str, plant_id: str, financial_yea
         user_role: User role to check permissions for.
 
     Returns:
-        List of question IDs accessible to the user role.
+        Frozenset of question IDs accessible to the user role.
     """
-    try:
+    async def load_question_ids() -> FrozenSet[str]:
         # For now, return all questions since we're using the new collection
-        questions = await landing_flow_questions_collection.find({}).to_list(None)
-        return [q["question_id"] for q in questions]
+        cursor = landing_flow_questions_collection.find({}, {"question_id": 1, "_id": 0})
+        return frozenset([q["question_id"] async for q in cursor])
+
+    try:
+        return await accessible_questions_cache.get_or_load(
+            (company_id, plant_id, financial_year, user_role),
+            load_question_ids
+        )
     except Exception as e:
         print(f"Error getting accessible questions: {str(e)}")
-        return []
\ No newline at end of file
+        return frozenset()
@@ -0,0 +1,162 @@
+"""
+Explain every hot query shape used by the services and fail on any COLLSCAN.
+
+Runs against a local/throwaway mongod and is skipped when MONGO_URI is unset:
+
+    MONGO_URI=mongodb://localhost:27017 python -m pytest tests/test_query_plans.py
+
+The planned indexes are created first, because the planner reports EOF rather than
+COLLSCAN for collections that do not exist. Paged and filtered shapes are built with the
+same helpers the services query with, so a change to a service filter is checked here.
+"""
+import asyncio
+import os
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+if not os.getenv("MONGO_URI"):
+    pytest.skip("MONGO_URI is not set", allow_module_level=True)
+
+# Add parent directory to path to import from Backend
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bson import ObjectId
+from database import (
+    INDEX_PLAN,
+    reconcile_indexes,
+    reports_collection,
+    new_reports_collection,
+    landing_flow_responses_collection,
+    landing_flow_questions_collection,
+    plants_employees_collection,
+    role_access_collection,
+    company_collection,
+    plants_collection,
+    auth_users_collection,
+    modules_collection,
+    module_submodules_collection,
+    module_categories_collection,
+    module_questions_collection,
+    credentials_collection,
+    audit_events_collection,
+    notification_inbox_collection,
+    chat_messages_collection
+)
+from services.auditServices import AUDIT_SORT, build_audit_query
+from services.chatHistoryService import CHAT_SORT, build_conversation_query
+from services.credentialService import normalize_email
+from services.notificationService import INBOX_SORT, build_inbox_query
+from services.questionCatalogService import CATALOGUE_SORT, build_catalogue_query
+from services.reportExportService import EXPORT_SORT, build_export_query
+from utils.pagination import encode_cursor, encode_position_cursor
+
+PLANT_YEAR = {"company_id": "C1", "plant_id": "P1", "financial_year": "2024_2025"}
+CURSOR = encode_cursor(datetime.utcnow(), ObjectId())
+
+QueryShape = Tuple[str, Any, Dict, Optional[List]]
+
+
+def build_query_shapes() -> List[QueryShape]:
+    """(label, collection, filter, sort) for every hot query the services issue."""
+    return [
+        # Paged and filtered reads, built by the services' own helpers
+        ("new_report company export", new_reports_collection,
+         build_export_query("new_report", "C1", "2024-2025", ["P1", "P2"], None)["filter"], EXPORT_SORT),
+        ("reports company export", reports_collection,
+         build_export_query("reports", "C1", None, None, None)["filter"], EXPORT_SORT),
+        ("catalogue questions by module", landing_flow_questions_collection,
+         build_catalogue_query("landing_flow", cursor=encode_position_cursor(10)), CATALOGUE_SORT),
+        ("catalogue questions by category", landing_flow_questions_collection,
+         build_catalogue_query("landing_flow", category_id="corporate_identity"), CATALOGUE_SORT),
+        ("audit events page", audit_events_collection,
+         build_audit_query("C1", "P1", "2024_2025", cursor=CURSOR), AUDIT_SORT),
+        ("notification inbox page", notification_inbox_collection,
+         build_inbox_query("C1", "P1", "U1", cursor=CURSOR), INBOX_SORT),
+        ("notification unread count", notification_inbox_collection,
+         build_inbox_query("C1", "P1", "U1", unread_only=True), None),
+        ("chat history first page", chat_messages_collection,
+         build_conversation_query("U1", "default"), CHAT_SORT),
+        ("chat history page", chat_messages_collection,
+         build_conversation_query("U1", "default", CURSOR), CHAT_SORT),
+        ("credential by email", credentials_collection,
+         {"email": normalize_email("A@example.com")}, [("financial_year", -1)]),
+
+        # Point lookups by key
+        ("reports by plant/year", reports_collection, PLANT_YEAR, None),
+        ("new_report by plant/year", new_reports_collection, PLANT_YEAR, None),
+        ("landing_flow_responses by plant/year", landing_flow_responses_collection, PLANT_YEAR, None),
+        ("landing_flow_questions by id", landing_flow_questions_collection, {"question_id": "Q1"}, None),
+        ("plants_employees by plant/year", plants_employees_collection, PLANT_YEAR, None),
+        ("plants_employees login fallback", plants_employees_collection,
+         {"$or": [{"plant_manager.contact_email": {"$in": ["a@example.com"]}},
+                  {"employees.email": {"$in": ["a@example.com"]}}]}, None),
+        ("plants_employees employee check", plants_employees_collection,
+         {**PLANT_YEAR, "employees": {"$elemMatch": {"name": "A", "email": "a@example.com"}}}, None),
+        ("role_access by plant/year", role_access_collection, PLANT_YEAR, None),
+        ("company by id", company_collection, {"company_id": "C1"}, None),
+        ("plant by company/plant", plants_collection, {"company_id": "C1", "plant_id": "P1"}, None),
+        ("plant by plant_id", plants_collection, {"plant_id": "P1"}, None),
+        ("auth user by email", auth_users_collection, {"email": "a@example.com"}, None),
+        ("module by id", modules_collection, {"id": "M1"}, None),
+        ("modules by ids", modules_collection, {"id": {"$in": ["M1", "M2"]}}, None),
+        ("modules by plant/year", modules_collection, PLANT_YEAR, None),
+        ("module by name", modules_collection, {**PLANT_YEAR, "module_name": "Environment"}, None),
+        ("submodules by module", module_submodules_collection, {"module_id": {"$in": ["M1"]}}, [("position", 1)]),
+        ("submodule by id", module_submodules_collection, {"id": "S1", "module_id": "M1"}, None),
+        ("categories by submodule", module_categories_collection,
+         {"module_id": "M1", "submodule_id": "S1"}, [("position", 1)]),
+        ("questions by category", module_questions_collection,
+         {"module_id": "M1", "submodule_id": "S1", "category_id": "C1"}, [("position", 1)]),
+        ("question by category/id", module_questions_collection,
+         {"category_id": "C1", "question_id": "Q1", "module_id": "M1", "submodule_id": "S1"}, None),
+        ("credentials by plant", credentials_collection, PLANT_YEAR, None),
+    ]
+
+
+QUERY_SHAPES = build_query_shapes()
+
+
+def find_stages(plan: Any) -> List[str]:
+    """Collect every `stage` name in an explain document, at any depth."""
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            stages.extend(find_stages(value))
+    elif isinstance(plan, list):
+        for value in plan:
+            stages.extend(find_stages(value))
+    return stages
+
+
+async def explain_query_shapes() -> Dict[str, List[str]]:
+    await reconcile_indexes()
+    plans = {}
+    for label, collection, query, sort in QUERY_SHAPES:
+        cursor = collection.find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        explain = await cursor.limit(50).explain()
+        plans[label] = find_stages(explain.get("queryPlanner", {}).get("winningPlan", {}))
+    return plans
+
+
+@pytest.fixture(scope="module")
+def winning_plans() -> Dict[str, List[str]]:
+    # One event loop for every explain: the motor client binds to the loop it is first used on
+    return asyncio.run(explain_query_shapes())
+
+
+def test_queried_collections_have_planned_indexes():
+    missing = sorted({collection.name for _, collection, _, _ in QUERY_SHAPES} - set(INDEX_PLAN))
+    assert not missing, f"collections queried but absent from INDEX_PLAN: {missing}"
+
+
+@pytest.mark.parametrize("label", [shape[0] for shape in QUERY_SHAPES])
+def test_query_shape_uses_index(winning_plans, label):
+    stages = winning_plans[label]
+    assert "COLLSCAN" not in stages, f"{label} falls back to COLLSCAN: {' > '.join(stages)}"
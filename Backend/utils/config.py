@@ -5,6 +5,35 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     gemini_api_key: str = ""
+    CACHE_VERSION_POLL_SECONDS: float = 5.0
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    AUDIT_QUEUE_MAX_SIZE: int = 10000
+    AUDIT_BATCH_SIZE: int = 100
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_ENQUEUE_TIMEOUT_SECONDS: float = 0.5
+    GEMINI_MODEL: str = "gemini-1.5-flash"
+    GEMINI_MAX_CONCURRENCY: int = 8
+    GEMINI_TIMEOUT_SECONDS: float = 60.0
+    GEMINI_USE_FAKE_MODEL: bool = False
+    STREAM_REGISTRY_BACKEND: str = "memory"
+    STREAM_SESSION_TTL_SECONDS: float = 300.0
+    STREAM_REGISTRY_MAX_SIZE: int = 10000
+    GEMINI_CACHE_ENABLED: bool = True
+    GEMINI_CACHE_MAX_ENTRIES: int = 512
+    GEMINI_CACHE_TTL_SECONDS: float = 86400.0
+    GEMINI_CACHE_MONGO: bool = False
+    GEMINI_CACHE_REPLAY_CHUNK_CHARS: int = 200
+    CHAT_HISTORY_RECENT_MESSAGES: int = 50
+    CHAT_HISTORY_MAX_CONVERSATIONS: int = 1000
+    PROGRESS_RECOMPUTE_INTERVAL_SECONDS: float = 2.0
+    REPORT_IMPORT_CHUNK_SIZE: int = 500
+    REPORT_IMPORT_MAX_ERRORS: int = 1000
+    REPORT_EXPORT_BATCH_SIZE: int = 200
+    REPORT_EXPORT_MAX_BATCH_SIZE: int = 2000
+    TABLE_VALIDATION_CACHE_SIZE: int = 4096
+    MODULE_STORAGE_MODE: str = "embedded"  # "embedded" or "normalized"
+    MODULE_CACHE_MAX_ENTRIES: int = 1024
 
     class Config:
         env_file = ".env"
@@ -1,4 +1,6 @@
+from bson import ObjectId
 from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
 
 def parse_question_id(question_id: str) -> str:
     if question_id.startswith("A0"):
@@ -8,4 +10,8 @@ def parse_question_id(question_id: str) -> str:
     elif question_id.startswith("C"):
         return "C"
     else:
-        raise HTTPException(status_code=400, detail="Invalid question_id format")
\ No newline at end of file
+        raise HTTPException(status_code=400, detail="Invalid question_id format")
+
+def serialize_mongo_document(doc):
+    """Convert nested ObjectId and datetime values to JSON-safe types in a single pass."""
+    return jsonable_encoder(doc, custom_encoder={ObjectId: str})
\ No newline at end of file
@@ -0,0 +1,53 @@
+import json
+import os
+import threading
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+
+def load_json_data(filename: str) -> Any:
+    """Parse a file from Backend/data."""
+    with open(os.path.join(DATA_DIR, filename), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class LazyMapping(Mapping):
+    """
+    Read-only mapping built by `loader` on first access instead of at import time.
+
+    Behaves like the dict it wraps (`get`, `in`, iteration, `values()` ...), so module-level
+    tables can be made lazy without touching their callers.
+    """
+
+    def __init__(self, loader: Callable[[], Dict[Any, Any]]):
+        self._loader = loader
+        self._data = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._data is not None
+
+    def _load(self) -> Dict[Any, Any]:
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    self._data = self._loader()
+        return self._data
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._load()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._load().get(key, default)
@@ -0,0 +1,102 @@
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+from logging import getLogger
+
+from database import reports_collection, schema_migrations_collection
+from services.auditServices import migrate_embedded_audit_logs
+from services.credentialService import rebuild_all_credentials
+from services.notificationService import migrate_embedded_notifications
+from services.progressService import recompute_section_progress
+from services.questionCatalogService import dedupe_catalogue_questions, load_catalogue_file, sync_catalogue
+from services.roleService import QUESTIONS_VERSION
+from utils.versionedCache import bump_version
+
+logger = getLogger(__name__)
+
+
+class Migration(NamedTuple):
+    migration_id: str
+    description: str
+    run: Callable[[], Awaitable[Any]]
+
+
+async def normalize_report_financial_year() -> int:
+    """Rewrite report financial years like '2024-2025' to '2024_2025' in one server-side update."""
+    result = await reports_collection.update_many(
+        {"financial_year": {"$regex": "\\d{4}-\\d{4}"}},
+        [{"$set": {"financial_year": {
+            "$replaceAll": {"input": "$financial_year", "find": "-", "replacement": "_"}
+        }}}]
+    )
+    return result.modified_count
+
+
+async def backfill_catalogue_lineage() -> Dict[str, int]:
+    """
+    Re-sync data/questions.json so catalogue questions synced before paging get their module
+    lineage and position; GET /questions/module/{module_id} filters on them.
+    """
+    counts = await sync_catalogue(load_catalogue_file())
+    if any(counts[key] for key in ("inserted", "updated", "deleted")):
+        await bump_version(QUESTIONS_VERSION)
+    return counts
+
+
+# Applied in order; IDs are permanent once released. Every migration must be safe to re-run,
+# since a crash between running it and recording it will run it again.
+MIGRATIONS: List[Migration] = [
+    Migration("0001_normalize_report_financial_year", "Normalize report financial_year to YYYY_YYYY", normalize_report_financial_year),
+    Migration("0002_rebuild_credentials", "Backfill the login credential index", rebuild_all_credentials),
+    Migration("0003_migrate_audit_logs", "Split embedded audit logs into audit_events", migrate_embedded_audit_logs),
+    Migration("0004_migrate_notifications", "Fan embedded notifications out into notification_inbox", migrate_embedded_notifications),
+    Migration("0005_recompute_section_progress", "Recompute drifted plant section_progress counters", recompute_section_progress),
+    Migration("0006_dedupe_catalogue_questions", "Dedupe landing_flow_questions and make question_id unique", dedupe_catalogue_questions),
+    Migration("0007_rebuild_credential_user_ids", "Rebuild credentials so accounts without employee_id key on email", rebuild_all_credentials),
+    Migration("0008_backfill_catalogue_lineage", "Store module lineage and position on catalogue questions", backfill_catalogue_lineage),
+]
+
+
+async def get_applied_migrations() -> Dict[str, Dict[str, Any]]:
+    return {doc["_id"]: doc async for doc in schema_migrations_collection.find({})}
+
+
+async def run_migrations(target: Optional[str] = None, dry_run: bool = False) -> List[str]:
+    """
+    Apply pending migrations in order and record each one in `schema_migrations`.
+
+    Args:
+        target: Stop after applying this migration ID.
+        dry_run: Only report which migrations are pending.
+
+    Returns:
+        IDs of the migrations applied (or pending, for a dry run).
+
+    Raises:
+        ValueError: If `target` is not a known migration ID.
+    """
+    if target is not None and target not in {m.migration_id for m in MIGRATIONS}:
+        raise ValueError(f"Unknown migration: {target}")
+
+    applied = await get_applied_migrations()
+    ran = []
+    for migration in MIGRATIONS:
+        if migration.migration_id not in applied:
+            ran.append(migration.migration_id)
+            if not dry_run:
+                logger.info(f"Applying migration {migration.migration_id}: {migration.description}")
+                started_at = datetime.utcnow()
+                result = await migration.run()
+                await schema_migrations_collection.replace_one(
+                    {"_id": migration.migration_id},
+                    {
+                        "description": migration.description,
+                        "started_at": started_at,
+                        "applied_at": datetime.utcnow(),
+                        "result": result
+                    },
+                    upsert=True
+                )
+                logger.info(f"Applied migration {migration.migration_id}: {result}")
+        if migration.migration_id == target:
+            break
+    return ran
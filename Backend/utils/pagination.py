@@ -0,0 +1,45 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Tuple
+from bson import ObjectId
+from fastapi import HTTPException
+
+
+def encode_cursor(sort_value: datetime, doc_id: ObjectId) -> str:
+    """Encode the (timestamp, _id) position of the last returned document as an opaque cursor."""
+    payload = json.dumps({"t": sort_value.isoformat(), "id": str(doc_id)})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        return datetime.fromisoformat(payload["t"]), ObjectId(payload["id"])
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def encode_position_cursor(position: int) -> str:
+    """Encode the position of the last returned document for ascending, unique-position paging."""
+    return base64.urlsafe_b64encode(json.dumps({"p": position}).encode()).decode()
+
+
+def decode_position_cursor(cursor: str) -> int:
+    try:
+        return int(json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())["p"])
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def after_cursor(cursor: str, sort_field: str) -> Dict[str, Any]:
+    """
+    Build the filter selecting documents after `cursor` in (sort_field desc, _id desc) order.
+    """
+    sort_value, doc_id = decode_cursor(cursor)
+    return {
+        "$or": [
+            {sort_field: {"$lt": sort_value}},
+            {sort_field: sort_value, "_id": {"$lt": doc_id}}
+        ]
+    }
@@ -0,0 +1,77 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, TypeVar
+
+from passlib.context import CryptContext
+
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# bcrypt releases the GIL while hashing, so a small thread pool keeps the event loop free
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+
+# Caps work submitted to the pool; callers beyond this wait (backpressure) instead of piling up
+_slots = asyncio.Semaphore(settings.PASSWORD_HASH_MAX_PENDING)
+
+_stats = {
+    "waiting": 0,      # callers blocked on a free slot
+    "pending": 0,      # submitted to the pool (queued or running)
+    "completed": 0,
+    "failed": 0,
+    "peak_pending": 0
+}
+
+
+async def _run(func: Callable[..., T], *args) -> T:
+    _stats["waiting"] += 1
+    try:
+        await _slots.acquire()
+    finally:
+        _stats["waiting"] -= 1
+
+    _stats["pending"] += 1
+    _stats["peak_pending"] = max(_stats["peak_pending"], _stats["pending"])
+    try:
+        result = await asyncio.get_running_loop().run_in_executor(_executor, func, *args)
+        _stats["completed"] += 1
+        return result
+    except Exception:
+        _stats["failed"] += 1
+        raise
+    finally:
+        _stats["pending"] -= 1
+        _slots.release()
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password with bcrypt on the password-hashing pool."""
+    return await _run(pwd_context.hash, password)
+
+
+async def verify_password(password: str, password_hash: str) -> bool:
+    """Verify a password against a bcrypt hash on the password-hashing pool."""
+    return await _run(pwd_context.verify, password, password_hash)
+
+
+def get_password_hasher_stats() -> Dict[str, int]:
+    """Queue-depth and throughput counters for the password-hashing pool."""
+    return {
+        **_stats,
+        "workers": settings.PASSWORD_HASH_WORKERS,
+        "max_pending": settings.PASSWORD_HASH_MAX_PENDING
+    }
+
+
+def shutdown_password_hasher() -> None:
+    """Stop accepting work and wait for in-flight hashes to finish."""
+    logger.info("Shutting down password hashing pool")
+    _executor.shutdown(wait=True)
@@ -0,0 +1,136 @@
+from typing import Any, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from questionsMapping import QUESTION_MAPPINGS
+from utils.lazyData import LazyMapping
+
+REPORT_SECTIONS = ("section_a", "section_b", "section_c")
+
+# Plant section_progress field for each mapping (section, sub_section); section C is keyed by principle
+SECTION_PROGRESS_FIELDS: Dict[Tuple[str, str], str] = {
+    ("A", "Entity Details"): "section_a.entity_details",
+    ("A", "Corporate Structure"): "section_a.stock_and_subsidiaries",
+    ("A", "Operations"): "section_a.products_and_operations",
+    ("A", "Products and Services"): "section_a.products_and_operations",
+    ("A", "CSR Details"): "section_a.csr_and_governance",
+    ("A", "Transparency and Disclosures"): "section_a.csr_and_governance",
+    ("A", "Employees"): "section_a.employees",
+    ("B", "Policy and Governance"): "section_b.policy_and_governance",
+}
+
+SECTION_TOTAL_FIELDS: Dict[str, str] = {
+    "A": "section_a.total",
+    "B": "section_b.total",
+    "C": "section_c.total",
+}
+
+# Plant section_progress field for each mapping (module, sub_module)
+MODULE_PROGRESS_FIELDS: Dict[Tuple[str, str], str] = {
+    ("Workforce", "Workforce Details"): "modules.workforce.workforce_details",
+    ("Workforce", "Workforce"): "modules.workforce.workforce_details",
+    ("Workforce", "Employee Well-Being"): "modules.workforce.employee_wellbeing",
+    ("Workforce", "Human Rights"): "modules.workforce.human_rights",
+    ("Legal", "Policy and Governance"): "modules.legal.policy_and_governance",
+    ("Legal", "Ethical Conduct"): "modules.legal.ethical_conduct",
+    ("Legal", "Policy Advocacy"): "modules.legal.policy_advocacy",
+    ("Finance", "Products and Services"): "modules.finance.products_and_services",
+    ("Finance", "CSR"): "modules.finance.csr",
+    ("Finance", "Inclusive Growth"): "modules.finance.inclusive_growth",
+    ("Finance", "Transparency and Grievances"): "modules.finance.transparency_and_governance",
+    ("Finance", "Consumer Responsibility"): "modules.finance.consumer_responsibility",
+    ("Admin", "Entity Details"): "modules.admin.entity_details",
+    ("Admin", "Operations"): "modules.admin.operations",
+    ("Admin", "Corporate Structure"): "modules.admin.corporate_structure",
+    ("Admin", "Stakeholder Engagement"): "modules.admin.stakeholder_engagement",
+    ("Environment", "Sustainable Products"): "modules.environment.sustainable_products",
+    ("Environment", "Energy and Emissions"): "modules.environment.energy_emission",
+    ("Environment", "Water and Waste"): "modules.environment.water_and_waste",
+    ("Environment", "Environmental Compliance"): "modules.environment.environmental_compliance",
+}
+
+
+class CompiledQuestion(NamedTuple):
+    """Pre-parsed view of a QUESTION_MAPPINGS entry."""
+    question_id: str
+    schema_path: Optional[str]
+    path: Tuple[str, ...]                 # schema_path split on "."
+    parent_path: Tuple[str, ...]          # path without the leaf
+    leaf_key: Optional[str]               # last path component
+    in_report: bool                       # path lives under section_a/b/c
+    progress_keys: Tuple[str, ...]        # plant section_progress counters the question counts towards
+    subcomponents: FrozenSet[str]         # granular ids for composite questions, empty otherwise
+
+
+def progress_keys_for(question_id: str, mapping: Dict[str, Any]) -> Tuple[str, ...]:
+    """
+    Look up the plant section_progress counter keys for a question.
+
+    Args:
+        question_id: Question ID, for the error message.
+        mapping: QUESTION_MAPPINGS entry with section, sub_section, principle, module and sub_module.
+
+    Returns:
+        Tuple of dotted `section_progress...answered_questions` keys.
+
+    Raises:
+        ValueError: If the section or module of the mapping has no progress field.
+    """
+    fields = []
+    section = mapping.get("section")
+    if section == "C" and mapping.get("principle"):
+        number = mapping["principle"].split()[-1]
+        fields.append(f"section_c.principles.principle_{number}")
+    elif section:
+        field = SECTION_PROGRESS_FIELDS.get((section, mapping.get("sub_section")))
+        if field is None:
+            raise ValueError(f"No section progress field for {question_id}: {section} / {mapping.get('sub_section')}")
+        fields.append(field)
+    if section:
+        fields.append(SECTION_TOTAL_FIELDS[section])
+    if mapping.get("module") and mapping.get("sub_module"):
+        field = MODULE_PROGRESS_FIELDS.get((mapping["module"], mapping["sub_module"]))
+        if field is None:
+            raise ValueError(f"No module progress field for {question_id}: {mapping['module']} / {mapping['sub_module']}")
+        fields.append(field)
+    return tuple(f"section_progress.{field}.answered_questions" for field in fields)
+
+
+def compile_question(question_id: str, mapping: Dict[str, Any]) -> CompiledQuestion:
+    schema_path = mapping.get("schema_path")
+    path = tuple(schema_path.split(".")) if schema_path else ()
+    return CompiledQuestion(
+        question_id=question_id,
+        schema_path=schema_path,
+        path=path,
+        parent_path=path[:-1],
+        leaf_key=path[-1] if path else None,
+        in_report=bool(path) and path[0] in REPORT_SECTIONS,
+        progress_keys=progress_keys_for(question_id, mapping),
+        subcomponents=frozenset(mapping.get("subcomponents", ()))
+    )
+
+
+def build_question_index(mappings: Dict[str, Dict[str, Any]]) -> Dict[str, CompiledQuestion]:
+    """Compile every mapping once so request handlers never re-split schema paths."""
+    return {question_id: compile_question(question_id, mapping) for question_id, mapping in mappings.items()}
+
+
+# Compiled on first lookup so importing the services does not parse the mapping table
+QUESTION_INDEX: Dict[str, CompiledQuestion] = LazyMapping(lambda: build_question_index(QUESTION_MAPPINGS))
+
+
+def get_at_path(document: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    """Walk a nested dict along `path`, returning None as soon as a level is missing."""
+    current = document
+    for part in path:
+        if not isinstance(current, dict):
+            return None
+        current = current.get(part)
+    return current
+
+
+def set_at_path(document: Dict[str, Any], path: Tuple[str, ...], value: Any) -> None:
+    """Set `value` at `path`, creating intermediate dicts as needed."""
+    target = document
+    for part in path[:-1]:
+        target = target.setdefault(part, {})
+    target[path[-1]] = value
@@ -0,0 +1,103 @@
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+from logging import getLogger
+
+from database import gemini_responses_collection
+from utils.config import settings
+
+logger = getLogger(__name__)
+
+
+def prompt_cache_key(model: str, prompt: str) -> str:
+    """Content address of a generation: the same model and prompt always map to the same key."""
+    return hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier cache of generated text keyed by `prompt_cache_key`.
+
+    The first tier is a per-process LRU. The optional second tier is the `gemini_responses`
+    collection, shared by all workers and expired by a TTL index (see init_db); a hit there
+    is copied into the LRU. Both tiers honour the same TTL.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, use_mongo: bool = False):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.use_mongo = use_mongo
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self.counters = {"memory_hits": 0, "mongo_hits": 0, "misses": 0, "stores": 0, "errors": 0}
+
+    def _remember(self, key: str, text: str, expires_at: float) -> None:
+        self._entries[key] = (expires_at, text)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.counters["memory_hits"] += 1
+                return entry[1]
+            del self._entries[key]
+
+        if self.use_mongo:
+            try:
+                now = datetime.utcnow()
+                doc = await gemini_responses_collection.find_one(
+                    {"_id": key, "expires_at": {"$gt": now}},
+                    {"response": 1, "expires_at": 1}
+                )
+            except Exception as e:
+                self.counters["errors"] += 1
+                logger.error(f"Error reading Gemini response cache: {str(e)}")
+                doc = None
+            if doc:
+                remaining = (doc["expires_at"] - now).total_seconds()
+                self._remember(key, doc["response"], time.monotonic() + remaining)
+                self.counters["mongo_hits"] += 1
+                return doc["response"]
+
+        self.counters["misses"] += 1
+        return None
+
+    async def set(self, key: str, model: str, text: str) -> None:
+        if not text:
+            return
+        self._remember(key, text, time.monotonic() + self.ttl)
+        self.counters["stores"] += 1
+        if not self.use_mongo:
+            return
+        now = datetime.utcnow()
+        try:
+            await gemini_responses_collection.replace_one(
+                {"_id": key},
+                {"model": model, "response": text, "created_at": now, "expires_at": now + timedelta(seconds=self.ttl)},
+                upsert=True
+            )
+        except Exception as e:
+            self.counters["errors"] += 1
+            logger.error(f"Error writing Gemini response cache: {str(e)}")
+
+    def stats(self) -> Dict[str, object]:
+        lookups = self.counters["memory_hits"] + self.counters["mongo_hits"] + self.counters["misses"]
+        hits = lookups - self.counters["misses"]
+        return {
+            **self.counters,
+            "size": len(self._entries),
+            "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+            "mongo_tier": self.use_mongo
+        }
+
+
+gemini_response_cache: Optional[ResponseCache] = ResponseCache(
+    maxsize=settings.GEMINI_CACHE_MAX_ENTRIES,
+    ttl=settings.GEMINI_CACHE_TTL_SECONDS,
+    use_mongo=settings.GEMINI_CACHE_MONGO
+) if settings.GEMINI_CACHE_ENABLED else None
@@ -0,0 +1,131 @@
+import secrets
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from database import stream_sessions_collection
+from utils.config import settings
+
+
+class InMemoryStreamStore:
+    """
+    Per-process session store bounded by TTL and entry count.
+
+    Only suitable for a single worker: a POST and its follow-up GET must land on the same process.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._sessions: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.evicted = 0
+
+    def _evict_expired(self, now: float) -> None:
+        # Sessions are stored in creation order with a uniform TTL, so expired ones are at the front
+        while self._sessions:
+            stream_id, (expires_at, _) = next(iter(self._sessions.items()))
+            if expires_at > now:
+                break
+            del self._sessions[stream_id]
+            self.evicted += 1
+
+    async def put(self, stream_id: str, data: Dict[str, Any], ttl: float) -> None:
+        now = time.monotonic()
+        self._evict_expired(now)
+        self._sessions[stream_id] = (now + ttl, data)
+        while len(self._sessions) > self.max_size:
+            self._sessions.popitem(last=False)
+            self.evicted += 1
+
+    async def get(self, stream_id: str) -> Optional[Dict[str, Any]]:
+        session = self._sessions.get(stream_id)
+        if session is None:
+            return None
+        if session[0] <= time.monotonic():
+            del self._sessions[stream_id]
+            self.evicted += 1
+            return None
+        return session[1]
+
+    async def delete(self, stream_id: str) -> None:
+        self._sessions.pop(stream_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", "size": len(self._sessions), "evicted": self.evicted}
+
+
+class MongoStreamStore:
+    """
+    Session store shared by every worker through the `stream_sessions` collection.
+
+    Expiry is enforced by a TTL index on `expires_at` (see init_db); reads also check it,
+    since MongoDB only removes expired documents periodically.
+    """
+
+    async def put(self, stream_id: str, data: Dict[str, Any], ttl: float) -> None:
+        now = datetime.utcnow()
+        await stream_sessions_collection.insert_one({
+            "_id": stream_id,
+            "data": data,
+            "created_at": now,
+            "expires_at": now + timedelta(seconds=ttl)
+        })
+
+    async def get(self, stream_id: str) -> Optional[Dict[str, Any]]:
+        session = await stream_sessions_collection.find_one(
+            {"_id": stream_id, "expires_at": {"$gt": datetime.utcnow()}},
+            {"data": 1}
+        )
+        return session["data"] if session else None
+
+    async def delete(self, stream_id: str) -> None:
+        await stream_sessions_collection.delete_one({"_id": stream_id})
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "mongo"}
+
+
+class StreamRegistry:
+    """
+    Holds the request payload between a stream's POST and the GET that consumes it.
+
+    IDs are random and unguessable, and every session expires after `ttl` seconds
+    whether or not a client ever connects to it.
+    """
+
+    def __init__(self, store, ttl: float):
+        self.store = store
+        self.ttl = ttl
+        self.created = 0
+        self.completed = 0
+
+    async def create(self, data: Dict[str, Any]) -> str:
+        stream_id = secrets.token_urlsafe(16)
+        await self.store.put(stream_id, data, self.ttl)
+        self.created += 1
+        return stream_id
+
+    async def get(self, stream_id: str) -> Optional[Dict[str, Any]]:
+        return await self.store.get(stream_id)
+
+    async def discard(self, stream_id: str) -> None:
+        await self.store.delete(stream_id)
+        self.completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.store.stats(), "created": self.created, "completed": self.completed}
+
+
+def build_stream_registry() -> StreamRegistry:
+    """Create the registry for the backend selected by STREAM_REGISTRY_BACKEND ("memory" or "mongo")."""
+    backend = settings.STREAM_REGISTRY_BACKEND.lower()
+    if backend == "mongo":
+        store = MongoStreamStore()
+    elif backend == "memory":
+        store = InMemoryStreamStore(settings.STREAM_REGISTRY_MAX_SIZE)
+    else:
+        raise ValueError(f"Unknown STREAM_REGISTRY_BACKEND: {settings.STREAM_REGISTRY_BACKEND}")
+    return StreamRegistry(store, settings.STREAM_SESSION_TTL_SECONDS)
+
+
+stream_registry = build_stream_registry()
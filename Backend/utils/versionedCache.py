@@ -0,0 +1,102 @@
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from pymongo import ReturnDocument
+
+from database import cache_versions_collection
+from utils.config import settings
+
+# Latest version seen per namespace in this process, with the monotonic time it was polled
+_known_versions: Dict[str, Tuple[int, float]] = {}
+
+
+async def get_version(namespace: str, max_age: Optional[float] = None) -> int:
+    """
+    Return the shared version counter for a namespace.
+
+    The counter lives in `cache_versions` so every worker sees bumps made by other
+    processes (e.g. scripts/sync_questions.py). Reads are throttled to one point
+    lookup per `max_age` seconds per namespace.
+    """
+    if max_age is None:
+        max_age = settings.CACHE_VERSION_POLL_SECONDS
+    now = time.monotonic()
+    known = _known_versions.get(namespace)
+    if known is not None and now - known[1] < max_age:
+        return known[0]
+
+    doc = await cache_versions_collection.find_one({"_id": namespace}, {"version": 1})
+    version = doc.get("version", 0) if doc else 0
+    _known_versions[namespace] = (version, now)
+    return version
+
+
+async def bump_version(namespace: str) -> int:
+    """
+    Increment the shared version counter so every cache keyed on it is invalidated.
+
+    Returns:
+        The new version number.
+    """
+    doc = await cache_versions_collection.find_one_and_update(
+        {"_id": namespace},
+        {"$inc": {"version": 1}, "$set": {"updated_at": datetime.utcnow()}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    version = doc["version"]
+    _known_versions[namespace] = (version, time.monotonic())
+    return version
+
+
+class VersionedCache:
+    """
+    Bounded in-process LRU cache whose entries are tagged with shared version counters.
+
+    An entry is only served while every namespace it depends on still has the version
+    it was loaded under, so a `bump_version` from any process invalidates it.
+    """
+
+    def __init__(self, namespaces: Tuple[str, ...], maxsize: int = 1024):
+        self.namespaces = namespaces
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[Tuple[int, ...], Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def current_versions(self) -> Tuple[int, ...]:
+        return tuple([await get_version(namespace) for namespace in self.namespaces])
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for `key`, calling `loader` on a miss or stale entry.
+
+        The versions are captured before loading so a bump that races with the load
+        leaves the entry stale rather than tagging old data with the new version.
+        """
+        versions = await self.current_versions()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == versions:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        value = await loader()
+        self._entries[key] = (versions, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or every entry when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}